@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Load/save time and on-disk size of an assessment per file format and JSON backend.
+
+Usage (after `pip install -e .`): python benchmarks/bench_codec.py [controls per framework]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cyber_compliance_cli import codec
+
+NAMES = ["portfolio.json", "portfolio.min.json", "portfolio.json.gz", "portfolio.json.zst"]
+
+
+def _portfolio(n: int) -> dict:
+    rng = random.Random(0)
+    statuses = ("implemented", "partial", "missing")
+    return {
+        "organization": "bench",
+        "frameworks": {
+            fw: {
+                "statuses": {f"{fw.upper()}-{i:05d} Control objective {i}": rng.choice(statuses) for i in range(n)},
+                "notes": {f"{fw.upper()}-{i:05d}": "reviewed in Q3" for i in range(0, n, 10)},
+            }
+            for fw in ("nist_csf", "iso27001", "soc2", "cis_v8")
+        },
+    }
+
+
+def _best(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 25_000
+    doc = _portfolio(n)
+    backends = ["json"]
+    try:
+        import orjson  # noqa: F401
+
+        backends.insert(0, "orjson")
+    except ImportError:
+        print("orjson not installed; stdlib json only")
+
+    print(f"{4 * n} controls")
+    print(f"{'file':<22}{'backend':<9}{'save ms':>10}{'load ms':>10}{'size KiB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in NAMES:
+            path = Path(tmp) / name
+            for backend in backends:
+                codec.set_json_backend(backend)
+                try:
+                    save = _best(lambda: codec.save_document(path, doc))
+                except RuntimeError as exc:
+                    print(f"{name:<22}skipped: {exc}")
+                    break
+                load = _best(lambda: codec.load_document(path))
+                size = path.stat().st_size / 1024
+                print(f"{name:<22}{backend:<9}{save * 1000:>10.1f}{load * 1000:>10.1f}{size:>11.0f}")
+    codec.set_json_backend(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Size and load time of the columnar export versus the equivalent CSV.
+
+Usage (after `pip install -e .`): python benchmarks/bench_columnar.py [assessments]
+"""
+from __future__ import annotations
+
+import csv
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cyber_compliance_cli.columnar import COLUMNS, build_columns, read_ccol, write_columnar
+
+FRAMEWORKS = ("nist_csf", "iso27001", "soc2", "cis_v8")
+
+
+def _units(n: int):
+    rng = random.Random(0)
+    catalog = {fw: [f"{fw.upper()}-{i:03d} Control objective {i}" for i in range(100)] for fw in FRAMEWORKS}
+    for unit in range(n):
+        yield f"unit-{unit:04d}", {
+            "frameworks": [
+                {"framework": fw, "risk_score": round(rng.uniform(0, 100), 2), "risk_level": "high"} for fw in FRAMEWORKS
+            ],
+            "framework_details": {
+                fw: [{"control": c, "status": rng.choice(("implemented", "partial", "missing"))} for c in controls]
+                for fw, controls in catalog.items()
+            },
+        }
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    columns = build_columns(_units(n))
+    rows = len(columns["risk_score"])
+    print(f"{n} assessments, {rows} rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "a.csv"
+        with csv_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            decoded = [columns[name].decode() if name != "risk_score" else list(columns[name]) for name in COLUMNS]
+            writer.writerows(zip(*decoded))
+        ccol_path = write_columnar(Path(tmp) / "a.ccol", columns, "ccol")
+
+        def read_csv():
+            with csv_path.open(newline="", encoding="utf-8") as f:
+                return list(csv.reader(f))
+
+        _, csv_ms = _timed(read_csv)
+        _, ccol_ms = _timed(lambda: read_ccol(ccol_path))
+        print(f"{'csv':<6}{csv_path.stat().st_size / 1024:>10.0f} KiB {csv_ms:>9.1f} ms load")
+        print(f"{'ccol':<6}{ccol_path.stat().st_size / 1024:>10.0f} KiB {ccol_ms:>9.1f} ms load")
+
+
+if __name__ == "__main__":
+    main()
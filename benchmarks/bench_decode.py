@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Decode time and peak memory of large MCP tool results: model_dump + json vs _decode_result.
+
+Usage (after `pip install -e .`): python benchmarks/bench_decode.py [megabytes]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+
+from mcp.types import CallToolResult, TextContent
+
+from cyber_compliance_cli.mcp_client import _decode_result
+
+CHUNK = 64 * 1024
+
+
+def _payload(megabytes: float) -> dict:
+    row = {"id": "CC6.1", "title": "Logical access security", "text": "The entity implements controls " * 8}
+    n = int(megabytes * 1024 * 1024 / len(json.dumps(row)))
+    return {"ok": True, "framework": "soc2", "requirements": [dict(row, id=f"CC{i}") for i in range(n)]}
+
+
+def _old(result: CallToolResult) -> dict:
+    dumped = result.model_dump()
+    return json.loads(dumped["content"][0]["text"])
+
+
+def _measure(fn, result, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(result)
+        best = min(best, time.perf_counter() - started)
+    # Peak memory in a separate run; tracing slows decoding down.
+    tracemalloc.start()
+    fn(result)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 2**20
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    payload = _payload(megabytes)
+    text = json.dumps(payload)
+    cases = {
+        "one block": CallToolResult(content=[TextContent(type="text", text=text)]),
+        "64 KiB blocks": CallToolResult(
+            content=[TextContent(type="text", text=text[i : i + CHUNK]) for i in range(0, len(text), CHUNK)]
+        ),
+        "structured": CallToolResult(content=[TextContent(type="text", text=text)], structuredContent=payload),
+    }
+    print(f"{len(text) / 2**20:.1f} MiB response")
+    print(f"{'result':<15}{'decoder':<10}{'ms':>9}{'peak MiB':>10}")
+    ms, peak = _measure(_old, cases["one block"])
+    print(f"{'one block':<15}{'old':<10}{ms:>9.1f}{peak:>10.1f}")
+    for name, result in cases.items():
+        ms, peak = _measure(lambda r: _decode_result(r, "get_requirements"), result)
+        print(f"{name:<15}{'new':<10}{ms:>9.1f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""`cybersec query` cost: full scan of every file vs cold, on-disk and in-memory indexes.
+
+Usage (after `pip install -e .`): python benchmarks/bench_query.py [files] [controls per framework]
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cyber_compliance_cli import query
+from cyber_compliance_cli.mcp_client import load_assessment, save_assessment
+
+FRAMEWORKS = ("nist_csf", "iso27001", "soc2", "cis_v8")
+PREFIXES = ("GV", "ID", "PR", "DE", "RS", "RC")
+QUERIES = ("control:PR.AA-00001 status:missing", "domain:detect status:partial", "fw:nist_csf pr.*", "unit:unit-00*")
+
+
+def _scan(paths, domain: str) -> int:
+    # Without an index every query re-parses each document and resolves every domain.
+    return sum(row[4] == domain for path in paths for row in query._rows(load_assessment(path)))
+
+
+def _timed(label: str, fn) -> None:
+    started = time.perf_counter()
+    fn()
+    print(f"{label:<34}{(time.perf_counter() - started) * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["CYBERSEC_CACHE_DIR"] = str(Path(tmp) / "cache")
+        paths = []
+        for i in range(files):
+            statuses = {
+                fw: {
+                    "statuses": {
+                        f"{rng.choice(PREFIXES)}.AA-{c:05d} Objective": rng.choice(("implemented", "partial", "missing"))
+                        for c in range(n)
+                    }
+                }
+                for fw in FRAMEWORKS
+            }
+            path = Path(tmp) / f"unit-{i:03d}.json"
+            save_assessment(path, {"frameworks": statuses})
+            paths.append(str(path))
+        print(f"{files} files x {n * len(FRAMEWORKS)} controls")
+
+        _timed("full scan (parse + resolve domains)", lambda: _scan(paths, "Detect"))
+        _timed("index build (cold)", lambda: query.QueryIndex(paths))
+        query._LOADED.clear()
+        _timed("index load (on-disk cache)", lambda: query.QueryIndex(paths))
+        index = query.QueryIndex(paths)
+        print(f"{'index load (in memory)':<34}{'-':>9}    sources {index.sources}")
+        for text in QUERIES:
+            _timed(f"query {text}", lambda: index.search(text))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Compare batch portfolio scoring with looping calculate_risk_score-style scoring.
+
+Usage (after `pip install -e .`): python benchmarks/bench_scoring.py [rows]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from cyber_compliance_cli.scoring import score_controls, score_counts_batch
+
+
+def _timed(label: str, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = random.Random(0)
+    counts = [(rng.randint(0, 60), rng.randint(0, 60), rng.randint(0, 60)) for _ in range(n)]
+    controls = [
+        [{"status": "implemented"}] * i + [{"status": "partial"}] * p + [{"status": "missing"}] * m
+        for i, p, m in counts
+    ]
+    print(f"{n} (unit, framework) rows")
+    loop = _timed("loop score_controls", lambda: [score_controls(rows) for rows in controls])
+    _timed("batch, pure Python", lambda: score_counts_batch(counts, use_numpy=False))
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("numpy not installed; skipping vectorized run")
+        return
+    vec = _timed("batch, numpy", lambda: score_counts_batch(counts, use_numpy=True))
+    print(f"speedup vs loop: {loop / vec:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Keypress-to-render latency of the editor and dashboard on synthetic catalogs (headless pilot).
+
+Each scripted key is timed from the press until the frame showing its effect has been
+refreshed. Summaries come from a local stand-in for summarize_all so only the TUI is measured.
+
+Usage (after `pip install -e .`): python benchmarks/bench_tui.py [controls per framework ...]
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from textual import events
+
+from cyber_compliance_cli import editor
+from cyber_compliance_cli.mcp_client import SUPPORTED_FRAMEWORKS, load_assessment, save_assessment
+from cyber_compliance_cli.perf import percentile
+from cyber_compliance_cli.tui import CyberComplianceApp
+
+STATUSES = ("implemented", "partial", "missing")
+SIZE = (120, 40)
+
+
+def _controls(n: int) -> Dict[str, List[str]]:
+    return {fw: [f"{fw.upper()}-{i:05d} Control objective {i}" for i in range(n)] for fw in SUPPORTED_FRAMEWORKS}
+
+
+def _summary(catalog: Dict[str, List[str]], assessment: dict) -> dict:
+    frameworks, details = [], {}
+    for fw, controls in catalog.items():
+        statuses = assessment.get("frameworks", {}).get(fw, {}).get("statuses", {})
+        rows = [{"control": c, "status": statuses.get(c, "missing")} for c in controls]
+        missing = sum(row["status"] == "missing" for row in rows)
+        frameworks.append(
+            {
+                "framework": fw,
+                "risk_score": round(100.0 * missing / max(1, len(rows)), 1),
+                "risk_level": "high",
+                "missing": missing,
+                "partial": 0,
+                "implemented": len(rows) - missing,
+                "controls_total": len(rows),
+                "actions": [f"Close {c}" for c in controls[:3]],
+                "priority_gaps": [],
+                "controls": rows,
+            }
+        )
+        details[fw] = rows
+    return {"frameworks": frameworks, "framework_details": details, "priority_actions": [], "priority_gaps": []}
+
+
+async def _timed(pilot, key: str) -> float:
+    """Post one key the way the driver does and wait for the refresh that follows it.
+
+    pilot.press() also waits for the process to look idle, which would add its polling
+    interval to every sample.
+    """
+    app = pilot.app
+    painted = asyncio.get_running_loop().create_future()
+
+    def after_refresh() -> None:
+        # A second hop lets keys forwarded to a focused widget finish their own refresh.
+        app.call_after_refresh(lambda: painted.done() or painted.set_result(time.perf_counter()))
+
+    event = events.Key(key, " " if key == "space" else key if len(key) == 1 else None)
+    event.set_sender(app)
+    started = time.perf_counter()
+    app.post_message(event)
+    app.call_after_refresh(after_refresh)
+    return (await painted - started) * 1000
+
+
+async def _bench_editor(path: Path, catalog: Dict[str, List[str]]) -> Dict[str, List[float]]:
+    editor.summarize_all = lambda p, **kwargs: _summary(catalog, load_assessment(p))
+    app = editor.AssessmentEditorApp(str(path))
+    out: Dict[str, List[float]] = {"filter": [], "arrows": [], "toggle": [], "save": []}
+    async with app.run_test(size=SIZE) as pilot:
+        app.set_focus(app.query_one("#filter"))
+        for key in "objective 1":
+            out["filter"].append(await _timed(pilot, "space" if key == " " else key))
+        app.query_one("#filter").value = ""
+        await pilot.pause()
+        app.set_focus(None)
+        for key in ["down"] * 30 + ["up"] * 10:
+            out["arrows"].append(await _timed(pilot, key))
+        for key in "123" * 10:
+            out["toggle"].append(await _timed(pilot, key))
+        for _ in range(3):
+            out["save"].append(await _timed(pilot, "s"))
+            await app.workers.wait_for_complete()
+    return out
+
+
+async def _bench_dashboard(catalog: Dict[str, List[str]]) -> Dict[str, List[float]]:
+    data = _summary(catalog, {"frameworks": {}})
+
+    def loader(on_summary):
+        for row in data["frameworks"]:
+            on_summary(row)
+        return data
+
+    app = CyberComplianceApp(loader=loader, frameworks=list(SUPPORTED_FRAMEWORKS))
+    out: Dict[str, List[float]] = {"reload": []}
+    async with app.run_test(size=SIZE) as pilot:
+        await app.workers.wait_for_complete()
+        for _ in range(10):
+            out["reload"].append(await _timed(pilot, "r"))
+            await app.workers.wait_for_complete()
+    return out
+
+
+def _row(app: str, size: int, action: str, samples: List[float]) -> str:
+    ordered = sorted(samples)
+    cells = [percentile(ordered, pct) for pct in (50, 95, 99)] + [ordered[-1]]
+    return f"{app:<10}{size:>8}  {action:<8}{len(samples):>4}" + "".join(f"{v:>9.1f}" for v in cells)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000]
+    print(f"{'app':<10}{'controls':>8}  {'action':<8}{'n':>4}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    rng = random.Random(0)
+    for n in sizes:
+        catalog = _controls(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "assessment.json"
+            save_assessment(
+                path,
+                {"frameworks": {fw: {"statuses": {c: rng.choice(STATUSES) for c in cs}} for fw, cs in catalog.items()}},
+            )
+            for action, samples in asyncio.run(_bench_editor(path, catalog)).items():
+                print(_row("editor", n * len(catalog), action, samples))
+        for action, samples in asyncio.run(_bench_dashboard(catalog)).items():
+            print(_row("dashboard", n * len(catalog), action, samples))
+
+
+if __name__ == "__main__":
+    main()
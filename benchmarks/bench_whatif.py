@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""What-if throughput: random scenarios scored per second, and greedy search time.
+
+Usage (after `pip install -e .`): python benchmarks/bench_whatif.py [controls per framework]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from cyber_compliance_cli.whatif import WhatIf
+
+FRAMEWORKS = ("nist_csf", "iso27001", "soc2", "cis_v8")
+
+
+def _model(n: int) -> WhatIf:
+    rng = random.Random(0)
+    statuses = ("implemented", "partial", "missing")
+    details = {
+        fw: [{"control": f"{fw.upper()}-{i:05d} Objective", "status": rng.choice(statuses)} for i in range(n)]
+        for fw in FRAMEWORKS
+    }
+    index = {}
+    # About two crosswalk edges per control, a third of them partial coverage.
+    for _ in range(n * len(FRAMEWORKS)):
+        fa, fb = rng.sample(FRAMEWORKS, 2)
+        a, b = (fa, f"{fa.upper()}-{rng.randrange(n):05d}"), (fb, f"{fb.upper()}-{rng.randrange(n):05d}")
+        coverage = rng.choice((1.0, 1.0, 0.5))
+        index.setdefault(a, []).append((*b, coverage))
+        index.setdefault(b, []).append((*a, coverage))
+    return WhatIf({"framework_details": details}, index=index)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    started = time.perf_counter()
+    model = _model(n)
+    print(f"{n * len(FRAMEWORKS)} controls, baseline built in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    rng = random.Random(1)
+    pool = model.candidates()
+    scenarios = [[(key, "implemented") for key in rng.sample(pool, 15)] for _ in range(10_000)]
+    started = time.perf_counter()
+    for scenario in scenarios:
+        model.evaluate(scenario)
+    elapsed = time.perf_counter() - started
+    rate = len(scenarios) / elapsed
+    print(f"evaluate: {len(scenarios)} scenarios of 15 changes in {elapsed * 1000:.0f} ms ({rate:,.0f}/s)")
+
+    for budget in (15, 100):
+        out = model.search(budget)
+        print(
+            f"search {budget:>3}: {out['method']}, {out['scenarios']} candidate scores "
+            f"in {out['seconds'] * 1000:.1f} ms, reduction {out['reduction']:.2f} points"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@ from typing import Any, Dict, List
 
 ALLOWED_FRAMEWORKS = {"nist_csf", "iso27001", "soc2", "cis_v8"}
 ALLOWED_STATUS = {"implemented", "partial", "missing"}
+_HEX = set("0123456789abcdef")
+
+
+def _is_sha256(value: Any) -> bool:
+    return isinstance(value, str) and len(value) == 64 and set(value) <= _HEX
 
 
 def validate_assessment(data: Dict[str, Any]) -> List[str]:
@@ -27,6 +32,16 @@ def validate_assessment(data: Dict[str, Any]) -> List[str]:
             errors.append(f"framework entry for {fw} must be an object")
             continue
 
+        evidence = fw_data.get("evidence", {})
+        if not isinstance(evidence, dict):
+            errors.append(f"{fw}.evidence must be an object")
+        else:
+            for control, refs in evidence.items():
+                if not isinstance(refs, list) or not all(
+                    isinstance(ref, dict) and _is_sha256(ref.get("sha256")) for ref in refs
+                ):
+                    errors.append(f"{fw}.evidence[{control}] must be a list of {{sha256, name, ...}} references")
+
         statuses = fw_data.get("statuses", {})
         if not isinstance(statuses, dict):
             errors.append(f"{fw}.statuses must be an object")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.machinery
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SERVER_PACKAGE = "cyber_compliance_mcp"
+# A cyber-compliance-mcp checkout next to this repository, used when the package is not installed.
+SIBLING_CHECKOUT = Path(__file__).resolve().parents[2] / "cyber-compliance-mcp"
+
+# package -> (stat signature of its sources, digest); re-hashed only when a file changes.
+_SOURCE_DIGESTS: Dict[str, Tuple[List[Tuple[str, int, int]], str]] = {}
+
+
+def cache_dir() -> Path:
+    """Return the on-disk cache directory (override with CYBERSEC_CACHE_DIR)."""
+    override = os.environ.get("CYBERSEC_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "cyber-compliance-cli"
+
+
+def _source_digest(package: str) -> Optional[str]:
+    """SHA-256 over a package's .py sources, located (not imported) on sys.path or the sibling checkout."""
+    try:
+        spec = importlib.machinery.PathFinder.find_spec(package, [*sys.path, str(SIBLING_CHECKOUT)])
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if spec.submodule_search_locations:
+        files = sorted(f for root in spec.submodule_search_locations for f in Path(root).rglob("*.py"))
+    elif spec.origin and spec.origin.endswith(".py"):
+        files = [Path(spec.origin)]
+    else:
+        return None
+    try:
+        signature = []
+        for f in files:
+            st = f.stat()
+            signature.append((str(f), st.st_size, st.st_mtime_ns))
+        cached = _SOURCE_DIGESTS.get(package)
+        if cached and cached[0] == signature:
+            return cached[1]
+        digest = hashlib.sha256()
+        for f in files:
+            digest.update(f.name.encode("utf-8") + b"\0" + f.read_bytes())
+    except OSError:
+        return None
+    _SOURCE_DIGESTS[package] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def server_stamp(transport: str, server_command: str) -> Optional[str]:
+    """What identifies the MCP server build, or None when it cannot be told.
+
+    stdio uses the command's size and mtime; other transports the installed
+    cyber-compliance-mcp version, else (python and memory) a digest of the server
+    package's sources, so an uninstalled checkout still changes the stamp when edited.
+    """
+    if transport == "stdio":
+        resolved = shutil.which(server_command) or server_command
+        try:
+            st = Path(resolved).stat()
+        except OSError:
+            return None
+        return f"stdio|{resolved}|{st.st_size}:{st.st_mtime_ns}"
+    try:
+        from importlib.metadata import version
+
+        return f"{transport}|{version('cyber-compliance-mcp')}"
+    except Exception:
+        pass
+    if transport in ("python", "memory"):
+        module = server_command.partition(":")[0] if transport == "memory" and ":" in server_command else SERVER_PACKAGE
+        digest = _source_digest(module.split(".")[0])
+        if digest is not None:
+            return f"{transport}|source:{digest}"
+    return None
+
+
+def server_fingerprint(transport: str, server_command: str) -> str:
+    """Identify the MCP server build so cached responses are dropped when it changes."""
+    raw = server_stamp(transport, server_command) or f"{transport}|{server_command}|unknown"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_file(name: str) -> Path:
+    return cache_dir() / f"{name}.json"
+
+
+def read_cache(name: str, key: str) -> Any:
+    path = _cache_file(name)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data.get(key)
+
+
+def write_cache(name: str, key: str, value: Any) -> None:
+    path = _cache_file(name)
+    try:
+        data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[key] = value
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        # Caching is best-effort; a read-only home must not break the CLI.
+        pass
@@ -0,0 +1,140 @@
+"""Thin `cybersec` entry point that forwards to a running `cybersec serve` daemon.
+
+This module deliberately imports only the standard library so forwarded commands
+skip the typer/rich/textual/MCP import cost. Anything the daemon cannot handle
+runs in-process through `cyber_compliance_cli.main`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+FORWARDED_COMMANDS = {
+    "checklist",
+    "controls",
+    "diff",
+    "export-bundle",
+    "export-columnar",
+    "export-csv",
+    "plan",
+    "query",
+    "report",
+    "score",
+    "validate-assessment",
+    "verify-evidence",
+    "whatif",
+}
+
+
+# Client environment sent with each request. CYBERSEC_* variables are applied for the
+# request; the daemon declines (the client runs locally) when a pinned one differs,
+# since its warm MCP server processes and imports were set up with its own values.
+ENV_PREFIX = "CYBERSEC_"
+PINNED_ENV = ("PATH", "PYTHONPATH", "XDG_CACHE_HOME")
+
+
+def request_env() -> Dict[str, Optional[str]]:
+    env: Dict[str, Optional[str]] = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+    env.update({key: os.environ.get(key) for key in PINNED_ENV})
+    return env
+
+
+def socket_path() -> Path:
+    override = os.environ.get("CYBERSEC_SOCKET")
+    if override:
+        return Path(override)
+    cache_override = os.environ.get("CYBERSEC_CACHE_DIR")
+    if cache_override:
+        return Path(cache_override) / "daemon.sock"
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "cyber-compliance-cli" / "daemon.sock"
+
+
+def send_request(request: Dict[str, Any], path: Optional[Path] = None, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Send one JSON request to the daemon; return None when no daemon is listening."""
+    target = path or socket_path()
+    if not target.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(0.5)
+        sock.connect(str(target))
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        return None
+    return response if isinstance(response, dict) else None
+
+
+# Global options that take no value; every other global option takes one.
+_GLOBAL_FLAGS = {"--hedge", "--latency-report"}
+
+
+def command_of(argv: List[str]) -> Optional[str]:
+    """Return the subcommand name, skipping global options placed before it."""
+    idx = 0
+    while idx < len(argv) and argv[idx].startswith("-"):
+        option = argv[idx]
+        # --name=value and -Ovalue carry their value in the same argument.
+        inline = "=" in option or (not option.startswith("--") and len(option) > 2)
+        idx += 1 if option in _GLOBAL_FLAGS or inline else 2
+    return argv[idx] if idx < len(argv) else None
+
+
+def forward(argv: List[str]) -> Optional[Dict[str, Any]]:
+    if command_of(argv) not in FORWARDED_COMMANDS:
+        return None
+    if os.environ.get("CYBERSEC_NO_DAEMON") == "1" or "--help" in argv:
+        return None
+    if "--watch" in argv:
+        # Long-running; keep it out of the daemon's request loop.
+        return None
+    is_tty = sys.stdout.isatty()
+    request = {
+        "op": "run",
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": request_env(),
+        "color": is_tty and "NO_COLOR" not in os.environ,
+        "width": shutil.get_terminal_size().columns if is_tty else 80,
+    }
+    response = send_request(request)
+    if not response or not response.get("handled"):
+        return None
+    return response
+
+
+def main() -> None:
+    response = forward(sys.argv[1:])
+    if response is not None:
+        sys.stdout.write(response.get("stdout", ""))
+        sys.stdout.flush()
+        sys.stderr.write(response.get("stderr", ""))
+        sys.stderr.flush()
+        sys.exit(int(response.get("exit_code", 0)))
+
+    from .main import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Read and write assessment documents; the file name picks compression and layout.
+
+- ``*.json``: pretty (indent 2)
+- ``*.min.json``: compact
+- ``*.json.gz`` / ``*.json.zst``: compact, compressed as a stream
+
+orjson is used when installed, with the stdlib json module as fallback. Compression is
+always streamed; encoding streams only with the stdlib backend (orjson returns one buffer),
+and decoding needs the whole decompressed document because neither backend parses
+incrementally.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional
+
+JSON_BACKENDS = ("orjson", "json")
+COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+CHUNK_SIZE = 1 << 20
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+_state = {"backend": None}
+
+
+def json_backend() -> str:
+    """Name of the JSON backend in use (CYBERSEC_JSON_BACKEND=json forces the stdlib)."""
+    if _state["backend"] is None:
+        wanted = os.environ.get("CYBERSEC_JSON_BACKEND", "orjson")
+        backend = "json"
+        if wanted == "orjson":
+            try:
+                import orjson  # noqa: F401
+
+                backend = "orjson"
+            except ImportError:
+                pass
+        _state["backend"] = backend
+    return _state["backend"]
+
+
+def set_json_backend(name: Optional[str]) -> None:
+    """Force a backend (None re-detects); used by tests and benchmarks."""
+    if name is not None and name not in JSON_BACKENDS:
+        raise ValueError(f"JSON backend must be one of: {', '.join(JSON_BACKENDS)}")
+    _state["backend"] = name
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    if json_backend() == "orjson":
+        import orjson
+
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib handles them.
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def iter_dumps(obj: Any, pretty: bool = True) -> Iterator[bytes]:
+    """Encode obj as about CHUNK_SIZE pieces; the stdlib backend never holds the whole document."""
+    if json_backend() == "orjson":
+        import orjson
+
+        try:
+            yield orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+            return
+        except TypeError:
+            pass
+    if pretty:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    pending, size = [], 0
+    for piece in encoder.iterencode(obj):
+        pending.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            yield "".join(pending).encode("utf-8")
+            pending, size = [], 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if json_backend() == "orjson":
+        import orjson
+
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def compression_of(path: str | Path) -> Optional[str]:
+    return COMPRESSIONS.get(Path(path).suffix.lower())
+
+
+def is_pretty(path: str | Path) -> bool:
+    name = Path(path).name.lower()
+    return compression_of(path) is None and not name.endswith(".min.json")
+
+
+def document_stem(path: str | Path) -> str:
+    """File name without compression, .min and .json suffixes ("q3.min.json.gz" -> "q3")."""
+    name = Path(path).name
+    for suffix in (*COMPRESSIONS, ".json", ".min"):
+        if name.lower().endswith(suffix):
+            name = name[: -len(suffix)]
+    return name
+
+
+def _zstd() -> Any:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError as exc:
+        raise RuntimeError("Reading or writing .zst files requires optional dependency: zstandard") from exc
+
+
+def open_read(path: str | Path) -> BinaryIO:
+    """Binary stream of the decompressed file contents."""
+    kind = compression_of(path)
+    if kind == "gzip":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if kind == "zstd":
+        zstd = _zstd()
+        if hasattr(zstd, "ZstdDecompressor") and hasattr(zstd.ZstdDecompressor, "stream_reader"):
+            return zstd.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return zstd.open(path, "rb")
+    return open(path, "rb")
+
+
+def open_write(path: str | Path) -> BinaryIO:
+    """Binary stream that compresses (by extension) into path."""
+    kind = compression_of(path)
+    if kind == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)  # type: ignore[return-value]
+    if kind == "zstd":
+        zstd = _zstd()
+        if hasattr(zstd, "ZstdCompressor") and hasattr(zstd.ZstdCompressor, "stream_writer"):
+            return zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"), closefd=True)
+        return zstd.open(path, "wb", level=ZSTD_LEVEL)
+    return open(path, "wb")
+
+
+def load_document(path: str | Path) -> Any:
+    """Decompress as a stream, then parse the whole document (the JSON backends are not incremental)."""
+    with open_read(path) as f:
+        return loads(f.read())
+
+
+def save_document(path: str | Path, obj: Any, pretty: Optional[bool] = None) -> None:
+    """Encode and write obj atomically (temp file + rename), compressing as a stream.
+
+    With the stdlib backend the encoder feeds the compressor piece by piece; orjson
+    encodes the whole document first, which is then written in CHUNK_SIZE slices.
+    """
+    p = Path(path)
+    pretty = is_pretty(p) if pretty is None else pretty
+    # Keep the real suffixes on the temp file so it gets the same compression.
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.tmp{''.join(p.suffixes[-1:])}")
+    try:
+        with open_write(tmp) as f:
+            for data in iter_dumps(obj, pretty=pretty):
+                view = memoryview(data)
+                for offset in range(0, len(view), CHUNK_SIZE):
+                    f.write(view[offset : offset + CHUNK_SIZE])
+        os.replace(tmp, p)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
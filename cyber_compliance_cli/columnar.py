@@ -0,0 +1,199 @@
+"""Columnar export of per-control statuses, domains and per-framework risk.
+
+Parquet or Arrow IPC when pyarrow is installed, otherwise a built-in format (.ccol):
+
+    b"CCOL1\\n" | uint32 LE header length | header JSON | column buffers (8-byte aligned)
+
+The header lists rows and, per column, its type ("dictionary" with the value list and
+index typecode B/H/I, or "float64") plus the byte offset and length of its buffer.
+Buffers are little-endian, so readers can map them straight into numpy/Arrow arrays.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .mapping import control_id
+from .prioritization import control_domain
+
+MAGIC = b"CCOL1\n"
+FORMATS = ("parquet", "arrow", "ccol")
+SUFFIXES = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ccol": "ccol"}
+DICTIONARY_COLUMNS = ("assessment", "framework", "control", "control_id", "domain", "status", "risk_level")
+COLUMNS = ("assessment", "framework", "control", "control_id", "domain", "status", "risk_score", "risk_level")
+_ALIGN = 8
+
+
+class DictionaryColumn:
+    """Distinct values in first-seen order plus one integer code per row."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.codes = array("I")
+
+    def append(self, value: str) -> None:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def typecode(self) -> str:
+        if len(self.values) <= 1 << 8:
+            return "B"
+        if len(self.values) <= 1 << 16:
+            return "H"
+        return "I"
+
+    def decode(self) -> List[str]:
+        return [self.values[code] for code in self.codes]
+
+
+def build_columns(units: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """One row per (assessment, framework, checklist control) from summarize_all outputs."""
+    columns: Dict[str, Any] = {name: DictionaryColumn() for name in DICTIONARY_COLUMNS}
+    columns["risk_score"] = array("d")
+    for unit, data in units:
+        risk = {row["framework"]: row for row in data.get("frameworks", [])}
+        for framework, rows in data.get("framework_details", {}).items():
+            summary = risk.get(framework, {})
+            score = float(summary.get("risk_score", 100.0))
+            level = str(summary.get("risk_level", "critical"))
+            for row in rows:
+                control = row["control"]
+                columns["assessment"].append(unit)
+                columns["framework"].append(framework)
+                columns["control"].append(control)
+                columns["control_id"].append(control_id(control))
+                columns["domain"].append(control_domain(framework, control)[0])
+                columns["status"].append(row["status"])
+                columns["risk_score"].append(score)
+                columns["risk_level"].append(level)
+    return columns
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+
+        return pyarrow
+    except ImportError:
+        return None
+
+
+def default_format() -> str:
+    return "parquet" if _pyarrow() is not None else "ccol"
+
+
+def format_of(path: str | Path) -> Optional[str]:
+    return SUFFIXES.get(Path(path).suffix.lower())
+
+
+def _le(buf: array) -> bytes:
+    if sys.byteorder == "big":
+        buf = array(buf.typecode, buf)
+        buf.byteswap()
+    return buf.tobytes()
+
+
+def _write_ccol(path: Path, columns: Dict[str, Any]) -> None:
+    rows = len(columns["risk_score"])
+    meta: List[Dict[str, Any]] = []
+    buffers: List[bytes] = []
+    offset = 0
+    for name in COLUMNS:
+        col = columns[name]
+        if isinstance(col, DictionaryColumn):
+            data = _le(array(col.typecode(), col.codes))
+            meta.append({"name": name, "type": "dictionary", "index": col.typecode(), "dictionary": col.values})
+        else:
+            data = _le(col)
+            meta.append({"name": name, "type": "float64"})
+        meta[-1].update(offset=offset, length=len(data))
+        pad = -len(data) % _ALIGN
+        buffers.append(data + b"\0" * pad)
+        offset += len(data) + pad
+
+    header = json.dumps({"version": 1, "rows": rows, "columns": meta}, separators=(",", ":")).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % _ALIGN)
+    with path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for data in buffers:
+            f.write(data)
+
+
+def read_ccol(path: str | Path) -> Dict[str, Any]:
+    """Columns of a .ccol file: DictionaryColumn per dictionary column, array('d') for floats."""
+    raw = Path(path).read_bytes()
+    if not raw.startswith(MAGIC):
+        raise ValueError(f"{path} is not a columnar export")
+    (header_len,) = struct.unpack_from("<I", raw, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(raw[start : start + header_len])
+    body = memoryview(raw)[start + header_len :]
+
+    columns: Dict[str, Any] = {}
+    for meta in header["columns"]:
+        chunk = body[meta["offset"] : meta["offset"] + meta["length"]]
+        buf = array(meta["index"] if meta["type"] == "dictionary" else "d")
+        buf.frombytes(chunk)
+        if sys.byteorder == "big":
+            buf.byteswap()
+        if meta["type"] == "dictionary":
+            col = DictionaryColumn()
+            col.values = meta["dictionary"]
+            col.index = {value: code for code, value in enumerate(col.values)}
+            col.codes = array("I", buf)
+            columns[meta["name"]] = col
+        else:
+            columns[meta["name"]] = buf
+    return columns
+
+
+def _write_arrow(path: Path, columns: Dict[str, Any], fmt: str) -> None:
+    pa = _pyarrow()
+
+    def from_array(buf: array, type_: Any) -> Any:
+        # Zero-copy over the little-endian buffer; codes never exceed int32.
+        return pa.Array.from_buffers(type_, len(buf), [None, pa.py_buffer(_le(buf))])
+
+    arrays = {}
+    for name in COLUMNS:
+        col = columns[name]
+        if isinstance(col, DictionaryColumn):
+            arrays[name] = pa.DictionaryArray.from_arrays(from_array(col.codes, pa.int32()), pa.array(col.values))
+        else:
+            arrays[name] = from_array(col, pa.float64())
+    table = pa.table(arrays)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, str(path), compression="zstd")
+    else:
+        import pyarrow.ipc as ipc
+
+        with ipc.new_file(str(path), table.schema) as writer:
+            writer.write_table(table)
+
+
+def write_columnar(path: str | Path, columns: Dict[str, Any], fmt: Optional[str] = None) -> Path:
+    """Write columns as parquet|arrow (needs pyarrow, else RuntimeError) or ccol."""
+    out = Path(path)
+    fmt = fmt or format_of(out) or default_format()
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of: {'|'.join(FORMATS)}")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "ccol":
+        _write_ccol(out, columns)
+        return out
+    if _pyarrow() is None:
+        raise RuntimeError(f"{fmt} export requires optional dependency: pyarrow")
+    _write_arrow(out, columns, fmt)
+    return out
@@ -0,0 +1,114 @@
+"""Advisory locks and three-way merges for assessment files shared by several writers.
+
+Writers hold the lock only while reading and replacing the file, never for a whole
+editing session. A writer that started from an older copy (its base) merges its changes
+into whatever is on disk, control by control, instead of overwriting it.
+"""
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+DEFAULT_LOCK_TIMEOUT = 10.0
+_RETRY = 0.02
+_MISSING = object()
+
+
+class LockTimeout(TimeoutError):
+    pass
+
+
+def lock_path(path: str | Path) -> Path:
+    # A sidecar file: the assessment itself is replaced on every save, so its inode changes.
+    p = Path(path)
+    return p.with_name(f".{p.name}.lock")
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: str | Path, timeout: float = DEFAULT_LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path (not re-entrant); LockTimeout after timeout seconds."""
+    target = lock_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(target, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while not _try_lock(fd):
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"{path} is locked by another writer (waited {timeout:g}s)")
+            time.sleep(_RETRY)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def _merge(base: Any, ours: Any, theirs: Any, path: List[str], conflicts: List[Dict[str, Any]]) -> Any:
+    if ours == theirs:
+        return ours
+    if ours == base:
+        return theirs
+    if theirs == base:
+        return ours
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base_dict = base if isinstance(base, dict) else {}
+        merged: Dict[str, Any] = {}
+        for key in list(ours) + [key for key in theirs if key not in ours]:
+            value = _merge(
+                base_dict.get(key, _MISSING), ours.get(key, _MISSING), theirs.get(key, _MISSING), path + [key], conflicts
+            )
+            if value is not _MISSING:
+                merged[key] = value
+        return merged
+    # Both sides changed the same control differently: keep ours and report it.
+    conflicts.append(
+        {
+            "path": path,
+            "base": None if base is _MISSING else base,
+            "ours": None if ours is _MISSING else ours,
+            "theirs": None if theirs is _MISSING else theirs,
+        }
+    )
+    return ours
+
+
+def merge_assessments(
+    base: Dict[str, Any], ours: Dict[str, Any], theirs: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Three-way merge of assessment documents, per key down to each control.
+
+    Changes made on only one side since base are kept; where both sides changed the
+    same value differently ours wins and the clash is returned in conflicts.
+    """
+    conflicts: List[Dict[str, Any]] = []
+    merged = _merge(base, ours, theirs, [], conflicts)
+    return merged, conflicts
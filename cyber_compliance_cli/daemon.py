@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import socketserver
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import typer
+from rich.console import Console
+
+from . import codec
+from . import main as cli
+from .client import ENV_PREFIX, FORWARDED_COMMANDS, PINNED_ENV, command_of, socket_path
+from .mcp_client import close_warm_state, enable_warm_state
+
+# Exit code of usage errors (bad options or arguments).
+USAGE_EXIT = 2
+
+
+@contextmanager
+def _request_env(env: Dict[str, Optional[str]]) -> Iterator[None]:
+    """Swap in the client's CYBERSEC_* variables for one request (requests never overlap)."""
+    saved = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+    for key in saved:
+        del os.environ[key]
+    os.environ.update({key: value for key, value in env.items() if key.startswith(ENV_PREFIX) and value is not None})
+    # The JSON backend is picked from the environment once; re-detect it for this request.
+    codec.set_json_backend(None)
+    try:
+        yield
+    finally:
+        for key in [key for key in os.environ if key.startswith(ENV_PREFIX)]:
+            del os.environ[key]
+        os.environ.update(saved)
+        codec.set_json_backend(None)
+
+
+def run_forwarded(
+    argv: list, cwd: str, color: bool = False, width: int = 80, env: Optional[Dict[str, Optional[str]]] = None
+) -> Dict[str, Any]:
+    """Run one CLI command in this process, capturing what it prints.
+
+    env is the client's environment (see client.request_env); without it the daemon's own is used.
+    """
+    if command_of(argv) not in FORWARDED_COMMANDS:
+        return {"handled": False}
+    if env is None:
+        env = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+    elif any(env.get(key) != os.environ.get(key) for key in PINNED_ENV):
+        return {"handled": False}
+
+    buffer = io.StringIO()
+    err_buffer = io.StringIO()
+    original_console, original_err_console = cli.console, cli.err_console
+    original_cwd = os.getcwd()
+    cli.console = Console(file=buffer, force_terminal=color, no_color=not color, width=width)
+    cli.err_console = Console(file=err_buffer, force_terminal=color, no_color=not color, width=width)
+    try:
+        os.chdir(cwd)
+        with _request_env(env):
+            exit_code = cli.app(list(argv), standalone_mode=False, prog_name="cybersec")
+    except typer.TyperException as exc:
+        if exc.exit_code == USAGE_EXIT:
+            # Raised while parsing, before the command runs: the client re-runs it for the usual usage text.
+            return {"handled": False}
+        err_buffer.write(f"Error: {exc.format_message()}\n")
+        exit_code = exc.exit_code
+    except typer.Abort:
+        err_buffer.write("Aborted!\n")
+        exit_code = 1
+    except Exception as exc:
+        # The command may already have written files; report instead of running it twice.
+        err_buffer.write(f"Error: {type(exc).__name__}: {exc}\n")
+        exit_code = 1
+    finally:
+        cli.console, cli.err_console = original_console, original_err_console
+        os.chdir(original_cwd)
+
+    return {
+        "handled": True,
+        "exit_code": int(exit_code or 0),
+        "stdout": buffer.getvalue(),
+        "stderr": err_buffer.getvalue(),
+    }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8") or "{}")
+        except ValueError:
+            request = {}
+
+        op = request.get("op")
+        if op == "ping":
+            response: Dict[str, Any] = {"handled": True, "pid": os.getpid()}
+        elif op == "shutdown":
+            response = {"handled": True}
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif op == "run":
+            response = run_forwarded(
+                request.get("argv", []),
+                request.get("cwd", os.getcwd()),
+                color=bool(request.get("color")),
+                width=int(request.get("width", 80)),
+                env=request.get("env"),
+            )
+        else:
+            response = {"handled": False}
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serial request loop: commands share cwd/console swaps, so they never overlap."""
+
+    allow_reuse_address = True
+
+
+def serve(path: Path | None = None) -> None:
+    target = path or socket_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+
+    enable_warm_state()
+    server = DaemonServer(str(target), _Handler)
+    os.chmod(target, 0o600)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        close_warm_state()
+        if target.exists():
+            target.unlink()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+# Control id prefix -> (domain, default criticality 0..1), per framework.
+# A control belongs to a prefix when its id equals it or starts with "<prefix>.".
+DOMAIN_PREFIXES: Dict[str, List[Tuple[str, str, float]]] = {
+    "nist_csf": [
+        ("GV", "Govern", 0.6),
+        ("ID", "Identify", 0.7),
+        ("PR", "Protect", 1.0),
+        ("DE", "Detect", 0.9),
+        ("RS", "Respond", 0.8),
+        ("RC", "Recover", 0.7),
+    ],
+    "iso27001": [
+        ("A.5", "Organizational", 0.6),
+        ("A.6", "People", 0.5),
+        ("A.7", "Physical", 0.5),
+        ("A.8", "Technological", 0.9),
+    ],
+    "soc2": [
+        ("CC1", "Control Environment", 0.5),
+        ("CC2", "Communication and Information", 0.4),
+        ("CC3", "Risk Assessment", 0.6),
+        ("CC4", "Monitoring Activities", 0.6),
+        ("CC5", "Control Activities", 0.6),
+        ("CC6", "Logical and Physical Access", 1.0),
+        ("CC7", "System Operations", 0.9),
+        ("CC8", "Change Management", 0.7),
+        ("CC9", "Risk Mitigation", 0.6),
+        ("A1", "Availability", 0.7),
+        ("C1", "Confidentiality", 0.8),
+        ("PI1", "Processing Integrity", 0.6),
+    ],
+    "cis_v8": [
+        ("1", "Asset Inventory", 0.8),
+        ("2", "Software Inventory", 0.7),
+        ("3", "Data Protection", 0.9),
+        ("4", "Secure Configuration", 0.8),
+        ("5", "Account Management", 0.9),
+        ("6", "Access Control Management", 1.0),
+        ("7", "Vulnerability Management", 0.9),
+        ("8", "Audit Log Management", 0.8),
+        ("9", "Email and Web Browser Protections", 0.6),
+        ("10", "Malware Defenses", 0.8),
+        ("11", "Data Recovery", 0.8),
+        ("12", "Network Infrastructure Management", 0.7),
+        ("13", "Network Monitoring and Defense", 0.7),
+        ("14", "Security Awareness Training", 0.5),
+        ("15", "Service Provider Management", 0.5),
+        ("16", "Application Software Security", 0.7),
+        ("17", "Incident Response Management", 0.8),
+        ("18", "Penetration Testing", 0.5),
+    ],
+    "pci_dss": [
+        ("1", "Network Security", 0.9),
+        ("2", "Secure Configuration", 0.8),
+        ("3", "Data Protection", 1.0),
+        ("4", "Crypto", 0.9),
+        ("5", "Malware Defense", 0.8),
+        ("6", "Secure SDLC", 0.7),
+        ("7", "Access Control", 1.0),
+        ("8", "Identity/Auth", 1.0),
+        ("9", "Physical Security", 0.5),
+        ("10", "Logging/Monitoring", 0.8),
+        ("11", "Security Testing", 0.7),
+        ("12", "Governance", 0.5),
+    ],
+}
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+# Control titles used when a mapped control is not yet present in the assessment.
+CONTROL_TITLES: Dict[Tuple[str, str], str] = {
+    ("nist_csf", "GV.OV-01"): "Governance strategy defined",
+    ("nist_csf", "ID.AM-01"): "Asset inventory maintained",
+    ("nist_csf", "ID.RA-01"): "Vulnerabilities identified and recorded",
+    ("nist_csf", "PR.AA-01"): "Identity and access managed",
+    ("nist_csf", "PR.DS-01"): "Data at rest protected",
+    ("nist_csf", "DE.CM-01"): "Continuous monitoring enabled",
+    ("nist_csf", "RS.RP-01"): "Incident response plan executed",
+    ("nist_csf", "RC.RP-01"): "Recovery plan validated",
+    ("iso27001", "A.5.1"): "Policies for information security",
+    ("iso27001", "A.5.9"): "Inventory of information and other associated assets",
+    ("iso27001", "A.5.15"): "Access control",
+    ("iso27001", "A.5.16"): "Identity management",
+    ("iso27001", "A.5.26"): "Response to information security incidents",
+    ("iso27001", "A.5.30"): "ICT readiness for business continuity",
+    ("iso27001", "A.8.8"): "Management of technical vulnerabilities",
+    ("iso27001", "A.8.16"): "Monitoring activities",
+    ("iso27001", "A.8.24"): "Use of cryptography",
+    ("soc2", "CC1.2"): "Board oversight of internal control",
+    ("soc2", "CC6.1"): "Logical access security",
+    ("soc2", "CC6.7"): "Restricted transmission and storage of data",
+    ("soc2", "CC7.1"): "Vulnerability detection",
+    ("soc2", "CC7.2"): "Security event monitoring",
+    ("soc2", "CC7.4"): "Incident response",
+    ("soc2", "A1.2"): "Backup and recovery infrastructure",
+    ("cis_v8", "1.1"): "Establish and maintain detailed enterprise asset inventory",
+    ("cis_v8", "3.11"): "Encrypt sensitive data at rest",
+    ("cis_v8", "5.1"): "Establish and maintain an inventory of accounts",
+    ("cis_v8", "6.1"): "Establish an access granting process",
+    ("cis_v8", "7.1"): "Establish and maintain a vulnerability management process",
+    ("cis_v8", "8.2"): "Collect audit logs",
+    ("cis_v8", "11.1"): "Establish and maintain a data recovery process",
+    ("cis_v8", "17.4"): "Establish and maintain an incident response process",
+}
+
+# Undirected crosswalk edges: (framework, control id, framework, control id, coverage).
+# Coverage 1.0 means the controls are equivalent; lower values mean the target
+# only partially covers the source requirement.
+CONTROL_MAPPINGS: List[Tuple[str, str, str, str, float]] = [
+    # Governance
+    ("nist_csf", "GV.OV-01", "iso27001", "A.5.1", 1.0),
+    ("nist_csf", "GV.OV-01", "soc2", "CC1.2", 0.5),
+    # Asset inventory
+    ("nist_csf", "ID.AM-01", "iso27001", "A.5.9", 1.0),
+    ("nist_csf", "ID.AM-01", "cis_v8", "1.1", 1.0),
+    ("nist_csf", "ID.AM-01", "soc2", "CC6.1", 0.5),
+    ("iso27001", "A.5.9", "cis_v8", "1.1", 1.0),
+    # Vulnerability management
+    ("nist_csf", "ID.RA-01", "iso27001", "A.8.8", 1.0),
+    ("nist_csf", "ID.RA-01", "cis_v8", "7.1", 1.0),
+    ("nist_csf", "ID.RA-01", "soc2", "CC7.1", 1.0),
+    ("iso27001", "A.8.8", "cis_v8", "7.1", 1.0),
+    # Identity and access
+    ("nist_csf", "PR.AA-01", "iso27001", "A.5.16", 1.0),
+    ("nist_csf", "PR.AA-01", "iso27001", "A.5.15", 0.5),
+    ("nist_csf", "PR.AA-01", "soc2", "CC6.1", 1.0),
+    ("nist_csf", "PR.AA-01", "cis_v8", "5.1", 0.5),
+    ("nist_csf", "PR.AA-01", "cis_v8", "6.1", 0.5),
+    ("iso27001", "A.5.15", "cis_v8", "6.1", 1.0),
+    ("iso27001", "A.5.16", "cis_v8", "5.1", 1.0),
+    # Data protection
+    ("nist_csf", "PR.DS-01", "iso27001", "A.8.24", 0.5),
+    ("nist_csf", "PR.DS-01", "cis_v8", "3.11", 1.0),
+    ("nist_csf", "PR.DS-01", "soc2", "CC6.7", 0.5),
+    # Monitoring
+    ("nist_csf", "DE.CM-01", "iso27001", "A.8.16", 1.0),
+    ("nist_csf", "DE.CM-01", "soc2", "CC7.2", 1.0),
+    ("nist_csf", "DE.CM-01", "cis_v8", "8.2", 0.5),
+    ("iso27001", "A.8.16", "soc2", "CC7.2", 1.0),
+    # Incident response
+    ("nist_csf", "RS.RP-01", "iso27001", "A.5.26", 1.0),
+    ("nist_csf", "RS.RP-01", "soc2", "CC7.4", 1.0),
+    ("nist_csf", "RS.RP-01", "cis_v8", "17.4", 1.0),
+    ("iso27001", "A.5.26", "soc2", "CC7.4", 1.0),
+    # Recovery
+    ("nist_csf", "RC.RP-01", "iso27001", "A.5.30", 0.5),
+    ("nist_csf", "RC.RP-01", "soc2", "A1.2", 1.0),
+    ("nist_csf", "RC.RP-01", "cis_v8", "11.1", 1.0),
+]
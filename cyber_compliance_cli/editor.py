@@ -1,12 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import copy
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from textual import events, work
 from textual.app import App, ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Footer, Header, Input, Static
 
-from .mcp_client import SUPPORTED_FRAMEWORKS, load_assessment, save_assessment, set_control_status, summarize_all
+from .concurrency import merge_assessments
+from .mapping import propagate_statuses
+from .perf import PerfOverlay, mark_render
+from .mcp_client import (
+    SUPPORTED_FRAMEWORKS,
+    load_assessment,
+    save_assessment,
+    set_control_status,
+    summarize_all,
+)
+
+# Saves requested within this many seconds of each other are written once.
+SAVE_DEBOUNCE = 0.25
+# Undo history depth; every single, bulk or propagated edit is one entry.
+JOURNAL_LIMIT = 100
+
+# (framework, control, status before (None if unset), status after)
+Change = Tuple[str, str, Optional[str], str]
 
 
 class AssessmentEditorApp(App):
@@ -14,6 +34,7 @@ class AssessmentEditorApp(App):
     Screen { background: #0b1020; color: #e2e8f0; }
     .panel { border: round #334155; background: #111827; padding: 1 2; margin: 1 2; }
     #filter { margin: 0 2; }
+    #save { margin: 0 2; color: #93c5fd; }
     """
 
     BINDINGS = [
@@ -26,6 +47,13 @@ class AssessmentEditorApp(App):
         ("1", "set_implemented", "implemented"),
         ("2", "set_partial", "partial"),
         ("3", "set_missing", "missing"),
+        ("space", "toggle_select", "Select"),
+        ("a", "select_filtered", "Select filtered"),
+        ("!", "bulk_implemented", "Bulk implemented"),
+        ("@", "bulk_partial", "Bulk partial"),
+        ("#", "bulk_missing", "Bulk missing"),
+        ("u", "undo", "Undo"),
+        ("p", "propagate", "Propagate"),
         ("s", "save", "Save"),
     ]
 
@@ -35,19 +63,34 @@ class AssessmentEditorApp(App):
         org_type: str = "saas",
         transport: str = "python",
         server_command: str = "cyber-compliance-mcp",
+        autosave_interval: Optional[float] = None,
+        debug_perf: bool = False,
         *args: Any,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
+        self.debug_perf = debug_perf
         self.assessment_file = assessment_file
         self.org_type = org_type
         self.transport = transport
         self.server_command = server_command
+        self.autosave_interval = autosave_interval
+        # Save state, only touched on the event loop: edits not yet snapshotted,
+        # a save requested but not yet snapshotted, and whether the save worker runs.
+        self.dirty = False
+        self.save_pending = False
+        self.saving = False
+        self.quit_after_save = False
+        self.save_state = "saved"
         self.framework_idx = 0
         self.control_idx = 0
         self.show_help = False
         self.show_modal = False
         self.filter_text = ""
+        # Selected controls of the current framework, and undoable edit batches.
+        self.selected: Set[str] = set()
+        self.journal: List[Dict[str, Any]] = []
+        self._rows: Optional[Dict[Tuple[str, str], Dict[str, str]]] = None
 
         self.data = summarize_all(
             self.assessment_file,
@@ -56,11 +99,16 @@ class AssessmentEditorApp(App):
             server_command=self.server_command,
         )
         self.assessment = load_assessment(self.assessment_file)
+        # The file as last read or written; saves merge other writers' changes against it.
+        self.base = copy.deepcopy(self.assessment)
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
+        if self.debug_perf:
+            yield PerfOverlay()
         with Vertical():
             yield Static("", id="header", classes="panel")
+            yield Static("", id="save")
             yield Input(placeholder="Filter controls (type to search)...", id="filter")
             yield Static("", id="controls", classes="panel")
             yield Static("", id="modal", classes="panel")
@@ -68,8 +116,15 @@ class AssessmentEditorApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        if self.autosave_interval:
+            self.set_interval(self.autosave_interval, self._autosave)
         self._render_all()
 
+    async def on_event(self, event: events.Event) -> None:
+        if self.debug_perf and isinstance(event, events.Key):
+            mark_render(self)
+        await super().on_event(event)
+
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "filter":
             self.filter_text = event.value.strip().lower()
@@ -94,12 +149,16 @@ class AssessmentEditorApp(App):
         return " | ".join(tabs)
 
     def _render_all(self) -> None:
+        if self.debug_perf:
+            mark_render(self)
         fw = self._current_framework()
         summary = next((x for x in self.data.get("frameworks", []) if x.get("framework") == fw), {})
         self.query_one("#header", Static).update(
             f"[b]Tabs:[/b] {self._framework_tabs()}\n"
             f"[b]Framework:[/b] {fw}    [b]Risk:[/b] {summary.get('risk_level', 'unknown').upper()} ({summary.get('risk_score', '?')}%)    [b]File:[/b] {self.assessment_file}"
+            + (f"    [b]Selected:[/b] {len(self.selected)}" if self.selected else "")
         )
+        self._render_save_state()
 
         rows: List[str] = []
         controls = self._controls()
@@ -110,8 +169,9 @@ class AssessmentEditorApp(App):
             self.control_idx = max(0, min(self.control_idx, len(controls) - 1))
             for idx, item in enumerate(controls):
                 mark = ">" if idx == self.control_idx else " "
+                picked = "*" if item["control"] in self.selected else " "
                 chip = self._status_chip(item["status"])
-                rows.append(f"{mark} {chip} {item['status']:<11}  {item['control']}")
+                rows.append(f"{mark}{picked} {chip} {item['status']:<11}  {item['control']}")
         self.query_one("#controls", Static).update("\n".join(rows))
 
         modal = self.query_one("#modal", Static)
@@ -127,20 +187,108 @@ class AssessmentEditorApp(App):
             modal.update("Press [e] to toggle control detail modal")
 
         help_text = (
-            "Keys: ↑/↓ move • m switch framework • type in filter box • e detail modal • 1/2/3 set status • s save • h toggle help • q quit\n"
+            "Keys: ↑/↓ move • m switch framework • type in filter box • e detail modal • 1/2/3 set status • space select • a select filtered • !/@/# set selection (or all filtered) • u undo • p propagate to mapped controls • s save (in background) • h toggle help • q quit\n"
             "Legend: 🟢 implemented  🟡 partial  🔴 missing"
             if self.show_help
             else "Press [h] for help"
         )
         self.query_one("#help", Static).update(help_text)
 
+    def _row(self, framework: str, control: str) -> Optional[Dict[str, str]]:
+        if self._rows is None:
+            self._rows = {
+                (fw, row["control"]): row for fw, rows in self.data.get("framework_details", {}).items() for row in rows
+            }
+        return self._rows.get((framework, control))
+
+    def _statuses(self, framework: str) -> Dict[str, Any]:
+        return self.assessment.setdefault("frameworks", {}).setdefault(framework, {}).setdefault("statuses", {})
+
+    def _apply(self, label: str, updates: List[Tuple[str, str, str]]) -> int:
+        """Set many statuses in one pass as one journal entry; the caller re-renders once."""
+        changes: List[Change] = []
+        for fw, control, status in updates:
+            before = self._statuses(fw).get(control)
+            set_control_status(self.assessment, fw, control, status)
+            after = self._statuses(fw)[control]
+            row = self._row(fw, control)
+            if row is not None:
+                row["status"] = after
+            if before != after:
+                changes.append((fw, control, before, after))
+        if changes:
+            self.journal.append({"label": label, "changes": changes})
+            del self.journal[:-JOURNAL_LIMIT]
+            self._mark_dirty()
+        return len(changes)
+
     def _set_status(self, status: str) -> None:
         controls = self._controls()
         if not controls:
             return
         item = controls[self.control_idx]
-        item["status"] = status
-        set_control_status(self.assessment, self._current_framework(), item["control"], status)
+        self._apply(f"set {item['control']}", [(self._current_framework(), item["control"], status)])
+        self._render_all()
+
+    def _bulk_status(self, status: str) -> None:
+        """Apply status to the selection, or to every control matching the filter when nothing is selected."""
+        fw = self._current_framework()
+        controls = self._controls()
+        targets = [c["control"] for c in controls if c["control"] in self.selected] if self.selected else [
+            c["control"] for c in controls
+        ]
+        if not targets:
+            return
+        changed = self._apply(f"{status} x{len(targets)}", [(fw, control, status) for control in targets])
+        self.selected.clear()
+        self.notify(f"Set {changed} of {len(targets)} controls to {status} (unsaved)", timeout=1.5)
+        self._render_all()
+
+    def action_toggle_select(self) -> None:
+        controls = self._controls()
+        if not controls:
+            return
+        control = controls[self.control_idx]["control"]
+        if control in self.selected:
+            self.selected.discard(control)
+        else:
+            self.selected.add(control)
+        self.control_idx = min(len(controls) - 1, self.control_idx + 1)
+        self._render_all()
+
+    def action_select_filtered(self) -> None:
+        names = {c["control"] for c in self._controls()}
+        if names and names <= self.selected:
+            self.selected -= names
+        else:
+            self.selected |= names
+        self._render_all()
+
+    def action_bulk_implemented(self) -> None:
+        self._bulk_status("implemented")
+
+    def action_bulk_partial(self) -> None:
+        self._bulk_status("partial")
+
+    def action_bulk_missing(self) -> None:
+        self._bulk_status("missing")
+
+    def action_undo(self) -> None:
+        if not self.journal:
+            self.notify("Nothing to undo", timeout=1.5)
+            return
+        entry = self.journal.pop()
+        for fw, control, before, _ in reversed(entry["changes"]):
+            statuses = self._statuses(fw)
+            if before is None:
+                statuses.pop(control, None)
+            else:
+                statuses[control] = before
+            row = self._row(fw, control)
+            if row is not None:
+                row["status"] = before if before is not None else "missing"
+        self._mark_dirty()
+        self.notify(f"Undid {entry['label']} ({len(entry['changes'])} controls)", timeout=1.5)
         self._render_all()
 
     def action_up(self) -> None:
@@ -156,6 +304,7 @@ class AssessmentEditorApp(App):
     def action_next_framework(self) -> None:
         self.framework_idx = (self.framework_idx + 1) % len(SUPPORTED_FRAMEWORKS)
         self.control_idx = 0
+        self.selected.clear()
         self._render_all()
 
     def action_help(self) -> None:
@@ -175,13 +324,132 @@ class AssessmentEditorApp(App):
     def action_set_missing(self) -> None:
         self._set_status("missing")
 
-    def action_save(self) -> None:
-        save_assessment(self.assessment_file, self.assessment)
-        self.data = summarize_all(
-            self.assessment_file,
-            org_type=self.org_type,
-            transport=self.transport,
-            server_command=self.server_command,
+    def action_propagate(self) -> None:
+        controls = self._controls()
+        if not controls:
+            return
+        item = controls[self.control_idx]
+        details: Dict[str, List[Dict[str, str]]] = self.data.get("framework_details", {})
+        known = {fw: [c["control"] for c in rows] for fw, rows in details.items()}
+        out = propagate_statuses(
+            self.assessment,
+            [{"framework": self._current_framework(), "control": item["control"], "status": item["status"]}],
+            dry_run=True,
+            known_controls=known,
         )
-        self.notify("Saved assessment.json", timeout=1.5)
+        rows = out["applied"] + out["cascaded"]
+        self._apply(f"propagate {item['control']}", [(row["framework"], row["control"], row["to"]) for row in rows])
+        self.notify(f"Propagated to {len(out['cascaded'])} mapped controls (unsaved)", timeout=1.5)
+        self._render_all()
+
+    def _render_save_state(self) -> None:
+        label = {"saving": "saving…", "saved": "saved", "modified": "unsaved changes"}.get(self.save_state, self.save_state)
+        self.query_one("#save", Static).update(f"[b]File:[/b] {label}")
+
+    def _set_save_state(self, state: str) -> None:
+        self.save_state = state
+        self._render_save_state()
+
+    def _mark_dirty(self) -> None:
+        self.dirty = True
+        if not self.saving:
+            self._set_save_state("modified")
+
+    def _autosave(self) -> None:
+        if self.dirty:
+            self.action_save()
+
+    def action_save(self) -> None:
+        """Queue a save; the worker writes the file and re-summarizes off the event loop."""
+        self.save_pending = True
+        self._set_save_state("saving")
+        if not self.saving:
+            self.saving = True
+            self._save_worker()
+
+    def action_quit(self) -> None:
+        if self.saving:
+            self.quit_after_save = True
+            self.notify("Waiting for save to finish…", timeout=1.5)
+            return
+        self.exit()
+
+    def _take_snapshot(self) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Runs on the event loop: the assessment to write next and its base, or None to stop the worker."""
+        if not self.save_pending:
+            self.saving = False
+            if self.quit_after_save:
+                self.exit()
+            return None
+        self.save_pending = False
+        self.dirty = False
+        return copy.deepcopy(self.assessment), self.base
+
+    def _saved(self, snapshot: Dict[str, Any], saved: Dict[str, Any]) -> None:
+        self.base = saved["assessment"]
+        if not saved["merged"]:
+            return
+        # Bring the other writer's changes in under any edits made since the snapshot.
+        self.assessment, _ = merge_assessments(snapshot, self.assessment, saved["assessment"])
+        conflicts = saved["conflicts"]
+        message = "Merged changes saved by another writer"
+        if conflicts:
+            message += f"; kept your value for {len(conflicts)} conflicting control(s)"
+        self.notify(message, severity="warning" if conflicts else "information")
+
+    def _apply_summary(self, data: Dict[str, Any]) -> None:
+        # Edits made while the worker ran are not in data yet; keep showing them.
+        for fw, rows in data.get("framework_details", {}).items():
+            statuses = self.assessment.get("frameworks", {}).get(fw, {}).get("statuses", {})
+            for row in rows:
+                row["status"] = statuses.get(row["control"], row["status"])
+        self.data = data
+        self._rows = None
+        if not self.save_pending:
+            self._set_save_state("modified" if self.dirty else "saved")
         self._render_all()
+
+    def _save_failed(self, message: str) -> None:
+        self.dirty = True
+        self._set_save_state(f"save failed: {message}")
+        self.notify(f"Save failed: {message}", severity="error")
+
+    def _summary_failed(self, message: str) -> None:
+        self.notify(f"Saved; summary not refreshed: {message}", severity="warning")
+        if not self.save_pending:
+            self._set_save_state("modified" if self.dirty else "saved")
+
+    @work(thread=True, group="save", exit_on_error=False)
+    def _save_worker(self) -> None:
+        """Write and re-summarize until no save is pending; rapid saves coalesce into one write."""
+        stopped = False
+        try:
+            while True:
+                time.sleep(SAVE_DEBOUNCE)
+                pending = self.call_from_thread(self._take_snapshot)
+                if pending is None:
+                    # _take_snapshot cleared saving on the event loop; a new worker may own it now.
+                    stopped = True
+                    return
+                snapshot, base = pending
+                try:
+                    saved = save_assessment(self.assessment_file, snapshot, base=base)
+                    self.call_from_thread(self._saved, snapshot, saved)
+                except Exception as exc:
+                    self.call_from_thread(self._save_failed, str(exc) or type(exc).__name__)
+                    continue
+                try:
+                    data = summarize_all(
+                        self.assessment_file,
+                        org_type=self.org_type,
+                        transport=self.transport,
+                        server_command=self.server_command,
+                    )
+                except Exception as exc:
+                    self.call_from_thread(self._summary_failed, str(exc) or type(exc).__name__)
+                    continue
+                self.call_from_thread(self._apply_summary, data)
+        finally:
+            if not stopped:
+                # Left on an error: the next save must be able to start a worker again.
+                self.saving = False
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .assessment_schema import _is_sha256
+from .cache import read_cache, write_cache
+
+# Store directory, relative to the assessment file, unless --store is given.
+DEFAULT_STORE = ".evidence"
+CHUNK_SIZE = 1 << 20
+# Files at least this large are hashed through mmap instead of read() calls.
+MMAP_THRESHOLD = 8 << 20
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+STAT_CACHE = "evidence-stat"
+
+EVIDENCE_STATUSES = ("ok", "missing", "corrupt", "invalid", "unreadable")
+
+
+def hash_file(path: str | Path) -> str:
+    """SHA-256 of a file in CHUNK_SIZE pieces (mmap for large files); hashlib releases the GIL."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for offset in range(0, size, CHUNK_SIZE):
+                        digest.update(view[offset : offset + CHUNK_SIZE])
+        else:
+            buf = bytearray(CHUNK_SIZE)
+            with memoryview(buf) as view:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def store_dir(assessment_file: str | Path, store: Optional[str] = None) -> Path:
+    if store:
+        return Path(store)
+    return Path(assessment_file).resolve().parent / DEFAULT_STORE
+
+
+def object_path(store: Path, digest: str) -> Path:
+    return store / "objects" / digest[:2] / digest[2:]
+
+
+def store_evidence(source: str | Path, store: Path) -> Dict[str, Any]:
+    """Copy source into the store (once per content); returns its reference."""
+    src = Path(source)
+    digest = hash_file(src)
+    target = object_path(store, digest)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        shutil.copyfile(src, tmp)
+        # Stored objects are immutable; their name is their content.
+        tmp.chmod(0o444)
+        os.replace(tmp, target)
+
+    return {
+        "sha256": digest,
+        "name": src.name,
+        "size": src.stat().st_size,
+        "added": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def attach_evidence(assessment: Dict[str, Any], framework: str, control: str, ref: Dict[str, Any]) -> Dict[str, Any]:
+    """Reference stored evidence from the control, unless the same content is already there."""
+    fw_data = assessment.setdefault("frameworks", {}).setdefault(framework, {})
+    refs: List[Dict[str, Any]] = fw_data.setdefault("evidence", {}).setdefault(control, [])
+    for existing in refs:
+        if existing.get("sha256") == ref["sha256"]:
+            return existing
+    refs.append(ref)
+    return ref
+
+
+def add_evidence(
+    assessment: Dict[str, Any], framework: str, control: str, source: str | Path, store: Path
+) -> Dict[str, Any]:
+    """Copy source into the store (once per content) and reference it from the control."""
+    return attach_evidence(assessment, framework, control, store_evidence(source, store))
+
+
+def evidence_refs(assessment: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """(framework, control, ref) for every reference; a malformed control entry or ref yields {}."""
+    for framework, fw_data in assessment.get("frameworks", {}).items():
+        evidence = fw_data.get("evidence", {}) if isinstance(fw_data, dict) else {}
+        if not isinstance(evidence, dict):
+            continue
+        for control, refs in evidence.items():
+            for ref in refs if isinstance(refs, list) else [None]:
+                yield framework, control, ref if isinstance(ref, dict) else {}
+
+
+def _hash_or_none(path: Path) -> Optional[str]:
+    try:
+        return hash_file(path)
+    except OSError:
+        # e.g. a directory or a file without read permission in the store.
+        return None
+
+
+def verify_evidence(
+    assessment: Dict[str, Any], store: Path, workers: int = DEFAULT_WORKERS, full: bool = False
+) -> Dict[str, Any]:
+    """Check every referenced object against its hash.
+
+    Objects whose size and mtime match the persisted stat cache are not re-read
+    (unless full); the rest are hashed concurrently on a thread pool. References whose
+    sha256 is not a hex digest (or that are not {sha256, name} objects) are reported
+    invalid and never turned into a store path; objects that cannot be read are
+    unreadable and left out of the stat cache.
+    """
+    cache_key = str(store.resolve())
+    cached: Dict[str, List[Any]] = {} if full else (read_cache(STAT_CACHE, cache_key) or {})
+    refs = list(evidence_refs(assessment))
+    digests = {str(ref.get("sha256", "")) for _, _, ref in refs}
+
+    observed: Dict[str, Optional[str]] = {}
+    stats: Dict[str, List[int]] = {}
+    pending: List[Tuple[str, Path]] = []
+    for digest in digests:
+        if not _is_sha256(digest):
+            continue
+        path = object_path(store, digest)
+        try:
+            st = path.stat()
+        except OSError:
+            observed[digest] = None
+            continue
+        stats[digest] = [st.st_size, st.st_mtime_ns]
+        entry = cached.get(digest)
+        if entry and entry[:2] == stats[digest]:
+            observed[digest] = entry[2]
+        else:
+            pending.append((digest, path))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for (digest, _), actual in zip(pending, pool.map(lambda item: _hash_or_none(item[1]), pending)):
+                observed[digest] = actual
+
+    unreadable = {digest for digest, _ in pending if observed[digest] is None}
+
+    write_cache(STAT_CACHE, cache_key, {d: [*stats[d], observed[d]] for d in stats if d not in unreadable})
+
+    results = []
+    for framework, control, ref in refs:
+        digest = str(ref.get("sha256", ""))
+        actual = observed.get(digest)
+        if not _is_sha256(digest):
+            status = "invalid"
+        elif digest in unreadable:
+            status = "unreadable"
+        else:
+            status = "missing" if actual is None else ("ok" if actual == digest else "corrupt")
+        results.append(
+            {
+                "framework": framework,
+                "control": control,
+                "name": str(ref.get("name", "")),
+                "sha256": digest,
+                "status": status,
+            }
+        )
+    return {
+        "results": results,
+        "counts": {status: sum(1 for r in results if r["status"] == status) for status in EVIDENCE_STATUSES},
+        "hashed": len(pending),
+        "cached": len(stats) - len(pending),
+    }
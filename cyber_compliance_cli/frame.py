@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import copy
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .codec import load_document
+
+# Status codes stored per control; ABSENT marks controls not present in this assessment.
+ABSENT = -1
+STATUS_CODES = {"missing": 0, "partial": 1, "implemented": 2}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+
+class ControlIndex:
+    """Interned control names per framework, shared by many AssessmentFrames.
+
+    Each name is stored once; frames only keep one status byte per indexed control.
+    """
+
+    def __init__(self) -> None:
+        self.names: Dict[str, List[str]] = {}
+        self.positions: Dict[str, Dict[str, int]] = {}
+
+    def add(self, framework: str, control: str) -> int:
+        positions = self.positions.setdefault(framework, {})
+        pos = positions.get(control)
+        if pos is None:
+            names = self.names.setdefault(framework, [])
+            pos = len(names)
+            names.append(sys.intern(control))
+            positions[names[pos]] = pos
+        return pos
+
+    def position(self, framework: str, control: str) -> Optional[int]:
+        return self.positions.get(framework, {}).get(control)
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self.names.values())
+
+
+class FrameworkView:
+    """Zero-copy view over one framework's statuses in a frame (no per-control objects)."""
+
+    def __init__(self, framework: str, names: List[str], codes: array) -> None:
+        self.framework = framework
+        self.names = names
+        self.codes = codes
+
+    def buffer(self) -> memoryview:
+        """Raw int8 status codes; release it before adding controls to the frame."""
+        return memoryview(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes) - self.codes.count(ABSENT)
+
+    def count(self, status: str) -> int:
+        return self.codes.count(STATUS_CODES[status])
+
+    def counts(self) -> Dict[str, int]:
+        return {status: self.count(status) for status in STATUS_CODES}
+
+    def controls(self, status: Optional[str] = None) -> Iterator[str]:
+        """Yield (interned) control names, optionally only those with status."""
+        wanted = None if status is None else STATUS_CODES[status]
+        for pos, code in enumerate(self.codes):
+            if code != ABSENT and (wanted is None or code == wanted):
+                yield self.names[pos]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        for pos, code in enumerate(self.codes):
+            if code != ABSENT:
+                yield self.names[pos], STATUS_NAMES[code]
+
+
+class AssessmentFrame:
+    """Compact assessment: one array('b') of status codes per framework over a shared ControlIndex.
+
+    Unknown statuses are stored as missing, matching how summaries treat them.
+    Keys other than statuses are kept as-is so to_assessment() round-trips the JSON format.
+    """
+
+    def __init__(self, index: Optional[ControlIndex] = None) -> None:
+        self.index = index if index is not None else ControlIndex()
+        self.codes: Dict[str, array] = {}
+        self.extra: Dict[str, Any] = {}
+        self.framework_extra: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_assessment(cls, assessment: Dict[str, Any], index: Optional[ControlIndex] = None) -> "AssessmentFrame":
+        frame = cls(index)
+        frame.extra = {k: copy.deepcopy(v) for k, v in assessment.items() if k != "frameworks"}
+        for framework, fw_data in assessment.get("frameworks", {}).items():
+            fw_data = fw_data if isinstance(fw_data, dict) else {}
+            frame.framework_extra[framework] = {k: copy.deepcopy(v) for k, v in fw_data.items() if k != "statuses"}
+            frame.codes.setdefault(framework, array("b"))
+            for control, status in fw_data.get("statuses", {}).items():
+                frame.set(framework, control, status)
+        return frame
+
+    @classmethod
+    def from_file(cls, path: str | Path, index: Optional[ControlIndex] = None) -> "AssessmentFrame":
+        return cls.from_assessment(load_document(path), index)
+
+    def to_assessment(self) -> Dict[str, Any]:
+        frameworks: Dict[str, Any] = {}
+        for framework in self.frameworks():
+            fw_data = copy.deepcopy(self.framework_extra.get(framework, {}))
+            fw_data["statuses"] = dict(self.view(framework).items())
+            frameworks[framework] = fw_data
+        return {**copy.deepcopy(self.extra), "frameworks": frameworks}
+
+    def frameworks(self) -> List[str]:
+        return list(self.codes)
+
+    def _codes(self, framework: str) -> array:
+        """Status codes for framework, padded to the current size of the shared index."""
+        codes = self.codes.setdefault(framework, array("b"))
+        missing = len(self.index.names.get(framework, ())) - len(codes)
+        if missing > 0:
+            codes.extend([ABSENT] * missing)
+        return codes
+
+    def set(self, framework: str, control: str, status: str) -> None:
+        code = STATUS_CODES.get(str(status).lower().strip(), STATUS_CODES["missing"])
+        pos = self.index.add(framework, control)
+        self._codes(framework)[pos] = code
+
+    def get(self, framework: str, control: str, default: Optional[str] = None) -> Optional[str]:
+        pos = self.index.position(framework, control)
+        codes = self.codes.get(framework)
+        if pos is None or codes is None or pos >= len(codes) or codes[pos] == ABSENT:
+            return default
+        return STATUS_NAMES[codes[pos]]
+
+    def view(self, framework: str) -> FrameworkView:
+        return FrameworkView(framework, self.index.names.setdefault(framework, []), self._codes(framework))
+
+    def counts(self, framework: str, controls: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Status counts for framework; with controls, count those (absent ones as missing)."""
+        if controls is None:
+            return self.view(framework).counts()
+        counts = dict.fromkeys(STATUS_CODES, 0)
+        for control in controls:
+            counts[self.get(framework, control, "missing")] += 1
+        return counts
+
+
+def load_frames(paths: Iterable[str | Path], index: Optional[ControlIndex] = None) -> Dict[str, AssessmentFrame]:
+    """Load many assessments over one shared ControlIndex, keyed by path."""
+    shared = index if index is not None else ControlIndex()
+    return {str(path): AssessmentFrame.from_file(path, shared) for path in paths}
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from .mcp_client import SUPPORTED_FRAMEWORKS, load_assessment, save_assessment
+from .mcp_client import SUPPORTED_FRAMEWORKS, load_assessment, update_assessment
 
 
 def export_assessment_csv(assessment_file: str, output_csv: str) -> Path:
@@ -25,10 +25,9 @@ def export_assessment_csv(assessment_file: str, output_csv: str) -> Path:
     return out
 
 
-def import_assessment_csv(input_csv: str, assessment_file: str) -> Dict[str, Any]:
-    assessment = load_assessment(assessment_file)
-    frameworks = assessment.setdefault("frameworks", {})
-
+def read_status_rows(input_csv: str) -> List[Dict[str, str]]:
+    """Read framework/control/status rows, normalizing unknown statuses to missing."""
+    rows: List[Dict[str, str]] = []
     with Path(input_csv).open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
@@ -39,10 +38,19 @@ def import_assessment_csv(input_csv: str, assessment_file: str) -> Dict[str, Any
                 continue
             if status not in {"implemented", "partial", "missing"}:
                 status = "missing"
+            rows.append({"framework": framework, "control": control, "status": status})
+    return rows
 
-            fw = frameworks.setdefault(framework, {})
+
+def import_assessment_csv(input_csv: str, assessment_file: str) -> Dict[str, Any]:
+    rows = read_status_rows(input_csv)
+
+    def apply(assessment: Dict[str, Any]) -> Dict[str, Any]:
+        frameworks = assessment.setdefault("frameworks", {})
+        for row in rows:
+            fw = frameworks.setdefault(row["framework"], {})
             statuses = fw.setdefault("statuses", {})
-            statuses[control] = status
+            statuses[row["control"]] = row["status"]
+        return assessment
 
-    save_assessment(assessment_file, assessment)
-    return assessment
+    return update_assessment(assessment_file, apply)
@@ -1,60 +1,256 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Any, Callable, Dict, List, NoReturn, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from .editor import AssessmentEditorApp
 from .assessment_schema import validate_assessment
+from .cache import cache_dir
+from .codec import document_stem
 from .diffing import compare_assessments
-from .io_csv import export_assessment_csv, import_assessment_csv
+from .concurrency import LockTimeout
+from .evidence import DEFAULT_WORKERS, attach_evidence, store_dir, store_evidence, verify_evidence
+from .io_csv import export_assessment_csv, import_assessment_csv, read_status_rows
+from .mapping import propagate_statuses
+from .prioritization import DEFAULT_TOP, load_weights
+from . import memo, output, resilience
+from .scoring import risk_level, weighted_risk
 from .reporting import write_markdown_report, write_pdf_report
 from .mcp_client import (
+    SUPPORTED_FRAMEWORKS,
     MCPUnavailableError,
-    get_requirements,
-    list_requirement_frameworks,
+    fetch_requirements,
     load_assessment,
+    read_assessment_document,
+    save_assessment,
     summarize_all,
     summarize_framework,
+    update_assessment,
 )
 from .tui import CyberComplianceApp
+from .whatif import WhatIf
+from .watch import DEFAULT_DEBOUNCE, changed_frameworks, framework_hashes, watch_changes
 from .data.framework_catalog import list_controls, list_frameworks
 
 app = typer.Typer(help="Cyber security compliance CLI")
 console = Console()
+# Notes, warnings and errors go here when stdout carries json/ndjson records.
+err_console = Console(stderr=True)
+
+RISK_COLORS = {"low": "green", "medium": "yellow", "high": "orange3", "critical": "red"}
+
+
+def _notes() -> Console:
+    return err_console if output.machine() else console
+
+
+def _fail(message: str, code: int = output.EXIT_INVALID, details: Optional[List[str]] = None) -> NoReturn:
+    """Report an error (a JSON line on stderr in json/ndjson modes) and exit with code."""
+    if output.machine():
+        text = Text.from_markup(message).plain
+        if details:
+            text += ": " + "; ".join(details)
+        err_console.print(output.error_record(text, code), markup=False, highlight=False, soft_wrap=True)
+    else:
+        console.print(message)
+        for line in details or []:
+            console.print(line)
+    raise typer.Exit(code=code)
+
+
+def _records(**meta: Any) -> output.RecordWriter:
+    return output.RecordWriter(console.file, **meta)
+
+
+def _done(message: str, kind: str, **fields: Any) -> None:
+    """Print a success line, or emit it as a single record in json/ndjson modes."""
+    if not output.machine():
+        console.print(message)
+        return
+    writer = _records()
+    writer.emit(kind, **fields)
+    writer.close()
+
+
+def _print_latency_report() -> None:
+    out = resilience.report()
+    table = Table(title="MCP call latency (seconds)")
+    table.add_column("Tool")
+    table.add_column("Calls")
+    table.add_column("p50")
+    table.add_column("p95")
+    table.add_column("p99")
+    table.add_column("Max")
+    for tool, row in out["latency"].items():
+        table.add_row(
+            tool,
+            str(row["count"]),
+            f"{row['p50']:.3f}",
+            f"{row['p95']:.3f}",
+            f"{row['p99']:.3f}",
+            f"{row['max']:.3f}",
+        )
+    _notes().print(table)
+    stats = out["stats"]
+    _notes().print(
+        f"Attempts: {stats['calls']}  Retries: {stats['retries']}  Timeouts: {stats['timeouts']}  "
+        f"Hedges: {stats['hedges']}  Fallbacks: {stats['fallbacks']}"
+    )
+    if memo.STATS["hits"] or memo.STATS["misses"]:
+        _notes().print(f"Summary cache: {memo.STATS['hits']} hits, {memo.STATS['misses']} misses")
+    for key, state in out["breakers"].items():
+        if state != "closed":
+            _notes().print(f"[yellow]Circuit {state}[/yellow] for {key}")
+
+
+def _warn_fallbacks() -> None:
+    fallbacks = resilience.command_stats()["fallbacks"]
+    if fallbacks:
+        _notes().print(
+            f"[yellow]MCP circuit open: {fallbacks} call(s) served from local fallback or cached data.[/yellow]"
+        )
+
+
+def _priority_weights(weights_file: Optional[str]) -> dict:
+    try:
+        return load_weights(weights_file)
+    except (OSError, ValueError) as exc:
+        _fail(f"[red]Invalid priority weights:[/red] {exc}")
+
+
+def _run_watched(
+    assessment_file: str,
+    frameworks: List[str],
+    render: Callable[[List[str]], None],
+    watch: bool,
+    debounce: float,
+) -> None:
+    """Render once; with watch, re-render after each burst of writes for the frameworks that changed."""
+    if not watch:
+        render(frameworks)
+        return
+    hashes = framework_hashes(load_assessment(assessment_file), frameworks)
+    render(frameworks)
+    _notes().print(f"[dim]Watching {assessment_file} for changes (Ctrl+C to stop)[/dim]")
+    try:
+        for _ in watch_changes(assessment_file, debounce=debounce):
+            try:
+                current = framework_hashes(load_assessment(assessment_file), frameworks)
+                changed = changed_frameworks(hashes, current)
+                if changed:
+                    render(changed)
+            except ValueError as exc:
+                # Usually a half-written file; the next write triggers another pass.
+                _notes().print(f"[yellow]Skipping unreadable {assessment_file}:[/yellow] {exc}")
+                continue
+            except typer.Exit:
+                # The error is already reported; keep the old hashes so the next write retries.
+                continue
+            hashes = current
+    except KeyboardInterrupt:
+        pass
+
+
+def _resummarize(previous: Optional[Dict[str, Any]], changed: List[str], assessment_file: str, **options: Any) -> dict:
+    """summarize_all, reusing earlier per-framework summaries for frameworks that did not change."""
+    reuse = None
+    if previous is not None:
+        reuse = {row["framework"]: row for row in previous["frameworks"] if row["framework"] not in changed}
+    try:
+        return summarize_all(assessment_file, reuse=reuse, **options)
+    except MCPUnavailableError as exc:
+        _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
+
+
+def _file_not_mode(value: str) -> str:
+    # `report --output json` would otherwise quietly write a file named "json".
+    if value.lower().strip() in output.OUTPUT_MODES:
+        raise typer.BadParameter(
+            f"takes a file path; for {value} records use the global -O/--output-format before the command",
+            param_hint="--output",
+        )
+    return value
+
+
+@app.callback()
+def main_options(
+    ctx: typer.Context,
+    call_timeout: float = typer.Option(30.0, min=0.1, help="Timeout per MCP call in seconds."),
+    deadline: float = typer.Option(120.0, min=0.1, help="Overall MCP deadline per command in seconds."),
+    retries: int = typer.Option(2, min=0, help="Retries (with backoff) for failed read-only MCP calls."),
+    hedge: bool = typer.Option(False, "--hedge", help="Race a second request when a call exceeds its p95 latency."),
+    latency_report: bool = typer.Option(False, "--latency-report", help="Print MCP latency percentiles on exit."),
+    output_mode: str = typer.Option(
+        "table",
+        "--output-format",
+        "-O",
+        envvar="CYBERSEC_OUTPUT",
+        help="Output: table|json|ndjson (records on stdout).",
+    ),
+) -> None:
+    """Cyber security compliance CLI"""
+    mode = output_mode.lower().strip()
+    if mode not in output.OUTPUT_MODES:
+        raise typer.BadParameter(f"must be one of: {'|'.join(output.OUTPUT_MODES)}", param_hint="--output-format")
+    output.set_mode(mode, ctx.invoked_subcommand)
+    resilience.configure(call_timeout=call_timeout, deadline=deadline, retries=retries, hedge=hedge)
+    # The daemon runs many commands in one process; report only this one's calls.
+    resilience.begin_command()
+    memo.begin_command()
+    if latency_report:
+        ctx.call_on_close(_print_latency_report)
+    ctx.call_on_close(_warn_fallbacks)
+    ctx.call_on_close(memo.flush_stats)
 
 
 @app.command()
 def dashboard(
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
     org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+    top: int = typer.Option(DEFAULT_TOP, "--top", min=1, help="Number of prioritized gaps/actions to show."),
+    weights_file: Optional[str] = typer.Option(None, "--weights", help="JSON file overriding priority weights."),
+    debug_perf: bool = typer.Option(False, "--debug-perf", help="Show last render time and event-queue depth."),
 ) -> None:
     """Launch beautiful TUI dashboard using live data from MCP logic."""
-    try:
-        data = summarize_all(
+    weights = _priority_weights(weights_file)
+
+    def loader(on_summary: Callable[[dict], None]) -> dict:
+        return summarize_all(
             assessment_file,
             org_type=org_type,
             transport=transport,
             server_command=server_command,
+            top=top,
+            weights=weights,
+            on_summary=on_summary,
         )
-    except MCPUnavailableError as exc:
-        console.print(f"[red]MCP unavailable:[/red] {exc}")
-        raise typer.Exit(code=2)
 
-    CyberComplianceApp(data).run()
+    # Opens right away; framework cards fill in as their summaries arrive.
+    dash = CyberComplianceApp(
+        loader=loader, frameworks=list(SUPPORTED_FRAMEWORKS), source=assessment_file, debug_perf=debug_perf
+    )
+    dash.run()
+    if dash.load_error:
+        _fail(f"[red]MCP unavailable:[/red] {dash.load_error}", output.EXIT_UNAVAILABLE)
 
 
 @app.command()
 def edit(
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
     org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+    autosave_interval: float = typer.Option(
+        0.0, min=0.0, help="Save unsaved changes every N seconds in the background (0 disables)."
+    ),
+    debug_perf: bool = typer.Option(False, "--debug-perf", help="Show last render time and event-queue depth."),
 ) -> None:
     """Interactive TUI editor to update control statuses."""
     try:
@@ -63,10 +259,11 @@ def edit(
             org_type=org_type,
             transport=transport,
             server_command=server_command,
+            autosave_interval=autosave_interval or None,
+            debug_perf=debug_perf,
         ).run()
     except MCPUnavailableError as exc:
-        console.print(f"[red]MCP unavailable:[/red] {exc}")
-        raise typer.Exit(code=2)
+        _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
 
 
 @app.command()
@@ -74,23 +271,61 @@ def checklist(
     framework: str = typer.Option(..., help="Framework: nist_csf|iso27001|soc2|cis_v8"),
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
     org_type: str = typer.Option("saas", help="Organization type."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+    top: int = typer.Option(DEFAULT_TOP, "--top", min=1, help="Number of prioritized gaps/actions to show."),
+    weights_file: Optional[str] = typer.Option(None, "--weights", help="JSON file overriding priority weights."),
+    watch: bool = typer.Option(False, "--watch", help="Re-run whenever the assessment file changes."),
+    debounce: float = typer.Option(DEFAULT_DEBOUNCE, min=0.0, help="Seconds of quiet before a --watch re-run."),
 ) -> None:
     """Print control checklist summary via MCP logic."""
+    weights = _priority_weights(weights_file)
+    fw = framework.lower().strip()
+    _run_watched(
+        assessment_file,
+        [fw],
+        lambda _changed: _print_checklist(fw, assessment_file, org_type, transport, server_command, top, weights),
+        watch,
+        debounce,
+    )
+
+
+def _print_checklist(
+    framework: str,
+    assessment_file: str,
+    org_type: str,
+    transport: str,
+    server_command: str,
+    top: int,
+    weights: dict,
+) -> None:
     try:
         assessment = load_assessment(assessment_file)
         summary = summarize_framework(
-            framework.lower().strip(),
+            framework,
             assessment,
             org_type,
             transport=transport,
             server_command=server_command,
+            top=top,
+            weights=weights,
         )
     except MCPUnavailableError as exc:
-        console.print(f"[red]MCP unavailable:[/red] {exc}")
-        raise typer.Exit(code=2)
+        _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
 
+    gaps = summary.get("priority_gaps", [])
+    if output.machine():
+        writer = _records(framework=summary["framework"], org_type=org_type)
+        summary_keys = ("framework", "risk_score", "risk_level", "implemented", "partial", "missing", "controls_total")
+        writer.emit("summary", **{key: summary.get(key) for key in summary_keys})
+        for rank, gap in enumerate(gaps, start=1):
+            writer.emit("gap", rank=rank, **{key: gap[key] for key in ("framework", "control", "status", "domain", "priority")})
+        for row in summary.get("domains", []):
+            writer.emit("domain", framework=summary["framework"], **row)
+        for row in summary.get("controls", []):
+            writer.emit("control", framework=summary["framework"], control=row["control"], status=row["status"])
+        writer.close()
+        return
 
     table = Table(title=f"{framework.upper()} Compliance Summary")
     table.add_column("Metric")
@@ -105,6 +340,35 @@ def checklist(
 
     console.print(table)
 
+    if summary.get("domains"):
+        domain_table = Table(title="Risk by domain")
+        domain_table.add_column("Domain")
+        domain_table.add_column("Risk", justify="right")
+        domain_table.add_column("Implemented", justify="right")
+        domain_table.add_column("Partial", justify="right")
+        domain_table.add_column("Missing", justify="right")
+        for row in summary["domains"]:
+            color = RISK_COLORS[row["risk_level"]]
+            domain_table.add_row(
+                row["domain"],
+                f"[{color}]{row['risk_score']:.2f}%[/{color}]",
+                str(row["implemented"]),
+                str(row["partial"]),
+                str(row["missing"]),
+            )
+        console.print(domain_table)
+
+    if gaps:
+        gap_table = Table(title=f"Top {len(gaps)} gaps by priority")
+        gap_table.add_column("#")
+        gap_table.add_column("Control")
+        gap_table.add_column("Status")
+        gap_table.add_column("Domain")
+        gap_table.add_column("Priority")
+        for idx, gap in enumerate(gaps, start=1):
+            gap_table.add_row(str(idx), gap["control"], gap["status"], gap["domain"], f"{gap['priority']:.2f}")
+        console.print(gap_table)
+
 
 @app.command()
 def score(
@@ -115,26 +379,31 @@ def score(
 ) -> None:
     """Calculate and print a weighted risk score (manual mode)."""
     total = implemented + partial + missing
-    if total == 0:
+    if total == 0 and not output.machine():
         console.print("[yellow]No controls provided.[/yellow]")
         raise typer.Exit()
 
-    weighted_risk = ((partial * 5) + (missing * 10)) / (total * 10) * 100
-    if weighted_risk < 25:
-        level = "low"
-        color = "green"
-    elif weighted_risk < 50:
-        level = "medium"
-        color = "yellow"
-    elif weighted_risk < 75:
-        level = "high"
-        color = "orange3"
-    else:
-        level = "critical"
-        color = "red"
+    weighted = weighted_risk(implemented, partial, missing)
+    level = risk_level(weighted)
+    color = RISK_COLORS[level]
+
+    if output.machine():
+        writer = _records()
+        writer.emit(
+            "score",
+            framework=framework,
+            risk_score=round(weighted, 2),
+            risk_level=level,
+            implemented=implemented,
+            partial=partial,
+            missing=missing,
+            controls_total=total,
+        )
+        writer.close()
+        return
 
     console.print(f"Framework: [bold]{framework}[/bold]")
-    console.print(f"Risk Score: [bold {color}]{weighted_risk:.2f}%[/bold {color}]")
+    console.print(f"Risk Score: [bold {color}]{weighted:.2f}%[/bold {color}]")
     console.print(f"Risk Level: [bold {color}]{level.upper()}[/bold {color}]")
 
 
@@ -147,7 +416,7 @@ def export_csv(
 ) -> None:
     """Export assessment control statuses to CSV."""
     out = export_assessment_csv(assessment_file, output_csv)
-    console.print(f"[green]Exported CSV[/green] {out}")
+    _done(f"[green]Exported CSV[/green] {out}", "file", path=str(out), format="csv")
 
 
 @app.command()
@@ -156,35 +425,57 @@ def import_csv(
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
 ) -> None:
     """Import assessment control statuses from CSV."""
-    import_assessment_csv(input_csv, assessment_file)
-    console.print(f"[green]Imported CSV[/green] {input_csv} -> {assessment_file}")
+    try:
+        import_assessment_csv(input_csv, assessment_file)
+    except LockTimeout as exc:
+        _fail(f"[red]{exc}[/red]", output.EXIT_UNAVAILABLE)
+    _done(
+        f"[green]Imported CSV[/green] {input_csv} -> {assessment_file}",
+        "file",
+        path=assessment_file,
+        format="json",
+        source=input_csv,
+    )
 
 
 @app.command()
 def report(
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
-    output: str = typer.Option("compliance-report.md", help="Report output file."),
+    output_file: str = typer.Option(
+        "compliance-report.md", "--output", callback=_file_not_mode, help="Report output file."
+    ),
     format: str = typer.Option("md", help="Report format: md|pdf"),
     org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+    top: int = typer.Option(DEFAULT_TOP, "--top", min=1, help="Number of prioritized gaps/actions to show."),
+    weights_file: Optional[str] = typer.Option(None, "--weights", help="JSON file overriding priority weights."),
+    watch: bool = typer.Option(False, "--watch", help="Rewrite the report whenever the assessment file changes."),
+    debounce: float = typer.Option(DEFAULT_DEBOUNCE, min=0.0, help="Seconds of quiet before a --watch rewrite."),
 ) -> None:
     """Generate compliance report (Markdown/PDF)."""
-    data = summarize_all(assessment_file, org_type=org_type, transport=transport, server_command=server_command)
+    weights = _priority_weights(weights_file)
     fmt = format.lower().strip()
-    if fmt == "md":
-        out = write_markdown_report(output, data)
-    elif fmt == "pdf":
-        try:
-            out = write_pdf_report(output, data)
-        except RuntimeError as exc:
-            console.print(f"[red]{exc}[/red]")
-            console.print("Install optional dependency: pip install reportlab")
-            raise typer.Exit(code=2)
-    else:
-        console.print("[red]format must be md or pdf[/red]")
-        raise typer.Exit(code=1)
-    console.print(f"[green]Report written[/green] {out}")
+    if fmt not in ("md", "pdf"):
+        _fail("[red]format must be md or pdf[/red]")
+    options = dict(org_type=org_type, transport=transport, server_command=server_command, top=top, weights=weights)
+    state: Dict[str, Any] = {}
+
+    def render(changed: List[str]) -> None:
+        data = _resummarize(state.get("data"), changed, assessment_file, **options)
+        if data == state.get("data"):
+            return
+        if fmt == "md":
+            out = write_markdown_report(output_file, data)
+        else:
+            try:
+                out = write_pdf_report(output_file, data)
+            except RuntimeError as exc:
+                _fail(f"[red]{exc}[/red]", output.EXIT_UNAVAILABLE, ["Install optional dependency: pip install reportlab"])
+        state["data"] = data
+        _done(f"[green]Report written[/green] {out}", "file", path=str(out), format=fmt)
+
+    _run_watched(assessment_file, list(SUPPORTED_FRAMEWORKS), render, watch, debounce)
 
 
 
@@ -196,16 +487,22 @@ def validate_assessment_cmd(
     """Validate assessment schema and status values."""
     path = Path(assessment_file)
     if not path.exists():
-        console.print(f"[red]File not found:[/red] {assessment_file}")
-        raise typer.Exit(code=1)
+        _fail(f"[red]File not found:[/red] {assessment_file}")
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_assessment_document(path)
     except Exception as exc:
-        console.print(f"[red]Invalid JSON:[/red] {exc}")
-        raise typer.Exit(code=1)
+        _fail(f"[red]Invalid JSON:[/red] {exc}")
 
     errors = validate_assessment(data)
+    if output.machine():
+        writer = _records()
+        writer.emit("validation", file=assessment_file, valid=not errors, errors=errors)
+        writer.close()
+        if errors:
+            raise typer.Exit(code=output.EXIT_INVALID)
+        return
+
     if errors:
         console.print("[red]Assessment invalid:[/red]")
         for e in errors:
@@ -224,13 +521,26 @@ def diff_cmd(
     p_old = Path(old_file)
     p_new = Path(new_file)
     if not p_old.exists() or not p_new.exists():
-        console.print("[red]Both --old-file and --new-file must exist[/red]")
-        raise typer.Exit(code=1)
+        _fail("[red]Both --old-file and --new-file must exist[/red]")
 
-    old = json.loads(p_old.read_text(encoding="utf-8"))
-    new = json.loads(p_new.read_text(encoding="utf-8"))
+    old = read_assessment_document(p_old)
+    new = read_assessment_document(p_new)
     out = compare_assessments(old, new)
 
+    if output.machine():
+        writer = _records(
+            old_file=old_file,
+            new_file=new_file,
+            improved=len(out["improved"]),
+            regressed=len(out["regressed"]),
+            unchanged=out["unchanged_count"],
+        )
+        for direction in ("improved", "regressed"):
+            for row in out[direction]:
+                writer.emit("change", direction=direction, **row)
+        writer.close()
+        return
+
     console.print(f"Improved: [green]{len(out['improved'])}[/green]")
     console.print(f"Regressed: [red]{len(out['regressed'])}[/red]")
     console.print(f"Unchanged: {out['unchanged_count']}")
@@ -251,72 +561,221 @@ def export_bundle(
     assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
     output_dir: str = typer.Option("bundle", help="Output directory."),
     org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+    watch: bool = typer.Option(False, "--watch", help="Re-export affected files whenever the assessment changes."),
+    debounce: float = typer.Option(DEFAULT_DEBOUNCE, min=0.0, help="Seconds of quiet before a --watch re-export."),
 ) -> None:
     """Export CSV + Markdown (+PDF if available) into one folder."""
     outdir = Path(output_dir)
     outdir.mkdir(parents=True, exist_ok=True)
-
     csv_path = outdir / "assessment.csv"
-    export_assessment_csv(assessment_file, str(csv_path))
-
-    data = summarize_all(assessment_file, org_type=org_type, transport=transport, server_command=server_command)
     md_path = outdir / "compliance-report.md"
-    write_markdown_report(md_path, data)
+    pdf_path = outdir / "compliance-report.pdf"
+    options = dict(org_type=org_type, transport=transport, server_command=server_command)
+    state: Dict[str, Any] = {}
+
+    def render(changed: List[str]) -> None:
+        # The CSV mirrors statuses; the reports only change when a summary does.
+        written = [(csv_path, "csv")]
+        export_assessment_csv(assessment_file, str(csv_path))
+        data = _resummarize(state.get("data"), changed, assessment_file, **options)
+        pdf_msg = "(skipped)"
+        if data != state.get("data"):
+            write_markdown_report(md_path, data)
+            written.append((md_path, "md"))
+            try:
+                write_pdf_report(pdf_path, data)
+                written.append((pdf_path, "pdf"))
+                pdf_msg = str(pdf_path)
+            except RuntimeError:
+                pass
+            state["data"] = data
+        elif pdf_path.exists():
+            pdf_msg = "(unchanged)"
+
+        if output.machine():
+            writer = _records(output_dir=str(outdir))
+            for path, fmt in written:
+                writer.emit("file", path=str(path), format=fmt)
+            writer.close()
+            return
+
+        console.print(f"[green]Bundle exported[/green] {outdir}")
+        console.print(f" - CSV: {csv_path}")
+        console.print(f" - MD:  {md_path if (md_path, 'md') in written else '(unchanged)'}")
+        console.print(f" - PDF: {pdf_msg}")
+
+    _run_watched(assessment_file, list(SUPPORTED_FRAMEWORKS), render, watch, debounce)
+
+
+
+
+@app.command("export-columnar")
+def export_columnar(
+    assessment_file: List[str] = typer.Option(
+        ["assessment.json"], help="Assessment JSON; repeat to export several (named after the file)."
+    ),
+    output_file: str = typer.Option(
+        "", "--output", callback=_file_not_mode, help="Output file (default: assessment.<format>)."
+    ),
+    format: str = typer.Option("auto", help="auto|parquet|arrow|ccol (auto: parquet with pyarrow, else ccol)."),
+    org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
+    server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+) -> None:
+    """Export control status, domain and framework risk as a dictionary-encoded columnar file."""
+    from .columnar import FORMATS, build_columns, default_format, format_of, write_columnar
+
+    fmt = format.lower().strip()
+    if fmt == "auto":
+        fmt = format_of(output_file) if output_file else None
+        fmt = fmt or default_format()
+    if fmt not in FORMATS:
+        _fail(f"[red]format must be auto or one of: {'|'.join(FORMATS)}[/red]")
+    target = output_file or f"assessment.{fmt}"
+
+    def units():
+        for path in assessment_file:
+            yield document_stem(path), summarize_all(
+                path, org_type=org_type, transport=transport, server_command=server_command
+            )
 
-    pdf_msg = "(skipped)"
     try:
-        pdf_path = outdir / "compliance-report.pdf"
-        write_pdf_report(pdf_path, data)
-        pdf_msg = str(pdf_path)
-    except RuntimeError:
-        pass
+        columns = build_columns(units())
+        out = write_columnar(target, columns, fmt)
+    except MCPUnavailableError as exc:
+        _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
+    except RuntimeError as exc:
+        _fail(f"[red]{exc}[/red]", output.EXIT_UNAVAILABLE, ["Install optional dependency: pip install pyarrow"])
+    rows = len(columns["risk_score"])
+    _done(f"[green]Columnar export written[/green] {out} ({rows} rows, {fmt})", "file", path=str(out), format=fmt, rows=rows)
+
+
+@app.command()
+def plan(
+    assessment_file: List[str] = typer.Option(
+        ["assessment.json"], help="Assessment JSON; repeat once per business unit (named after the file)."
+    ),
+    output_file: str = typer.Option(
+        "remediation-plan.md", "--output", callback=_file_not_mode, help="Plan output file."
+    ),
+    format: str = typer.Option("md", help="Plan format: md|csv|json"),
+    capacity: str = typer.Option("20", help="Person-days per window: one value or three (30,60,90 days)."),
+    efforts: Optional[str] = typer.Option(None, help="Effort estimates (JSON or CSV) in person-days per control."),
+    weights_file: Optional[str] = typer.Option(None, "--weights", help="JSON file overriding priority weights."),
+    org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
+    server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+) -> None:
+    """Generate a capacity-constrained 30/60/90 day remediation plan from current gaps."""
+    from .planning import WINDOWS, collect_gaps, load_efforts, schedule, write_plan
+
+    fmt = format.lower().strip()
+    if fmt not in {"md", "csv", "json"}:
+        _fail("[red]format must be md, csv or json[/red]")
+    try:
+        capacities = [float(part) for part in capacity.split(",")]
+    except ValueError:
+        _fail(f"[red]Invalid capacity:[/red] {capacity}")
+    if len(capacities) == 1:
+        capacities *= len(WINDOWS)
+    if len(capacities) != len(WINDOWS) or any(c < 0 for c in capacities):
+        _fail(f"[red]capacity needs 1 or {len(WINDOWS)} non-negative values[/red]")
+
+    weights = _priority_weights(weights_file)
+    try:
+        estimates = load_efforts(efforts)
+    except (OSError, ValueError, KeyError) as exc:
+        _fail(f"[red]Invalid effort estimates:[/red] {exc}")
 
-    console.print(f"[green]Bundle exported[/green] {outdir}")
-    console.print(f" - CSV: {csv_path}")
-    console.print(f" - MD:  {md_path}")
-    console.print(f" - PDF: {pdf_msg}")
+    gaps = []
+    for path in assessment_file:
+        unit = document_stem(path) if len(assessment_file) > 1 else ""
+        try:
+            data = summarize_all(path, org_type=org_type, transport=transport, server_command=server_command)
+        except MCPUnavailableError as exc:
+            _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
+        gaps.extend(collect_gaps(data, load_assessment(path), unit, weights, estimates))
 
+    result = schedule(gaps, capacities)
+    out = write_plan(output_file, result, fmt)
+    if output.machine():
+        writer = _records(path=str(out), format=fmt, scheduled=result["scheduled"], backlog=len(result["backlog"]))
+        for window in result["windows"]:
+            writer.emit(
+                "window",
+                **{key: window[key] for key in ("window", "label", "capacity", "effort", "risk_reduction", "priority")},
+                items=len(window["items"]),
+            )
+        writer.close()
+        return
 
+    for window in result["windows"]:
+        console.print(
+            f"{window['label']}: {len(window['items'])} gap(s), "
+            f"{window['effort']}/{window['capacity']} person-days, risk -{window['risk_reduction']} pts"
+        )
+    if result["backlog"]:
+        console.print(f"[yellow]{len(result['backlog'])} gap(s) left in backlog.[/yellow]")
+    console.print(f"[green]Plan written[/green] {out}")
 
 
 @app.command("controls")
 def controls_cmd(
     framework: str = typer.Option(..., help="Framework key (e.g., nist_csf, pci_dss)."),
     query: str = typer.Option("", help="Optional search text."),
-    transport: str = typer.Option("python", help="Transport: python|stdio"),
+    offset: int = typer.Option(0, min=0, help="Skip the first N matching controls."),
+    limit: Optional[int] = typer.Option(None, min=1, help="Show at most N controls."),
+    timeout: float = typer.Option(10.0, min=0.1, help="Seconds to wait for MCP before using the local catalog."),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
     server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
 ) -> None:
     """Browse control requirements from MCP service (with local fallback)."""
     fw = framework.lower().strip()
 
-    rows = []
-    all_fw = []
     source = "mcp"
     try:
-        all_fw = list_requirement_frameworks(transport=transport, server_command=server_command)
-        if fw not in all_fw:
-            console.print(f"[red]Unsupported framework:[/red] {framework}")
-            console.print(f"Available: {', '.join(all_fw)}")
-            raise typer.Exit(code=1)
-        out = get_requirements(fw, query=query, transport=transport, server_command=server_command)
-        rows = out.get("requirements", [])
-    except Exception:
+        out = fetch_requirements(
+            fw,
+            query=query,
+            offset=offset,
+            limit=limit,
+            transport=transport,
+            server_command=server_command,
+            timeout=timeout,
+        )
+        all_fw = out["frameworks"]
+        rows = out["requirements"]
+        total = out["total"]
+    except MCPUnavailableError as exc:
         # Local fallback for resilience
         source = "local-fallback"
+        _notes().print(f"[yellow]Using local catalog:[/yellow] {exc}")
         all_fw = list_frameworks()
-        if fw not in all_fw:
-            console.print(f"[red]Unsupported framework:[/red] {framework}")
-            console.print(f"Available: {', '.join(all_fw)}")
-            raise typer.Exit(code=1)
-        rows = list_controls(fw, query=query or None)
+        matched = list_controls(fw, query=query or None) if fw in all_fw else []
+        total = len(matched)
+        rows = matched[offset : None if limit is None else offset + limit]
+
+    if fw not in all_fw:
+        _fail(f"[red]Unsupported framework:[/red] {framework}", details=[f"Available: {', '.join(all_fw)}"])
+
+    if output.machine():
+        # Stream rows as-is: no rich renderable is built.
+        writer = _records(framework=fw, source=source, total=total, offset=offset, limit=limit)
+        for r in rows:
+            writer.emit("control", framework=fw, id=r["id"], domain=r["domain"], title=r["title"])
+        writer.close()
+        return
 
     if not rows:
         console.print("[yellow]No controls matched your query.[/yellow]")
         raise typer.Exit(code=0)
 
-    table = Table(title=f"{fw.upper()} Controls [{source}]")
+    title = f"{fw.upper()} Controls [{source}]"
+    if len(rows) < total:
+        title += f" {offset + 1}-{offset + len(rows)} of {total}"
+    table = Table(title=title)
     table.add_column("ID")
     table.add_column("Domain")
     table.add_column("Requirement")
@@ -325,9 +784,360 @@ def controls_cmd(
     console.print(table)
 
 
+def _parse_changes(set_: List[str], changes_file: str) -> List[Dict[str, str]]:
+    """Status changes from --set framework:control=status values and a CSV file."""
+    changes = []
+    for raw in set_:
+        fw, sep, rest = raw.partition(":")
+        control, eq, status = rest.rpartition("=")
+        if not sep or not eq or not fw.strip() or not control.strip():
+            _fail(f"[red]Invalid --set value:[/red] {raw} (expected framework:control=status)")
+        changes.append({"framework": fw.strip(), "control": control.strip(), "status": status.strip()})
+    if changes_file:
+        if not Path(changes_file).exists():
+            _fail(f"[red]File not found:[/red] {changes_file}")
+        changes.extend(read_status_rows(changes_file))
+    return changes
+
+
+@app.command("propagate")
+def propagate_cmd(
+    assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
+    set_: List[str] = typer.Option([], "--set", help="Status change as framework:control=status (repeatable)."),
+    changes_file: str = typer.Option("", help="CSV of framework,control,status changes."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview the cascaded diff without saving."),
+    allow_downgrade: bool = typer.Option(False, help="Let cascaded changes lower mapped control statuses."),
+) -> None:
+    """Apply status changes and cascade them to equivalent controls in other frameworks."""
+    changes = _parse_changes(set_, changes_file)
+    if not changes:
+        _fail("[yellow]No changes provided. Use --set or --changes-file.[/yellow]")
+
+    def apply(assessment: Dict[str, Any]) -> Dict[str, Any]:
+        return propagate_statuses(assessment, changes, dry_run=dry_run, allow_downgrade=allow_downgrade)
+
+    try:
+        out = apply(load_assessment(assessment_file)) if dry_run else update_assessment(assessment_file, apply)
+    except LockTimeout as exc:
+        _fail(f"[red]{exc}[/red]", output.EXIT_UNAVAILABLE)
+
+    if output.machine():
+        writer = _records(file=assessment_file, dry_run=dry_run, saved=not dry_run)
+        for row in out["applied"]:
+            writer.emit("change", cascaded=False, via=None, **row)
+        for row in out["cascaded"]:
+            writer.emit("change", cascaded=True, **row)
+        writer.close()
+        return
+
+    table = Table(title="Cascaded changes (dry run)" if dry_run else "Cascaded changes")
+    table.add_column("Framework")
+    table.add_column("Control")
+    table.add_column("From")
+    table.add_column("To")
+    table.add_column("Via")
+    for row in out["cascaded"]:
+        table.add_row(row["framework"], row["control"], row["from"], row["to"], row["via"])
+
+    console.print(f"Direct changes: {len(out['applied'])}")
+    if out["cascaded"]:
+        console.print(table)
+    else:
+        console.print("No equivalent controls changed.")
+
+    if not dry_run:
+        console.print(f"[green]Saved[/green] {assessment_file}")
+
+
+@app.command("whatif")
+def whatif_cmd(
+    assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
+    set_: List[str] = typer.Option([], "--set", help="Hypothetical change as framework:control=status (repeatable)."),
+    changes_file: str = typer.Option("", help="CSV of framework,control,status hypothetical changes."),
+    search: int = typer.Option(0, "--search", min=0, help="Find the N controls whose fix cuts total risk most."),
+    target: str = typer.Option("implemented", help="Status assumed for --search picks: implemented|partial."),
+    framework: List[str] = typer.Option([], "--framework", help="Limit --search to these frameworks (repeatable)."),
+    propagate: bool = typer.Option(True, "--propagate/--no-propagate", help="Cascade changes to mapped controls."),
+    org_type: str = typer.Option("saas", help="Organization type for checklist generation."),
+    transport: str = typer.Option("python", help="Transport: python|stdio|memory (or a plugin)"),
+    server_command: str = typer.Option("cyber-compliance-mcp", help="MCP server command for stdio mode."),
+) -> None:
+    """Show how framework risk scores would move under hypothetical status changes."""
+    changes = _parse_changes(set_, changes_file)
+    target = target.lower().strip()
+    if target not in ("implemented", "partial"):
+        _fail("[red]--target must be implemented or partial[/red]")
+    if not changes and not search:
+        _fail("[yellow]No scenario given. Use --set, --changes-file or --search N.[/yellow]")
+
+    try:
+        data = summarize_all(assessment_file, org_type=org_type, transport=transport, server_command=server_command)
+    except MCPUnavailableError as exc:
+        _fail(f"[red]MCP unavailable:[/red] {exc}", output.EXIT_UNAVAILABLE)
+    model = WhatIf(data, propagate=propagate)
+
+    scenario = []
+    for change in changes:
+        key = model.key(change["framework"].lower(), change["control"])
+        if key is None:
+            _notes().print(f"[yellow]Not on the {change['framework']} checklist, ignored:[/yellow] {change['control']}")
+            continue
+        scenario.append((key, change["status"].lower()))
+
+    if search:
+        out = model.search(search, target=target, frameworks=[fw.lower() for fw in framework] or None)
+    else:
+        out = model.evaluate(scenario)
+
+    if output.machine():
+        meta = {"file": assessment_file, "reduction": out["reduction"]}
+        if search:
+            meta.update(method=out["method"], scenarios=out["scenarios"], seconds=round(out["seconds"], 4))
+        writer = _records(**meta)
+        for row in out["frameworks"]:
+            writer.emit("score", **row)
+        for row in out["changes"]:
+            writer.emit("change", **row)
+        writer.close()
+        return
+
+    if search:
+        picks = Table(title=f"Best {len(out['picks'])} controls to set {target} ({out['method']} search)")
+        picks.add_column("#", justify="right")
+        picks.add_column("Framework")
+        picks.add_column("Control")
+        picks.add_column("From")
+        for idx, row in enumerate(out["picks"], start=1):
+            picks.add_row(str(idx), row["framework"], row["control"], row["from"])
+        console.print(picks)
+
+    table = Table(title="What-if risk scores")
+    table.add_column("Framework")
+    table.add_column("Risk now", justify="right")
+    table.add_column("Risk after", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Level")
+    for row in out["frameworks"]:
+        level = row["level_after"]
+        moved = row["level_before"] if row["level_before"] == level else f"{row['level_before']} -> {level}"
+        table.add_row(
+            row["framework"],
+            f"{row['risk_before']:.2f}%",
+            f"{row['risk_after']:.2f}%",
+            f"{row['delta']:+.2f}",
+            f"[{RISK_COLORS[level]}]{moved}[/{RISK_COLORS[level]}]",
+        )
+    console.print(table)
+    cascaded = len(out["changes"]) - (len(out["picks"]) if search else len(scenario))
+    note = f", {cascaded} via mapped controls" if propagate and cascaded > 0 else ""
+    console.print(f"Total risk reduction: {out['reduction']:.2f} points ({len(out['changes'])} controls change{note})")
+    if search:
+        rate = out["scenarios"] / out["seconds"] if out["seconds"] else 0.0
+        console.print(f"Scored {out['scenarios']} scenarios in {out['seconds'] * 1000:.1f} ms ({rate:,.0f}/s)")
+
+
+@app.command("query")
+def query_cmd(
+    where: str = typer.Option(
+        "", help='Filter, e.g. "status:missing control:PR.AA-01" or "domain:detect status:partial unit:pay*".'
+    ),
+    assessment_file: List[str] = typer.Option(
+        ["assessment.json"], help="Assessment JSON; repeat once per business unit (named after the file)."
+    ),
+    limit: Optional[int] = typer.Option(None, min=1, help="Show at most N matching controls."),
+) -> None:
+    """Find controls by framework, control ID/prefix, domain, status and unit across assessments."""
+    from .query import QueryIndex, parse_query
+
+    missing = [path for path in assessment_file if not Path(path).is_file()]
+    if missing:
+        _fail(f"[red]File not found:[/red] {', '.join(missing)}")
+    try:
+        parse_query(where)
+    except ValueError as exc:
+        _fail(f"[red]Invalid query:[/red] {exc}")
+
+    index = QueryIndex(assessment_file)
+    rows = index.search(where)
+    shown = rows[:limit] if limit else rows
+
+    if output.machine():
+        writer = _records(where=where, matches=len(rows), units=len(index.units), indexes=index.sources)
+        for row in shown:
+            writer.emit("control", **row)
+        writer.close()
+        return
+
+    if not rows:
+        console.print("No matching controls.")
+        return
+    colors = {"implemented": "green", "partial": "yellow", "missing": "red"}
+    multi_unit = len(index.units) > 1
+    table = Table(title=f"{len(rows)} matching control(s)" + (f", first {len(shown)}" if len(shown) < len(rows) else ""))
+    if multi_unit:
+        table.add_column("Unit")
+    table.add_column("Framework")
+    table.add_column("Control")
+    table.add_column("Domain")
+    table.add_column("Status")
+    for row in shown:
+        color = colors[row["status"]]
+        status = f"[{color}]{row['status']}[/{color}]" + ("" if row["assessed"] else " (unassessed)")
+        cells = [row["framework"], row["control"], row["domain"], status]
+        table.add_row(*([row["unit"]] if multi_unit else []) + cells)
+    console.print(table)
+    if multi_unit:
+        units = sorted({row["unit"] for row in rows})
+        console.print(f"Units: {', '.join(units)}")
+
+
+@app.command("add-evidence")
+def add_evidence_cmd(
+    framework: str = typer.Option(..., help="Framework key (e.g., nist_csf)."),
+    control: str = typer.Option(..., help="Control name as used in the assessment statuses."),
+    file: List[str] = typer.Option(..., "--file", help="Evidence file to attach (repeatable)."),
+    assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
+    store: str = typer.Option("", help="Evidence store directory (default: .evidence next to the assessment)."),
+) -> None:
+    """Copy evidence files into the content-addressed store and reference them from a control."""
+    missing = [path for path in file if not Path(path).is_file()]
+    if missing:
+        _fail(f"[red]File not found:[/red] {', '.join(missing)}")
+
+    root = store_dir(assessment_file, store)
+    fw = framework.lower().strip()
+    # Copy and hash before taking the lock; only the reference update runs under it.
+    stored = [store_evidence(path, root) for path in file]
+    try:
+        refs = update_assessment(assessment_file, lambda a: [attach_evidence(a, fw, control, ref) for ref in stored])
+    except LockTimeout as exc:
+        _fail(f"[red]{exc}[/red]", output.EXIT_UNAVAILABLE)
+
+    if output.machine():
+        writer = _records(file=assessment_file, store=str(root))
+        for ref in refs:
+            writer.emit("evidence", framework=fw, control=control, **ref)
+        writer.close()
+        return
+    for ref in refs:
+        console.print(f"[green]Attached[/green] {ref['name']} ({ref['sha256'][:12]}) to {fw}:{control}")
+
+
+@app.command("verify-evidence")
+def verify_evidence_cmd(
+    assessment_file: str = typer.Option("assessment.json", help="Path to assessment JSON."),
+    store: str = typer.Option("", help="Evidence store directory (default: .evidence next to the assessment)."),
+    workers: int = typer.Option(DEFAULT_WORKERS, min=1, help="Files hashed in parallel."),
+    full: bool = typer.Option(False, "--full", help="Re-hash every file, ignoring the stat cache."),
+) -> None:
+    """Re-hash stored evidence whose size or mtime changed; report missing, corrupt, unreadable or invalid entries."""
+    assessment = load_assessment(assessment_file)
+    out = verify_evidence(assessment, store_dir(assessment_file, store), workers=workers, full=full)
+    counts = out["counts"]
+    failed = len(out["results"]) - counts["ok"]
+
+    if output.machine():
+        writer = _records(file=assessment_file, hashed=out["hashed"], cached=out["cached"], **counts)
+        for row in out["results"]:
+            writer.emit("evidence", **row)
+        writer.close()
+        if failed:
+            raise typer.Exit(code=output.EXIT_INVALID)
+        return
+
+    colors = {"ok": "green", "missing": "yellow", "corrupt": "red", "invalid": "red", "unreadable": "red"}
+    table = Table(title="Evidence verification")
+    table.add_column("Framework")
+    table.add_column("Control")
+    table.add_column("File")
+    table.add_column("SHA-256")
+    table.add_column("Status")
+    for row in out["results"]:
+        if row["status"] != "ok" or len(out["results"]) <= 50:
+            color = colors[row["status"]]
+            table.add_row(
+                row["framework"],
+                row["control"],
+                row["name"],
+                str(row["sha256"])[:12],
+                f"[{color}]{row['status']}[/{color}]",
+            )
+    if table.row_count:
+        console.print(table)
+    console.print(
+        f"{counts['ok']} ok, {counts['missing']} missing, {counts['corrupt']} corrupt, {counts['invalid']} invalid, "
+        f"{counts['unreadable']} unreadable "
+        f"(hashed {out['hashed']}, unchanged {out['cached']})"
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("cache-stats")
+def cache_stats_cmd(
+    clear: bool = typer.Option(False, "--clear", help="Drop memoized summaries and reset the counters."),
+) -> None:
+    """Show the memoized summary cache: entries, size and hit/miss totals."""
+    removed = memo.clear() if clear else None
+    out = memo.stats()
+    if output.machine():
+        writer = _records(cache_dir=str(cache_dir()), cleared=removed)
+        writer.emit("cache", **{k: v for k, v in out.items() if k != "session"})
+        writer.close()
+        return
+    if removed is not None:
+        console.print(f"[green]Cleared[/green] {removed} memoized summaries")
+    rate = "n/a" if out["hit_rate"] is None else f"{out['hit_rate']:.0%}"
+    console.print(
+        f"Summary cache {cache_dir()}: {out['entries']} entries ({out['bytes'] / 1024:.0f} KiB), "
+        f"{out['hits']} hits, {out['misses']} misses (hit rate {rate})"
+    )
+
+
+@app.command("serve")
+def serve_cmd(
+    socket_file: str = typer.Option("", "--socket", help="Unix socket path (default: user cache dir)."),
+    stop: bool = typer.Option(False, "--stop", help="Stop a running daemon."),
+    status: bool = typer.Option(False, "--status", help="Report whether a daemon is running."),
+) -> None:
+    """Run a local daemon that keeps MCP sessions and caches warm for CLI calls."""
+    from .client import send_request, socket_path
+
+    path = Path(socket_file) if socket_file else socket_path()
+    running = send_request({"op": "ping"}, path=path, timeout=2.0)
+
+    if status:
+        if running:
+            console.print(f"[green]Daemon running[/green] pid={running.get('pid')} socket={path}")
+        else:
+            console.print(f"[yellow]No daemon listening on[/yellow] {path}")
+        return
+
+    if stop:
+        if not running:
+            console.print(f"[yellow]No daemon listening on[/yellow] {path}")
+            return
+        send_request({"op": "shutdown"}, path=path, timeout=2.0)
+        console.print(f"[green]Daemon stopped[/green] {path}")
+        return
+
+    if running:
+        _fail(f"[red]Daemon already running[/red] pid={running.get('pid')} socket={path}")
+
+    from .daemon import serve
+
+    console.print(f"[green]Serving[/green] on {path} (Ctrl+C to stop)")
+    try:
+        serve(path)
+    except KeyboardInterrupt:
+        pass
+
+
 @app.command("init-assessment")
 def init_assessment(
-    output: str = typer.Option("assessment.json", help="Where to write starter assessment file."),
+    output_file: str = typer.Option(
+        "assessment.json", "--output", callback=_file_not_mode, help="Where to write starter assessment file."
+    ),
 ) -> None:
     """Create starter assessment.json for live dashboard data."""
     template = {
@@ -339,8 +1149,11 @@ def init_assessment(
         }
     }
 
-    path = Path(output)
-    path.write_text(json.dumps(template, indent=2), encoding="utf-8")
+    path = Path(output_file)
+    save_assessment(path, template)
+    if output.machine():
+        _done("", "file", path=str(path), format="json")
+        return
     console.print(f"[green]Created[/green] {path}")
     console.print("Fill statuses with implemented|partial|missing and rerun dashboard.")
 
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .data.control_mappings import CONTROL_MAPPINGS, CONTROL_TITLES
+from .mcp_client import VALID_STATUSES, set_control_status
+
+ControlKey = Tuple[str, str]
+Edge = Tuple[str, str, float]
+
+STATUS_RANK = {"missing": 0, "partial": 1, "implemented": 2}
+
+
+def control_id(control: str) -> str:
+    """Return the identifier part of a control name ("PR.AA-01 Identity..." -> "PR.AA-01")."""
+    return control.strip().split(" ", 1)[0]
+
+
+def build_mapping_index(
+    edges: Iterable[Tuple[str, str, str, str, float]] = CONTROL_MAPPINGS,
+) -> Dict[ControlKey, List[Edge]]:
+    """Build an adjacency index: (framework, control id) -> [(framework, control id, coverage)]."""
+    index: Dict[ControlKey, List[Edge]] = {}
+    for fw_a, id_a, fw_b, id_b, coverage in edges:
+        index.setdefault((fw_a, id_a), []).append((fw_b, id_b, coverage))
+        index.setdefault((fw_b, id_b), []).append((fw_a, id_a, coverage))
+    return index
+
+
+@lru_cache(maxsize=1)
+def mapping_index() -> Dict[ControlKey, List[Edge]]:
+    return build_mapping_index()
+
+
+def equivalent_controls(framework: str, control: str) -> List[Dict[str, Any]]:
+    return [
+        {"framework": fw, "control_id": cid, "coverage": coverage}
+        for fw, cid, coverage in mapping_index().get((framework, control_id(control)), [])
+    ]
+
+
+def cascaded_status(status: str, coverage: float) -> str:
+    """Status implied on a mapped control; partial coverage caps at "partial"."""
+    if coverage >= 1.0 or status == "missing":
+        return status
+    return "partial"
+
+
+class _NameResolver:
+    """Lazily map control ids to the full control names already used per framework."""
+
+    def __init__(self, assessment: Dict[str, Any], known_controls: Optional[Dict[str, List[str]]]) -> None:
+        self.assessment = assessment
+        self.known_controls = known_controls or {}
+        self._by_fw: Dict[str, Dict[str, str]] = {}
+
+    def resolve(self, framework: str, cid: str) -> str:
+        names = self._by_fw.get(framework)
+        if names is None:
+            names = {}
+            statuses = self.assessment.get("frameworks", {}).get(framework, {}).get("statuses", {})
+            for name in list(statuses) + list(self.known_controls.get(framework, [])):
+                names.setdefault(control_id(name), name)
+            self._by_fw[framework] = names
+        name = names.get(cid)
+        if name is None:
+            title = CONTROL_TITLES.get((framework, cid))
+            name = f"{cid} {title}" if title else cid
+            names[cid] = name
+        return name
+
+
+def propagate_statuses(
+    assessment: Dict[str, Any],
+    changes: List[Dict[str, str]],
+    dry_run: bool = False,
+    allow_downgrade: bool = False,
+    known_controls: Optional[Dict[str, List[str]]] = None,
+    index: Optional[Dict[ControlKey, List[Edge]]] = None,
+) -> Dict[str, Any]:
+    """Apply status changes and cascade them one hop to mapped controls.
+
+    Runs in O(changes x fan-out). Mapped controls are only upgraded unless
+    allow_downgrade is set, and explicit changes always win over cascaded ones.
+    With dry_run the assessment is left untouched and only the diff is returned.
+    """
+    graph = index if index is not None else mapping_index()
+    resolver = _NameResolver(assessment, known_controls)
+    frameworks = assessment.get("frameworks", {})
+
+    def current(fw: str, name: str) -> str:
+        status = str(frameworks.get(fw, {}).get("statuses", {}).get(name, "missing")).lower()
+        return status if status in VALID_STATUSES else "missing"
+
+    applied: List[Dict[str, str]] = []
+    explicit: Dict[ControlKey, str] = {}
+    for change in changes:
+        fw = change["framework"]
+        status = str(change["status"]).lower().strip()
+        if status not in VALID_STATUSES:
+            status = "missing"
+        name = change["control"]
+        explicit[(fw, control_id(name))] = status
+        applied.append({"framework": fw, "control": name, "from": current(fw, name), "to": status})
+
+    planned: Dict[ControlKey, Dict[str, str]] = {}
+    for row in applied:
+        for fw, cid, coverage in graph.get((row["framework"], control_id(row["control"])), []):
+            if (fw, cid) in explicit:
+                continue
+            name = resolver.resolve(fw, cid)
+            target = cascaded_status(row["to"], coverage)
+            before = current(fw, name)
+            prev = planned.get((fw, cid))
+            proposed = prev["to"] if prev else before
+            if STATUS_RANK[target] == STATUS_RANK[proposed]:
+                continue
+            if STATUS_RANK[target] < STATUS_RANK[proposed] and not allow_downgrade:
+                continue
+            planned[(fw, cid)] = {
+                "framework": fw,
+                "control": name,
+                "from": before,
+                "to": target,
+                "via": f"{row['framework']}:{control_id(row['control'])}",
+            }
+
+    cascaded = [row for row in planned.values() if row["from"] != row["to"]]
+
+    if not dry_run:
+        for row in applied + cascaded:
+            set_control_status(assessment, row["framework"], row["control"], row["to"])
+
+    return {"applied": applied, "cascaded": cascaded, "dry_run": dry_run}
@@ -1,13 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import importlib
 import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import anyio
+import anyio.from_thread
+
+from . import resilience
+from .cache import SIBLING_CHECKOUT, read_cache, server_fingerprint, write_cache
+from .codec import load_document, loads, save_document
+from .concurrency import DEFAULT_LOCK_TIMEOUT, file_lock, merge_assessments
+from .data.control_mappings import CONTROL_TITLES
+from .data.framework_catalog import list_controls, list_frameworks
+from .scoring import STATUS_SLOTS, domain_rollup, score_controls
+from .transports import DirectTransport, SessionTransport, Transport, get_transport, register_transport
+
+T = TypeVar("T")
 
 SUPPORTED_FRAMEWORKS = ["nist_csf", "iso27001", "soc2", "cis_v8"]
 VALID_STATUSES = {"implemented", "partial", "missing"}
+# Bumped on every save; writers that started from an older revision merge instead of overwrite.
+REVISION_KEY = "revision"
 
 ERROR_HINTS = {
     "INVALID_FRAMEWORK": "Use one of: nist_csf, iso27001, soc2, cis_v8.",
@@ -55,31 +90,25 @@ def _unwrap_result(result: Dict[str, Any], context: str) -> Dict[str, Any]:
     return result
 
 
-def _import_mcp_tools():
-    try:
-        from cyber_compliance_mcp.core import (  # type: ignore
-            calculate_risk_score,
-            generate_checklist,
-            recommend_next_actions,
-        )
+_SIBLING_CHECKOUT = SIBLING_CHECKOUT
+
 
-        return calculate_risk_score, generate_checklist, recommend_next_actions
+def _import_mcp_module(module: str) -> Any:
+    """Import a cyber_compliance_mcp module, falling back to a sibling checkout.
+
+    The sibling directory is added to sys.path at most once per process.
+    """
+    try:
+        return importlib.import_module(module)
     except Exception:
         pass
 
-    import sys
-
-    sibling = Path(__file__).resolve().parents[2] / "cyber-compliance-mcp"
-    if sibling.exists():
-        sys.path.insert(0, str(sibling))
+    if _SIBLING_CHECKOUT.exists():
+        entry = str(_SIBLING_CHECKOUT)
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
         try:
-            from cyber_compliance_mcp.core import (  # type: ignore
-                calculate_risk_score,
-                generate_checklist,
-                recommend_next_actions,
-            )
-
-            return calculate_risk_score, generate_checklist, recommend_next_actions
+            return importlib.import_module(module)
         except Exception as exc:
             raise MCPUnavailableError(f"Could not import MCP tools: {exc}") from exc
 
@@ -88,7 +117,13 @@ def _import_mcp_tools():
     )
 
 
-async def _call_tool_stdio(server_command: str, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+def _import_mcp_tools():
+    core = _import_mcp_module("cyber_compliance_mcp.core")
+    return core.calculate_risk_score, core.generate_checklist, core.recommend_next_actions
+
+
+@asynccontextmanager
+async def _stdio_session(server_command: str) -> AsyncIterator[Any]:
     from mcp import ClientSession
     from mcp.client.stdio import StdioServerParameters, stdio_client
 
@@ -96,49 +131,488 @@ async def _call_tool_stdio(server_command: str, tool_name: str, arguments: Dict[
     async with stdio_client(server) as (read_stream, write_stream):
         async with ClientSession(read_stream, write_stream) as session:
             await session.initialize()
-            result = await session.call_tool(tool_name, arguments)
+            yield session
+
+
+def _text_blocks(result: Any) -> List[str]:
+    return [block.text for block in result.content or [] if getattr(block, "type", None) == "text"]
+
+
+def _decode_result(result: Any, tool_name: str) -> Dict[str, Any]:
+    """Payload of a CallToolResult, read from its fields without dumping the whole model.
+
+    Structured content is used as-is when the server sends it. Otherwise the text blocks
+    are joined, since servers may split one JSON document across several, and parsed once;
+    blocks that are separate JSON objects are merged in order.
+    """
+    if getattr(result, "isError", False):
+        detail = " ".join(_text_blocks(result))[:200]
+        raise MCPUnavailableError(f"MCP tool call failed: {tool_name}" + (f": {detail}" if detail else ""))
+
+    structured = getattr(result, "structuredContent", None)
+    if isinstance(structured, dict):
+        # FastMCP wraps non-object return values (e.g. a JSON string) as {"result": value}.
+        if structured.keys() != {"result"}:
+            return _unwrap_result(structured, tool_name)
+        if isinstance(structured["result"], dict):
+            return _unwrap_result(structured["result"], tool_name)
+
+    texts = _text_blocks(result)
+    if not texts:
+        return {}
+    try:
+        parsed = loads(texts[0] if len(texts) == 1 else "".join(texts))
+    except ValueError as exc:
+        if len(texts) == 1:
+            raise MCPUnavailableError(f"{tool_name} returned malformed JSON: {exc}") from exc
+        parsed = {}
+        for text in texts:
+            try:
+                block = loads(text)
+            except ValueError:
+                raise MCPUnavailableError(f"{tool_name} returned malformed JSON: {exc}") from exc
+            if not isinstance(block, dict):
+                raise MCPUnavailableError(f"{tool_name} returned non-object content blocks") from exc
+            parsed.update(block)
+    return _unwrap_result(parsed, tool_name)
+
 
-            dumped = result.model_dump()
-            if dumped.get("isError"):
-                raise MCPUnavailableError(f"MCP tool call failed: {tool_name}")
+async def _call_session_tool(session: Any, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return _decode_result(await session.call_tool(tool_name, arguments), tool_name)
 
-            content = dumped.get("content", [])
-            if not content:
-                return {}
 
-            text = content[0].get("text", "{}")
-            parsed = json.loads(text)
-            return _unwrap_result(parsed, tool_name)
+DEFAULT_MEMORY_SERVER = "cyber_compliance_mcp.server:mcp"
 
 
-def _toolset(transport: str = "python", server_command: str = "cyber-compliance-mcp"):
-    if transport == "python":
-        calculate_risk_score, generate_checklist, recommend_next_actions = _import_mcp_tools()
+@asynccontextmanager
+async def _memory_session(server_command: str) -> AsyncIterator[Any]:
+    """Drive the real server object over in-memory streams (no subprocess).
 
-        def _calc(controls: List[dict]) -> dict:
-            return _unwrap_result(calculate_risk_score(controls), "calculate_risk_score")
+    server_command is a "module:attribute" spec; the stdio default maps to
+    cyber_compliance_mcp.server:mcp.
+    """
+    from mcp.shared.memory import create_connected_server_and_client_session
 
-        def _check(framework: str, org_type: str = "saas") -> dict:
-            return _unwrap_result(generate_checklist(framework, org_type), "generate_checklist")
+    spec = server_command if ":" in server_command else DEFAULT_MEMORY_SERVER
+    module_name, _, attr = spec.partition(":")
+    server = getattr(_import_mcp_module(module_name), attr or "mcp", None)
+    if server is None:
+        raise MCPUnavailableError(f"No MCP server object at {spec}")
+    async with create_connected_server_and_client_session(server) as session:
+        yield session
 
-        def _rec(framework: str, gaps: List[str]) -> dict:
-            return _unwrap_result(recommend_next_actions(framework, gaps), "recommend_next_actions")
 
-        return _calc, _check, _rec
+class PythonTransport(DirectTransport):
+    """Call cyber_compliance_mcp functions in-process, without the MCP protocol."""
+
+    name = "python"
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, Callable[..., Dict[str, Any]]] = {}
+
+    def tool(self, tool_name: str) -> Callable[..., Dict[str, Any]]:
+        if tool_name not in self._tools:
+            if tool_name in {"get_requirements", "list_requirement_frameworks"}:
+                req_tool, list_tool = _import_requirements_tools()
+                self._tools.update(get_requirements=req_tool, list_requirement_frameworks=list_tool)
+            else:
+                calculate_risk_score, generate_checklist, recommend_next_actions = _import_mcp_tools()
+                self._tools.update(
+                    calculate_risk_score=calculate_risk_score,
+                    generate_checklist=generate_checklist,
+                    recommend_next_actions=recommend_next_actions,
+                )
+        fn = self._tools.get(tool_name)
+        if fn is None:
+            raise MCPUnavailableError(f"Unknown MCP tool: {tool_name}")
+        return fn
+
+    async def call(self, tool_name: str, arguments: Dict[str, Any], server_command: str) -> Dict[str, Any]:
+        # Python tools take the MCP arguments as keyword arguments of the same names.
+        return _unwrap_result(self.tool(tool_name)(**arguments), tool_name)
+
+
+class StdioTransport(SessionTransport):
+    """Spawn the MCP server as a subprocess and talk to it over stdio."""
+
+    name = "stdio"
+
+    def open_session(self, server_command: str) -> AsyncContextManager[Any]:
+        return _stdio_session(server_command)
+
+
+class MemoryTransport(SessionTransport):
+    """Full MCP protocol against the in-process server object over memory streams."""
+
+    name = "memory"
+
+    def open_session(self, server_command: str) -> AsyncContextManager[Any]:
+        return _memory_session(server_command)
+
+
+register_transport("python", PythonTransport)
+register_transport("stdio", StdioTransport)
+register_transport("memory", MemoryTransport)
+
+
+def _transport(name: str) -> Transport:
+    try:
+        transport = get_transport(name)
+    except TypeError as exc:
+        raise MCPUnavailableError(str(exc)) from exc
+    if transport is None:
+        raise MCPUnavailableError(f"Unsupported transport: {name}")
+    return transport
+
+
+async def _call_fresh(
+    transport: Transport, server_command: str, tool_name: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    if not transport.uses_sessions:
+        return await transport.call(tool_name, arguments, server_command)
+    async with transport.open_session(server_command) as session:
+        return await _call_session_tool(session, tool_name, arguments)
+
+
+class _SessionPool:
+    """Long-lived MCP sessions driven from a background event loop thread."""
+
+    def __init__(self) -> None:
+        self._portal_cm = anyio.from_thread.start_blocking_portal()
+        self._portal = self._portal_cm.__enter__()
+        self._sessions: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _session(self, transport: Transport, server_command: str) -> Any:
+        key = (transport.name, server_command)
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                cm = self._portal.wrap_async_context_manager(transport.open_session(server_command))
+                entry = (cm, cm.__enter__())
+                self._sessions[key] = entry
+            return entry[1]
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            entry = self._sessions.pop(key, None)
+        if entry is not None:
+            try:
+                entry[0].__exit__(None, None, None)
+            except Exception:
+                pass
+
+    def run(self, transport: Transport, server_command: str, call: Callable[..., Awaitable[T]]) -> T:
+        """Run an async API call with session= bound to the warm session for this server."""
+        try:
+            session = self._session(transport, server_command)
+        except Exception:
+            # Server cannot start; per-call retries and the circuit breaker take over.
+            return self._portal.call(call)
+        try:
+            return self._portal.call(functools.partial(call, session=session))
+        finally:
+            if id(session) in _BROKEN_SESSIONS:
+                _BROKEN_SESSIONS.discard(id(session))
+                self._discard((transport.name, server_command))
+
+    def close(self) -> None:
+        for key in list(self._sessions):
+            self._discard(key)
+        self._portal_cm.__exit__(None, None, None)
 
-    if transport != "stdio":
-        raise MCPUnavailableError(f"Unsupported transport: {transport}")
 
-    def _calculate_risk_score(controls: List[dict]) -> dict:
-        return anyio.run(_call_tool_stdio, server_command, "calculate_risk_score", {"controls": controls})
+_SESSION_POOL: Optional[_SessionPool] = None
+_BROKEN_SESSIONS: Set[int] = set()
+_CHECKLIST_CACHE: Optional[Dict[Tuple[str, str, str, str], Dict[str, Any]]] = None
+_DOCUMENT_CACHE: Optional[Dict[str, Tuple[Tuple[int, int], Any]]] = None
 
-    def _generate_checklist(framework: str, org_type: str = "saas") -> dict:
-        return anyio.run(_call_tool_stdio, server_command, "generate_checklist", {"framework": framework, "org_type": org_type})
 
-    def _recommend_next_actions(framework: str, gaps: List[str]) -> dict:
-        return anyio.run(_call_tool_stdio, server_command, "recommend_next_actions", {"framework": framework, "gaps": gaps})
+def enable_warm_state() -> None:
+    """Keep MCP sessions, checklists and parsed assessments warm for this process.
 
-    return _calculate_risk_score, _generate_checklist, _recommend_next_actions
+    Used by `cybersec serve`; one-shot CLI runs keep the stateless defaults.
+    """
+    global _SESSION_POOL, _CHECKLIST_CACHE, _DOCUMENT_CACHE
+    if _SESSION_POOL is None:
+        _SESSION_POOL = _SessionPool()
+    if _CHECKLIST_CACHE is None:
+        _CHECKLIST_CACHE = {}
+    if _DOCUMENT_CACHE is None:
+        _DOCUMENT_CACHE = {}
+
+
+def close_warm_state() -> None:
+    global _SESSION_POOL, _CHECKLIST_CACHE, _DOCUMENT_CACHE
+    if _SESSION_POOL is not None:
+        _SESSION_POOL.close()
+    _SESSION_POOL = None
+    _CHECKLIST_CACHE = None
+    _DOCUMENT_CACHE = None
+
+
+def _run_blocking(call: Callable[[], Awaitable[T]]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        in_loop = False
+    else:
+        in_loop = True
+    if not in_loop:
+        return anyio.run(call)
+    # Called from inside an event loop: run on a private loop in a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(anyio.run, call).result()
+
+
+async def _within_deadline(fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    deadline = resilience.policy()["deadline"]
+    if not deadline:
+        return await fn(*args, **kwargs)
+    try:
+        with anyio.fail_after(deadline):
+            return await fn(*args, **kwargs)
+    except TimeoutError as exc:
+        raise MCPUnavailableError(f"MCP deadline of {deadline}s exceeded") from exc
+
+
+def _run_sync(fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    call = functools.partial(_within_deadline, fn, *args, **kwargs)
+    transport = _transport(kwargs.get("transport", "python"))
+    if transport.uses_sessions and kwargs.get("session") is None and _SESSION_POOL is not None:
+        return _SESSION_POOL.run(transport, kwargs.get("server_command", "cyber-compliance-mcp"), call)
+    return _run_blocking(call)
+
+
+# Responses that are stable per server build and worth keeping for circuit-breaker fallback.
+_REMEMBERED_TOOLS = {"generate_checklist", "list_requirement_frameworks"}
+
+
+def _response_key(transport: Transport, server_command: str, tool_name: str, arguments: Dict[str, Any]) -> str:
+    fingerprint = server_fingerprint(transport.name, server_command)
+    return f"{fingerprint}:{tool_name}:{json.dumps(arguments, sort_keys=True)}"
+
+
+def _remember_response(
+    transport: Transport, server_command: str, tool_name: str, arguments: Dict[str, Any], result: Dict[str, Any]
+) -> None:
+    if tool_name not in _REMEMBERED_TOOLS:
+        return
+    key = _response_key(transport, server_command, tool_name, arguments)
+    if read_cache("responses", key) != result:
+        write_cache("responses", key, result)
+
+
+def _local_fallback(
+    transport: Transport, server_command: str, tool_name: str, arguments: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    if tool_name == "calculate_risk_score":
+        return score_controls(arguments.get("controls", []))
+    if tool_name in _REMEMBERED_TOOLS:
+        cached = read_cache("responses", _response_key(transport, server_command, tool_name, arguments))
+        if isinstance(cached, dict):
+            return cached
+    if tool_name == "recommend_next_actions":
+        return {"recommended_actions": []}
+    if tool_name == "generate_checklist":
+        framework = arguments.get("framework", "")
+        names = [f"{r['id']} {r['title']}" for r in list_controls(framework)]
+        if not names:
+            names = [f"{cid} {title}" for (fw, cid), title in CONTROL_TITLES.items() if fw == framework]
+        if names:
+            return {"checklist": [{"control": name, "status": "not_started"} for name in names]}
+    if tool_name == "list_requirement_frameworks":
+        return {"frameworks": list_frameworks()}
+    if tool_name == "get_requirements":
+        return {"requirements": list_controls(arguments.get("framework", ""), arguments.get("query") or None)}
+    return None
+
+
+def _breaker_key(transport: Transport, server_command: str) -> str:
+    return f"{transport.name}:{server_command}"
+
+
+def _fallback_or_raise(
+    transport: Transport,
+    server_command: str,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    reason: str,
+    exc: Optional[BaseException] = None,
+) -> Dict[str, Any]:
+    if resilience.breaker_for(_breaker_key(transport, server_command)).allow():
+        raise MCPUnavailableError(f"{tool_name} failed after retries: {reason}") from exc
+    fallback = _local_fallback(transport, server_command, tool_name, arguments)
+    if fallback is None:
+        raise MCPUnavailableError(f"{tool_name} unavailable (circuit open): {reason}") from exc
+    resilience.STATS["fallbacks"] += 1
+    return fallback
+
+
+async def _hedged(call: Callable[[bool], Awaitable[T]], fresh: bool, delay: float) -> T:
+    """Run call; if it is still pending after delay, race a second one on a fresh connection."""
+    results: List[Any] = []
+    errors: List[BaseException] = []
+    primary_done = anyio.Event()
+
+    async with anyio.create_task_group() as tg:
+
+        async def _run(use_fresh: bool) -> None:
+            try:
+                value = await call(use_fresh)
+            except Exception as exc:
+                errors.append(exc)
+                return
+            finally:
+                primary_done.set()
+            if not results:
+                results.append(value)
+                tg.cancel_scope.cancel()
+
+        tg.start_soon(_run, fresh)
+        with anyio.move_on_after(delay):
+            await primary_done.wait()
+        if not results and not errors:
+            resilience.STATS["hedges"] += 1
+            tg.start_soon(_run, True)
+
+    if results:
+        return results[0]
+    raise errors[0]
+
+
+async def _attempt_call(
+    transport: Transport,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    server_command: str,
+    session: Any,
+    fresh: bool,
+) -> Dict[str, Any]:
+    if session is not None and not fresh:
+        return await _call_session_tool(session, tool_name, arguments)
+    return await _call_fresh(transport, server_command, tool_name, arguments)
+
+
+async def _call_with_policy(
+    transport: Transport,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    server_command: str,
+    session: Any,
+) -> Dict[str, Any]:
+    """Call a read-only MCP tool with per-call timeout, retries, optional hedging and a breaker.
+
+    Retries after the first attempt use a fresh server process. Tool-level errors
+    (MCPUnavailableError) mean the server answered and are never retried.
+    """
+    settings = resilience.policy()
+    breaker = resilience.breaker_for(_breaker_key(transport, server_command))
+    if not breaker.allow():
+        return _fallback_or_raise(transport, server_command, tool_name, arguments, "circuit open")
+
+    call = functools.partial(_attempt_call, transport, tool_name, arguments, server_command, session)
+    last_exc: Optional[BaseException] = None
+    for attempt in range(settings["retries"] + 1):
+        if attempt:
+            resilience.STATS["retries"] += 1
+            await anyio.sleep(settings["backoff"] * (2 ** (attempt - 1)))
+        fresh = attempt > 0
+        resilience.STATS["calls"] += 1
+        started = time.perf_counter()
+        try:
+            with anyio.fail_after(settings["call_timeout"]):
+                delay = resilience.hedge_delay(tool_name)
+                result = await (call(fresh) if delay is None else _hedged(call, fresh, delay))
+        except MCPUnavailableError:
+            breaker.record_success()
+            raise
+        except Exception as exc:
+            if isinstance(exc, TimeoutError):
+                resilience.STATS["timeouts"] += 1
+            if session is not None and not fresh:
+                _BROKEN_SESSIONS.add(id(session))
+            last_exc = exc
+            breaker.record_failure()
+            if not breaker.allow():
+                break
+            continue
+
+        resilience.record_latency(tool_name, time.perf_counter() - started)
+        breaker.record_success()
+        _remember_response(transport, server_command, tool_name, arguments, result)
+        return result
+
+    reason = f"{type(last_exc).__name__}: {last_exc}"
+    return _fallback_or_raise(transport, server_command, tool_name, arguments, reason, last_exc)
+
+
+async def _call_tool(
+    tool_name: str,
+    arguments: Dict[str, Any],
+    transport: str,
+    server_command: str,
+    session: Any = None,
+) -> Dict[str, Any]:
+    impl = _transport(transport)
+    if session is None and not impl.uses_sessions:
+        return await impl.call(tool_name, arguments, server_command)
+    return await _call_with_policy(impl, tool_name, arguments, server_command, session)
+
+
+@asynccontextmanager
+async def _shared_session(transport: Transport, server_command: str) -> AsyncIterator[Any]:
+    """Yield one session for a batch of calls, or None if the server will not start.
+
+    With None each call opens its own session, so retries and the breaker still apply.
+    """
+    async with AsyncExitStack() as stack:
+        try:
+            session = await stack.enter_async_context(transport.open_session(server_command))
+        except Exception:
+            session = None
+        yield session
+
+
+async def _gather(calls: List[Callable[[], Awaitable[T]]]) -> List[T]:
+    """Run calls concurrently, re-raising the first failure as-is (not as an ExceptionGroup)."""
+    results: List[Any] = [None] * len(calls)
+    errors: List[BaseException] = []
+
+    async with anyio.create_task_group() as tg:
+
+        async def _run(idx: int, call: Callable[[], Awaitable[T]]) -> None:
+            try:
+                results[idx] = await call()
+            except Exception as exc:
+                errors.append(exc)
+                tg.cancel_scope.cancel()
+
+        for idx, call in enumerate(calls):
+            tg.start_soon(_run, idx, call)
+
+    if errors:
+        raise errors[0]
+    return results
+
+
+def read_assessment_document(path: str | Path) -> Any:
+    """Parse an assessment file as-is (no defaults applied).
+
+    In warm mode parsed documents are reused until the file's size or mtime changes.
+    """
+    p = Path(path)
+    if _DOCUMENT_CACHE is None:
+        return load_document(p)
+
+    st = p.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(p.resolve())
+    cached = _DOCUMENT_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, load_document(p))
+        _DOCUMENT_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
 
 
 def load_assessment(path: str | Path | None) -> Dict[str, Any]:
@@ -149,8 +623,7 @@ def load_assessment(path: str | Path | None) -> Dict[str, Any]:
     if not p.exists():
         return {"frameworks": {}}
 
-    with p.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_assessment_document(p)
 
     if not isinstance(data, dict):
         return {"frameworks": {}}
@@ -159,9 +632,64 @@ def load_assessment(path: str | Path | None) -> Dict[str, Any]:
     return data
 
 
-def save_assessment(path: str | Path, assessment: Dict[str, Any]) -> None:
+def _read_locked(p: Path) -> Optional[Dict[str, Any]]:
+    # Under the lock: always the bytes on disk, never the warm-mode document cache.
+    if not p.exists():
+        return None
+    data = load_document(p)
+    return data if isinstance(data, dict) else None
+
+
+def _revision(document: Optional[Dict[str, Any]]) -> int:
+    revision = document.get(REVISION_KEY, 0) if document else 0
+    return revision if isinstance(revision, int) else 0
+
+
+def _write_locked(p: Path, assessment: Dict[str, Any], current: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    saved = {**assessment, REVISION_KEY: _revision(current) + 1}
+    save_document(p, saved)
+    return saved
+
+
+def save_assessment(
+    path: str | Path,
+    assessment: Dict[str, Any],
+    base: Optional[Dict[str, Any]] = None,
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> Dict[str, Any]:
+    """Write the assessment; compression and pretty/compact layout follow the file name.
+
+    With base (the document the caller started from), changes another writer saved since
+    then are merged in per control instead of being overwritten. The bytes on disk are
+    compared with base, not the revision: hand edits and other tools do not bump it. Returns
+    {"assessment", "revision", "merged", "conflicts"}; the caller's dict is not modified.
+    """
+    p = Path(path)
+    conflicts: List[Dict[str, Any]] = []
+    with file_lock(p, timeout):
+        current = _read_locked(p)
+        if current is not None:
+            # Normalized like load_assessment, which is where base usually comes from.
+            current.setdefault("frameworks", {})
+        merged = base is not None and current is not None and current != base
+        if merged:
+            assessment, conflicts = merge_assessments(base, assessment, current)
+        saved = _write_locked(p, assessment, current)
+    return {"assessment": saved, "revision": saved[REVISION_KEY], "merged": merged, "conflicts": conflicts}
+
+
+def update_assessment(
+    path: str | Path, update: Callable[[Dict[str, Any]], T], timeout: float = DEFAULT_LOCK_TIMEOUT
+) -> T:
+    """Load, update in place and save the assessment under one short lock; returns update's result."""
     p = Path(path)
-    p.write_text(json.dumps(assessment, indent=2), encoding="utf-8")
+    with file_lock(p, timeout):
+        current = _read_locked(p)
+        assessment = copy.deepcopy(current) if current is not None else {}
+        assessment.setdefault("frameworks", {})
+        result = update(assessment)
+        _write_locked(p, assessment, current)
+    return result
 
 
 def set_control_status(assessment: Dict[str, Any], framework: str, control: str, status: str) -> None:
@@ -175,23 +703,56 @@ def set_control_status(assessment: Dict[str, Any], framework: str, control: str,
     statuses[control] = normalized
 
 
-def summarize_framework(
+@asynccontextmanager
+async def open_session(
+    transport: str = "stdio",
+    server_command: str = "cyber-compliance-mcp",
+) -> AsyncIterator[Any]:
+    """Open one MCP session to share across async API calls (None for the python transport).
+
+    A session may be used by many tasks at once; requests are multiplexed over it.
+    """
+    impl = _transport(transport)
+    if not impl.uses_sessions:
+        yield None
+        return
+    async with impl.open_session(server_command) as session:
+        yield session
+
+
+async def _summarize_framework(
     framework: str,
     assessment: Dict[str, Any],
-    org_type: str = "saas",
-    transport: str = "python",
-    server_command: str = "cyber-compliance-mcp",
+    org_type: str,
+    transport: str,
+    server_command: str,
+    session: Any,
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    calculate_risk_score, generate_checklist, recommend_next_actions = _toolset(transport, server_command)
-
-    checklist_result = generate_checklist(framework=framework, org_type=org_type)
+    from .prioritization import DEFAULT_TOP, domain_of, rank_gaps
+
+    checklist_key = (transport, server_command, framework, org_type)
+    if _CHECKLIST_CACHE is not None and checklist_key in _CHECKLIST_CACHE:
+        checklist_result = _CHECKLIST_CACHE[checklist_key]
+    else:
+        checklist_result = await _call_tool(
+            "generate_checklist",
+            {"framework": framework, "org_type": org_type},
+            transport,
+            server_command,
+            session,
+        )
+        if _CHECKLIST_CACHE is not None:
+            _CHECKLIST_CACHE[checklist_key] = checklist_result
     checklist = checklist_result["checklist"]
     framework_assessment = assessment.get("frameworks", {}).get(framework, {})
     status_map = framework_assessment.get("statuses", {})
 
-    controls_for_score: List[Dict[str, str]] = []
+    # One list serves as the risk-score input and the returned per-control rows.
     controls_out: List[Dict[str, str]] = []
-    missing_gaps: List[str] = []
+    # Per-domain [implemented, partial, missing], counted in the same pass.
+    by_domain: Dict[str, List[int]] = {}
 
     for item in checklist:
         control_name = item["control"]
@@ -199,13 +760,26 @@ def summarize_framework(
         if status not in VALID_STATUSES:
             status = "missing"
 
-        controls_for_score.append({"control": control_name, "status": status})
         controls_out.append({"control": control_name, "status": status})
-        if status == "missing":
-            missing_gaps.append(control_name)
-
-    score = calculate_risk_score(controls_for_score)
-    recommendations = recommend_next_actions(framework=framework, gaps=missing_gaps[:4])
+        domain = item.get("domain") or domain_of(framework, control_name)
+        by_domain.setdefault(domain, [0, 0, 0])[STATUS_SLOTS[status]] += 1
+
+    priority_gaps = rank_gaps(framework, controls_out, assessment, DEFAULT_TOP if top is None else top, weights)
+
+    score, recommendations = await _gather(
+        [
+            lambda: _call_tool(
+                "calculate_risk_score", {"controls": controls_out}, transport, server_command, session
+            ),
+            lambda: _call_tool(
+                "recommend_next_actions",
+                {"framework": framework, "gaps": [gap["control"] for gap in priority_gaps]},
+                transport,
+                server_command,
+                session,
+            ),
+        ]
+    )
 
     return {
         "framework": framework,
@@ -214,101 +788,290 @@ def summarize_framework(
         "missing": score.get("missing", 0),
         "partial": score.get("partial", 0),
         "implemented": score.get("implemented", 0),
-        "controls_total": score.get("controls_total", len(controls_for_score)),
+        "controls_total": score.get("controls_total", len(controls_out)),
         "actions": recommendations.get("recommended_actions", []),
+        "priority_gaps": priority_gaps,
+        "domains": domain_rollup(by_domain),
         "controls": controls_out,
     }
 
 
-def summarize_all(
-    assessment_path: str | None,
+async def summarize_framework_async(
+    framework: str,
+    assessment: Dict[str, Any],
     org_type: str = "saas",
     transport: str = "python",
     server_command: str = "cyber-compliance-mcp",
+    session: Any = None,
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    assessment = load_assessment(assessment_path)
-    summaries = [
-        summarize_framework(
-            fw,
-            assessment,
-            org_type=org_type,
-            transport=transport,
-            server_command=server_command,
-        )
-        for fw in SUPPORTED_FRAMEWORKS
-    ]
+    """Summarize one framework; the top missing/partial gaps (by priority) get recommendations."""
+    impl = _transport(transport)
+    args = (framework, assessment, org_type, transport, server_command)
+    if session is None and impl.uses_sessions:
+        async with _shared_session(impl, server_command) as opened:
+            return await _summarize_framework(*args, opened, top, weights)
+    return await _summarize_framework(*args, session, top, weights)
+
+
+def summarize_framework(
+    framework: str,
+    assessment: Dict[str, Any],
+    org_type: str = "saas",
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return _run_sync(
+        summarize_framework_async,
+        framework,
+        assessment,
+        org_type,
+        transport=transport,
+        server_command=server_command,
+        top=top,
+        weights=weights,
+    )
 
-    all_actions: List[str] = []
-    for row in summaries:
-        all_actions.extend(row.get("actions", []))
 
-    dedup_actions = []
-    seen = set()
-    for action in all_actions:
-        if action not in seen:
-            seen.add(action)
-            dedup_actions.append(action)
+def _combine_summaries(
+    summaries: List[Dict[str, Any]], assessment_path: str | None, top: Optional[int] = None
+) -> Dict[str, Any]:
+    from .prioritization import DEFAULT_TOP, rank_actions, top_k
 
+    k = DEFAULT_TOP if top is None else top
     framework_details = {row["framework"]: row.get("controls", []) for row in summaries}
 
     return {
         "frameworks": summaries,
         "framework_details": framework_details,
-        "priority_actions": dedup_actions[:6],
+        "priority_actions": rank_actions(summaries, k),
+        "priority_gaps": top_k((gap for row in summaries for gap in row.get("priority_gaps", [])), k),
         "assessment_path": assessment_path,
     }
 
 
-def get_requirements(
+async def _summarize_all(
+    assessment: Dict[str, Any],
+    assessment_path: str | None,
+    org_type: str,
+    transport: str,
+    server_command: str,
+    session: Any,
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+    on_summary: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    reuse = reuse or {}
+
+    async def _one(fw: str) -> Dict[str, Any]:
+        summary = await _summarize_framework(
+            fw, assessment, org_type, transport, server_command, session, top, weights
+        )
+        if on_summary is not None:
+            on_summary(summary)
+        return summary
+
+    if on_summary is not None:
+        for fw in SUPPORTED_FRAMEWORKS:
+            if fw in reuse:
+                on_summary(reuse[fw])
+    fresh = iter(await _gather([functools.partial(_one, fw) for fw in SUPPORTED_FRAMEWORKS if fw not in reuse]))
+    summaries = [reuse[fw] if fw in reuse else next(fresh) for fw in SUPPORTED_FRAMEWORKS]
+    return _combine_summaries(summaries, assessment_path, top)
+
+
+async def summarize_all_async(
+    assessment_path: str | None,
+    org_type: str = "saas",
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+    session: Any = None,
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+    on_summary: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Summarize every supported framework concurrently over one shared session.
+
+    Frameworks present in reuse (framework -> earlier summary) are not queried again,
+    nor are those whose statuses and options match a memoized summary on disk (see memo).
+    on_summary is called with each framework summary as soon as it is ready, before
+    the cross-framework priority actions are ranked.
+    """
+    from . import memo
+
+    impl = _transport(transport)
+    assessment = load_assessment(assessment_path)
+    reuse = dict(reuse or {})
+    keys: Dict[str, str] = {}
+    if memo.enabled():
+        keys = memo.summary_keys(assessment, org_type, transport, server_command, top, weights)
+        reuse.update(memo.lookup({fw: key for fw, key in keys.items() if fw not in reuse}))
+    fallbacks = resilience.STATS["fallbacks"]
+
+    args = (assessment, assessment_path, org_type, transport, server_command)
+    if session is None and impl.uses_sessions and len(reuse) < len(SUPPORTED_FRAMEWORKS):
+        async with _shared_session(impl, server_command) as opened:
+            data = await _summarize_all(*args, opened, top, weights, reuse, on_summary)
+    else:
+        data = await _summarize_all(*args, session, top, weights, reuse, on_summary)
+
+    # Summaries built from local fallback data are not the server's answer; don't keep them.
+    if keys and resilience.STATS["fallbacks"] == fallbacks:
+        memo.store(keys, {row["framework"]: row for row in data["frameworks"] if row["framework"] not in reuse})
+    return data
+
+
+def summarize_all(
+    assessment_path: str | None,
+    org_type: str = "saas",
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+    on_summary: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    return _run_sync(
+        summarize_all_async,
+        assessment_path,
+        org_type,
+        transport=transport,
+        server_command=server_command,
+        top=top,
+        weights=weights,
+        reuse=reuse,
+        on_summary=on_summary,
+    )
+
+
+def _import_requirements_tools():
+    requirements = _import_mcp_module("cyber_compliance_mcp.requirements")
+    return requirements.get_requirements, requirements.list_requirement_frameworks
+
+
+async def get_requirements_async(
     framework: str,
     query: str = "",
     transport: str = "python",
     server_command: str = "cyber-compliance-mcp",
+    session: Any = None,
 ) -> Dict[str, Any]:
-    """Get requirements from MCP service (primary source for catalogs)."""
     fw = framework.lower().strip()
-    if transport == "stdio":
-        return anyio.run(
-            _call_tool_stdio,
-            server_command,
-            "get_requirements",
-            {"framework": fw, "query": query},
-        )
+    return await _call_tool("get_requirements", {"framework": fw, "query": query}, transport, server_command, session)
 
-    try:
-        from cyber_compliance_mcp.requirements import get_requirements as req_tool  # type: ignore
-    except Exception:
-        import sys
 
-        sibling = Path(__file__).resolve().parents[2] / "cyber-compliance-mcp"
-        if sibling.exists():
-            sys.path.insert(0, str(sibling))
-            from cyber_compliance_mcp.requirements import get_requirements as req_tool  # type: ignore
-        else:
-            raise MCPUnavailableError("MCP requirements tool unavailable")
+def get_requirements(
+    framework: str,
+    query: str = "",
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+) -> Dict[str, Any]:
+    """Get requirements from MCP service (primary source for catalogs)."""
+    return _run_sync(get_requirements_async, framework, query, transport=transport, server_command=server_command)
+
 
-    return _unwrap_result(req_tool(fw, query), "get_requirements")
+async def list_requirement_frameworks_async(
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+    session: Any = None,
+) -> List[str]:
+    out = await _call_tool("list_requirement_frameworks", {}, transport, server_command, session)
+    return out.get("frameworks", [])
 
 
 def list_requirement_frameworks(
     transport: str = "python",
     server_command: str = "cyber-compliance-mcp",
 ) -> List[str]:
-    if transport == "stdio":
-        out = anyio.run(_call_tool_stdio, server_command, "list_requirement_frameworks", {})
-        return out.get("frameworks", [])
+    return _run_sync(list_requirement_frameworks_async, transport=transport, server_command=server_command)
 
-    try:
-        from cyber_compliance_mcp.requirements import list_requirement_frameworks as list_tool  # type: ignore
-    except Exception:
-        import sys
 
-        sibling = Path(__file__).resolve().parents[2] / "cyber-compliance-mcp"
-        if sibling.exists():
-            sys.path.insert(0, str(sibling))
-            from cyber_compliance_mcp.requirements import list_requirement_frameworks as list_tool  # type: ignore
-        else:
-            raise MCPUnavailableError("MCP requirements list tool unavailable")
+def _page(rows: List[dict], offset: int, limit: Optional[int]) -> List[dict]:
+    end = None if limit is None else offset + limit
+    return rows[offset:end]
 
-    out = _unwrap_result(list_tool(), "list_requirement_frameworks")
-    return out.get("frameworks", [])
+
+async def _requirements_session(
+    transport: Transport,
+    server_command: str,
+    framework: str,
+    arguments: Dict[str, Any],
+    frameworks: Optional[List[str]],
+    timeout: Optional[float],
+) -> tuple[List[str], Optional[Dict[str, Any]]]:
+    with anyio.fail_after(timeout):
+        async with transport.open_session(server_command) as session:
+            # A cached list may predate a framework the server added since: list once more on a miss.
+            if frameworks is None or framework not in frameworks:
+                listed = await _call_session_tool(session, "list_requirement_frameworks", {})
+                frameworks = list(listed.get("frameworks", []))
+            if framework not in frameworks:
+                return frameworks, None
+            return frameworks, await _call_session_tool(session, "get_requirements", arguments)
+
+
+def fetch_requirements(
+    framework: str,
+    query: str = "",
+    offset: int = 0,
+    limit: Optional[int] = None,
+    transport: str = "python",
+    server_command: str = "cyber-compliance-mcp",
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """List frameworks and fetch one page of requirements in a single MCP session.
+
+    The framework list is cached on disk per server fingerprint and refreshed when it
+    does not name the requested framework. Transport failures
+    and timeouts are raised as MCPUnavailableError so callers can fall back.
+    """
+    fw = framework.lower().strip()
+    try:
+        impl = _transport(transport)
+        if impl.uses_sessions:
+            cache_key = server_fingerprint(transport, server_command)
+            cached = read_cache("frameworks", cache_key)
+            arguments: Dict[str, Any] = {"framework": fw, "query": query}
+            if offset or limit is not None:
+                arguments["offset"] = offset
+                arguments["limit"] = limit
+            frameworks, out = _run_blocking(
+                functools.partial(
+                    _requirements_session,
+                    impl,
+                    server_command,
+                    fw,
+                    arguments,
+                    cached if isinstance(cached, list) else None,
+                    timeout,
+                )
+            )
+            if cached != frameworks:
+                write_cache("frameworks", cache_key, frameworks)
+        else:
+            req_tool, list_tool = _import_requirements_tools()
+            frameworks = _unwrap_result(list_tool(), "list_requirement_frameworks").get("frameworks", [])
+            out = _unwrap_result(req_tool(fw, query), "get_requirements") if fw in frameworks else None
+    except MCPUnavailableError:
+        raise
+    except TimeoutError as exc:
+        raise MCPUnavailableError(f"requirements lookup timed out after {timeout}s") from exc
+    except Exception as exc:
+        raise MCPUnavailableError(f"requirements lookup failed: {type(exc).__name__}: {exc}") from exc
+
+    if out is None:
+        return {"frameworks": frameworks, "supported": False, "requirements": [], "total": 0}
+
+    rows = out.get("requirements", [])
+    total = out.get("total", len(rows))
+    if "offset" not in out:
+        # Server returned the full match set; page it on our side.
+        total = len(rows)
+        rows = _page(rows, offset, limit)
+
+    return {"frameworks": frameworks, "supported": True, "requirements": rows, "total": total}
@@ -0,0 +1,179 @@
+"""On-disk memo of per-framework summaries, keyed by everything a summary depends on.
+
+A key covers the framework's normalized statuses (and the open/closed state of mapped
+controls, see watch.framework_hashes) plus org_type, transport, the server fingerprint,
+top and priority weights. Entries are one file each under <cache dir>/summaries.
+Nothing is memoized when the server build cannot be identified (see cache.server_stamp).
+Set CYBERSEC_SUMMARY_CACHE=0 to disable.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import codec
+from .cache import cache_dir, read_cache, server_stamp, write_cache
+from .concurrency import file_lock
+from .watch import framework_hashes
+
+SUMMARY_DIR = "summaries"
+STATS_CACHE = "summary-stats"
+MAX_ENTRIES = 1024
+# Bump when the shape of a framework summary changes.
+_FORMAT = 2
+# Seconds to wait for another process adding its counts to the totals.
+STATS_LOCK_TIMEOUT = 2.0
+
+# Counters for the current command; totals across runs are kept in the cache directory.
+STATS = {"hits": 0, "misses": 0}
+# Counts not yet added to the on-disk totals (see flush_stats).
+_PENDING = {"hits": 0, "misses": 0}
+
+
+def begin_command() -> None:
+    """Zero this process's counters at the start of a CLI command (the daemon runs many)."""
+    STATS.update(hits=0, misses=0)
+
+
+def enabled() -> bool:
+    return os.environ.get("CYBERSEC_SUMMARY_CACHE", "1") != "0"
+
+
+def _dir() -> Path:
+    return cache_dir() / SUMMARY_DIR
+
+
+def summary_keys(
+    assessment: Dict[str, Any],
+    org_type: str,
+    transport: str,
+    server_command: str,
+    top: Optional[int] = None,
+    weights: Optional[Dict[str, Any]] = None,
+) -> Dict[str, str]:
+    """Memo key per framework; empty when the server build is unknown (a stale hit could outlive it)."""
+    stamp = server_stamp(transport, server_command)
+    if stamp is None:
+        return {}
+    context = json.dumps(
+        [_FORMAT, org_type, transport, stamp, top, weights],
+        sort_keys=True,
+        default=str,
+    )
+    return {
+        framework: hashlib.sha256(f"{context}|{digest}".encode("utf-8")).hexdigest()
+        for framework, digest in framework_hashes(assessment).items()
+    }
+
+
+def _record(hits: int, misses: int) -> None:
+    for counters in (STATS, _PENDING):
+        counters["hits"] += hits
+        counters["misses"] += misses
+
+
+def _stats_lock() -> Any:
+    return file_lock(cache_dir() / f"{STATS_CACHE}.json", STATS_LOCK_TIMEOUT)
+
+
+def flush_stats() -> None:
+    """Add the pending hit/miss counts to the on-disk totals under a lock (once per command)."""
+    if not (_PENDING["hits"] or _PENDING["misses"]):
+        return
+    try:
+        with _stats_lock():
+            totals = read_cache(STATS_CACHE, "totals") or {}
+            write_cache(STATS_CACHE, "totals", {key: totals.get(key, 0) + _PENDING[key] for key in _PENDING})
+    except OSError:
+        # Best-effort; the counts stay pending for the next flush.
+        return
+    _PENDING.update(hits=0, misses=0)
+
+
+# Library callers never reach the CLI's per-command flush.
+atexit.register(flush_stats)
+
+
+def lookup(keys: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """Cached summaries for the frameworks whose key is on disk."""
+    found: Dict[str, Dict[str, Any]] = {}
+    for framework, key in keys.items():
+        path = _dir() / f"{key}.json"
+        try:
+            summary = codec.loads(path.read_bytes())
+            # Touch so pruning drops the least recently used entries first.
+            os.utime(path)
+        except (OSError, ValueError):
+            continue
+        if isinstance(summary, dict) and summary.get("framework") == framework:
+            found[framework] = summary
+    if keys:
+        _record(len(found), len(keys) - len(found))
+    return found
+
+
+def _prune(root: Path) -> None:
+    entries = list(root.glob("*.json"))
+    if len(entries) <= MAX_ENTRIES:
+        return
+
+    def mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    for path in sorted(entries, key=mtime)[: len(entries) - MAX_ENTRIES]:
+        path.unlink(missing_ok=True)
+
+
+def store(keys: Dict[str, str], summaries: Dict[str, Dict[str, Any]]) -> None:
+    root = _dir()
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        for framework, summary in summaries.items():
+            path = root / f"{keys[framework]}.json"
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(codec.dumps(summary, pretty=False))
+            os.replace(tmp, path)
+        _prune(root)
+    except OSError:
+        # Best-effort like the response cache; a read-only home must not break the CLI.
+        pass
+
+
+def stats() -> Dict[str, Any]:
+    """Entry count and size on disk, plus hit/miss totals for this process and all runs."""
+    entries = list(_dir().glob("*.json")) if _dir().is_dir() else []
+    totals = read_cache(STATS_CACHE, "totals") or {}
+    hits = totals.get("hits", 0) + _PENDING["hits"]
+    misses = totals.get("misses", 0) + _PENDING["misses"]
+    return {
+        "entries": len(entries),
+        "bytes": sum(path.stat().st_size for path in entries),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+        "session": dict(STATS),
+    }
+
+
+def clear() -> int:
+    """Drop every memoized summary and reset the totals; returns the number of entries removed."""
+    removed = 0
+    if _dir().is_dir():
+        for path in _dir().glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+    try:
+        with _stats_lock():
+            write_cache(STATS_CACHE, "totals", {"hits": 0, "misses": 0})
+    except OSError:
+        pass
+    STATS.update(hits=0, misses=0)
+    _PENDING.update(hits=0, misses=0)
+    return removed
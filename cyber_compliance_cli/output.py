@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, TextIO
+
+OUTPUT_MODES = ("table", "json", "ndjson")
+SCHEMA_VERSION = 1
+
+# Exit codes shared by every command.
+EXIT_OK = 0
+EXIT_INVALID = 1  # bad input, failed validation, unsupported framework
+EXIT_UNAVAILABLE = 2  # MCP unavailable or optional dependency missing
+
+_state: Dict[str, Any] = {"mode": "table", "command": None}
+
+
+def set_mode(mode: str, command: Optional[str] = None) -> None:
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"output must be one of: {'|'.join(OUTPUT_MODES)}")
+    _state["mode"] = mode
+    _state["command"] = command
+
+
+def mode() -> str:
+    return _state["mode"]
+
+
+def machine() -> bool:
+    """True when stdout is reserved for json/ndjson records."""
+    return _state["mode"] != "table"
+
+
+class RecordWriter:
+    """Write one command's records as a JSON document or as streamed NDJSON lines.
+
+    JSON: {"schema_version", "command", **meta, "records": [...]}, written on close().
+    NDJSON: a {"kind": "meta", ...} line first, then one line per record as it is emitted.
+    Every record carries a "kind" field.
+    """
+
+    def __init__(self, file: TextIO, /, **meta: Any) -> None:
+        self.file = file
+        self.command = _state["command"]
+        self.meta = meta
+        self.records: List[Dict[str, Any]] = []
+        self.stream = _state["mode"] == "ndjson"
+        if self.stream:
+            self._line({"kind": "meta", "schema_version": SCHEMA_VERSION, "command": self.command, **meta})
+
+    def _line(self, record: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        record = {"kind": kind, **fields}
+        if self.stream:
+            self._line(record)
+        else:
+            self.records.append(record)
+
+    def close(self) -> None:
+        if not self.stream:
+            doc = {"schema_version": SCHEMA_VERSION, "command": self.command, **self.meta, "records": self.records}
+            self.file.write(json.dumps(doc, indent=2) + "\n")
+            self.file.flush()
+
+
+def error_record(message: str, code: int) -> str:
+    """One-line JSON error written to stderr in json/ndjson modes."""
+    record = {"kind": "error", "schema_version": SCHEMA_VERSION, "command": _state["command"]}
+    return json.dumps({**record, "code": code, "message": message})
@@ -0,0 +1,71 @@
+"""Frame-time overlay for the Textual apps (`--debug-perf`)."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from textual.app import App
+from textual.widgets import Static
+
+# Render times kept for the rolling p95.
+SAMPLES = 120
+QUEUE_POLL = 0.5
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class PerfOverlay(Static):
+    """Last render time (from a keypress or state change to the refreshed frame) and queue depth."""
+
+    DEFAULT_CSS = """
+    PerfOverlay {
+        height: 1;
+        background: #1e293b;
+        color: #fbbf24;
+        padding: 0 1;
+    }
+    """
+
+    def __init__(self) -> None:
+        super().__init__("perf: waiting for first render", id="perf")
+        self.samples: Deque[float] = deque(maxlen=SAMPLES)
+        self._started: Optional[float] = None
+
+    def on_mount(self) -> None:
+        # Keeps the queue depth current while nothing else re-renders.
+        self.set_interval(QUEUE_POLL, self._show)
+
+    def mark(self) -> None:
+        """Start timing at the first change since the last frame; stop once it is on screen."""
+        if self._started is None:
+            self._started = time.perf_counter()
+            self.app.call_after_refresh(self._painted)
+
+    def _painted(self) -> None:
+        if self._started is not None:
+            self.samples.append((time.perf_counter() - self._started) * 1000)
+            self._started = None
+        self._show()
+
+    def _show(self) -> None:
+        if not self.samples:
+            return
+        p95 = percentile(sorted(self.samples), 95)
+        self.update(
+            f"render {self.samples[-1]:.1f} ms  p95 {p95:.1f} ms  ({len(self.samples)} frames)  "
+            f"queue {self.app.message_queue_size}"
+        )
+
+
+def mark_render(app: App) -> None:
+    """Time the frame that will show the change app is about to make (no-op without the overlay)."""
+    overlays = app.query(PerfOverlay)
+    if overlays:
+        overlays.first().mark()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .mapping import control_id
+from .prioritization import build_status_index, gap_priority, merge_weights
+from .reporting import render_plan_markdown
+from .scoring import STATUS_WEIGHTS
+
+WINDOWS = (30, 60, 90)
+DEFAULT_CAPACITY = 20.0
+# Person-days to close a gap when no estimate is given.
+DEFAULT_EFFORT_DAYS = {"missing": 5.0, "partial": 2.0}
+# Efforts are packed in half-day units.
+EFFORT_UNITS_PER_DAY = 2
+# Exact knapsack runs over at most this many of the densest candidates per window,
+# and only while candidates x capacity units stays under EXACT_MAX_CELLS.
+EXACT_POOL = 256
+EXACT_MAX_CELLS = 100_000
+
+PLAN_FIELDS = ["window", "unit", "framework", "control", "status", "domain", "effort", "risk_reduction", "priority"]
+
+
+def load_efforts(path: Optional[str]) -> Dict[str, float]:
+    """Read per-control effort estimates (person-days) keyed as "framework:control id".
+
+    Accepts a JSON object or a CSV with framework, control and effort columns.
+    """
+    if not path:
+        return {}
+    p = Path(path)
+    if p.suffix.lower() == ".csv":
+        efforts: Dict[str, float] = {}
+        with p.open("r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                framework = str(row.get("framework", "")).strip()
+                control = str(row.get("control", "")).strip()
+                if framework and control:
+                    efforts[f"{framework}:{control_id(control)}"] = float(row["effort"])
+        return efforts
+    with p.open("r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("effort file must be a JSON object of framework:control -> days")
+    out: Dict[str, float] = {}
+    for key, days in raw.items():
+        framework, _, control = str(key).partition(":")
+        out[f"{framework}:{control_id(control)}"] = float(days)
+    return out
+
+
+def collect_gaps(
+    data: Dict[str, Any],
+    assessment: Optional[Dict[str, Any]] = None,
+    unit: str = "",
+    weights: Optional[Dict[str, Any]] = None,
+    efforts: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Turn a summarize_all result into plannable gaps (every missing and partial control).
+
+    risk_reduction is how many points the framework's risk score drops once the gap is
+    closed (the knapsack value, effort is its cost); priority is the gap's priority without
+    the effort discount and only breaks ties between equal reductions.
+    """
+    weights = dict(weights or merge_weights())
+    weights["effort"] = 0.0
+    efforts = efforts or {}
+    status_index = build_status_index(assessment)
+    totals = {row["framework"]: row.get("controls_total", 0) for row in data.get("frameworks", [])}
+
+    gaps: List[Dict[str, Any]] = []
+    for framework, controls in data.get("framework_details", {}).items():
+        total = totals.get(framework) or len(controls) or 1
+        for row in controls:
+            status = row["status"]
+            if status not in DEFAULT_EFFORT_DAYS:
+                continue
+            scored = gap_priority(framework, row["control"], status, weights, status_index)
+            effort = efforts.get(f"{framework}:{control_id(row['control'])}", DEFAULT_EFFORT_DAYS[status])
+            gaps.append(
+                {
+                    "unit": unit,
+                    "framework": framework,
+                    "control": row["control"],
+                    "status": status,
+                    "domain": scored["domain"],
+                    "effort": effort,
+                    "risk_reduction": round(STATUS_WEIGHTS[status] / (total * 10) * 100, 2),
+                    "priority": scored["priority"],
+                }
+            )
+    return gaps
+
+
+def _units(days: float) -> int:
+    return max(0, math.ceil(days * EFFORT_UNITS_PER_DAY - 1e-9))
+
+
+def _knapsack(items: List[Dict[str, Any]], capacity: int) -> List[int]:
+    """Exact 0/1 knapsack over items (risk reduction, effort in units); returns chosen indexes."""
+    best = [0.0] * (capacity + 1)
+    taken: List[bytearray] = []
+    for item in items:
+        cost, value = item["_units"], item["risk_reduction"]
+        row = bytearray(capacity + 1)
+        for c in range(capacity, cost - 1, -1):
+            candidate = best[c - cost] + value
+            if candidate > best[c]:
+                best[c] = candidate
+                row[c] = 1
+        taken.append(row)
+
+    chosen: List[int] = []
+    c = capacity
+    for idx in range(len(items) - 1, -1, -1):
+        if taken[idx][c]:
+            chosen.append(idx)
+            c -= items[idx]["_units"]
+    chosen.reverse()
+    return chosen
+
+
+def _pack(remaining: List[Dict[str, Any]], capacity: int) -> List[Dict[str, Any]]:
+    """Fill one window from gaps sorted by risk reduction per effort.
+
+    The densest candidates (until three windows' worth of effort) are packed exactly;
+    whatever capacity is left is filled greedily from the rest.
+    """
+    pool: List[Dict[str, Any]] = []
+    pooled_units = 0
+    for item in remaining:
+        if len(pool) >= EXACT_POOL or pooled_units >= 3 * capacity:
+            break
+        if item["_units"] <= capacity:
+            pool.append(item)
+            pooled_units += item["_units"]
+
+    if len(pool) * capacity <= EXACT_MAX_CELLS:
+        picked = [pool[idx] for idx in _knapsack(pool, capacity)]
+    else:
+        picked = []
+        used = 0
+        for item in pool:
+            if used + item["_units"] <= capacity:
+                picked.append(item)
+                used += item["_units"]
+
+    used = sum(item["_units"] for item in picked)
+    chosen = {id(item) for item in picked}
+    for item in remaining:
+        if used >= capacity:
+            break
+        if id(item) not in chosen and used + item["_units"] <= capacity:
+            picked.append(item)
+            chosen.add(id(item))
+            used += item["_units"]
+    return picked
+
+
+def _impact(item: Dict[str, Any]) -> tuple:
+    return -item["risk_reduction"], -item["priority"]
+
+
+def schedule(
+    gaps: List[Dict[str, Any]],
+    capacities: Sequence[float] = (DEFAULT_CAPACITY,) * len(WINDOWS),
+    windows: Sequence[int] = WINDOWS,
+) -> Dict[str, Any]:
+    """Pack gaps into consecutive windows, maximizing risk reduction per window under capacity (person-days).
+
+    Gaps are sorted once by risk reduction per effort (O(n log n)); each window then runs a
+    bounded exact knapsack plus a greedy fill, so the cost stays near-linear in gaps.
+    """
+    if len(capacities) != len(windows):
+        raise ValueError(f"expected {len(windows)} capacities, got {len(capacities)}")
+
+    remaining = []
+    for gap in gaps:
+        item = dict(gap)
+        item["_units"] = _units(item["effort"])
+        remaining.append(item)
+    remaining.sort(
+        key=lambda item: (-item["risk_reduction"] / max(item["_units"], 1), -item["priority"], item["_units"])
+    )
+
+    out_windows: List[Dict[str, Any]] = []
+    start = 1
+    for days, capacity in zip(windows, capacities):
+        cap_units = int(capacity * EFFORT_UNITS_PER_DAY)
+        picked = _pack(remaining, cap_units)
+        chosen = {id(item) for item in picked}
+        remaining = [item for item in remaining if id(item) not in chosen]
+        picked.sort(key=_impact)
+        items = [{k: v for k, v in item.items() if k != "_units"} for item in picked]
+        out_windows.append(
+            {
+                "window": days,
+                "label": f"Days {start}-{days}",
+                "capacity": capacity,
+                "effort": round(sum(item["effort"] for item in items), 2),
+                "risk_reduction": round(sum(item["risk_reduction"] for item in items), 2),
+                "priority": round(sum(item["priority"] for item in items), 4),
+                "items": items,
+            }
+        )
+        start = days + 1
+
+    backlog = [{k: v for k, v in item.items() if k != "_units"} for item in remaining]
+    backlog.sort(key=_impact)
+    return {
+        "windows": out_windows,
+        "backlog": backlog,
+        "gaps_total": len(gaps),
+        "scheduled": len(gaps) - len(backlog),
+    }
+
+
+def render_plan_csv(plan: Dict[str, Any]) -> str:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=PLAN_FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for window in plan["windows"]:
+        for item in window["items"]:
+            writer.writerow({**item, "window": window["window"]})
+    for item in plan["backlog"]:
+        writer.writerow({**item, "window": "backlog"})
+    return buf.getvalue()
+
+
+def write_plan(path: str | Path, plan: Dict[str, Any], fmt: str) -> Path:
+    renderers = {
+        "md": render_plan_markdown,
+        "csv": render_plan_csv,
+        "json": lambda p: json.dumps(p, indent=2) + "\n",
+    }
+    if fmt not in renderers:
+        raise ValueError("format must be md, csv or json")
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(renderers[fmt](plan), encoding="utf-8")
+    return out
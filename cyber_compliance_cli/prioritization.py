@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import copy
+import heapq
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .data.control_domains import DOMAIN_PREFIXES
+from .data.framework_catalog import list_controls
+from .mapping import control_id, mapping_index
+
+DEFAULT_TOP = 6
+
+# Control id -> domain per framework; see domain_index.
+_DOMAIN_INDEX: Dict[str, Dict[str, str]] = {}
+
+DEFAULT_WEIGHTS: Dict[str, Any] = {
+    # How much each gap status matters on its own.
+    "status": {"missing": 1.0, "partial": 0.5},
+    # Multipliers for domain criticality, cross-framework coverage and the effort penalty.
+    "criticality": 1.0,
+    "coverage": 0.5,
+    "effort": 0.5,
+    # Estimated effort to close a gap, by status; per-control overrides as "framework:control id".
+    "effort_by_status": {"missing": 1.0, "partial": 0.5},
+    "control_effort": {},
+    # Domain criticality overrides (domain name -> 0..1); other domains use the built-in table.
+    "domains": {},
+    "default_criticality": 0.5,
+}
+
+
+def merge_weights(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Return DEFAULT_WEIGHTS updated with overrides (unknown keys are rejected)."""
+    weights = copy.deepcopy(DEFAULT_WEIGHTS)
+    if not overrides:
+        return weights
+    unknown = set(overrides) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown priority weight keys: {', '.join(sorted(unknown))}")
+    for key, value in overrides.items():
+        if isinstance(weights[key], dict):
+            if not isinstance(value, dict):
+                raise ValueError(f"Priority weight '{key}' must be an object")
+            weights[key].update(value)
+        else:
+            weights[key] = float(value)
+    return weights
+
+
+def load_weights(path: Optional[str]) -> Dict[str, Any]:
+    if not path:
+        return merge_weights()
+    with Path(path).open("r", encoding="utf-8") as f:
+        return merge_weights(json.load(f))
+
+
+@lru_cache(maxsize=4096)
+def control_domain(framework: str, control: str) -> Tuple[str, Optional[float]]:
+    """Return (domain, built-in criticality) for a control, or ("Other", None)."""
+    cid = control_id(control)
+    best: Optional[Tuple[str, str, float]] = None
+    for prefix, domain, criticality in DOMAIN_PREFIXES.get(framework, []):
+        if cid == prefix or cid.startswith(prefix + "."):
+            if best is None or len(prefix) > len(best[0]):
+                best = (prefix, domain, criticality)
+    if best is None:
+        return "Other", None
+    return best[1], best[2]
+
+
+def domain_index(framework: str) -> Dict[str, str]:
+    """Control id -> domain for framework, precomputed from the built-in catalog.
+
+    Ids the catalog does not list are added by domain_of the first time they are resolved.
+    """
+    index = _DOMAIN_INDEX.get(framework)
+    if index is None:
+        index = _DOMAIN_INDEX[framework] = {entry["id"]: entry["domain"] for entry in list_controls(framework)}
+    return index
+
+
+def domain_of(framework: str, control: str) -> str:
+    """Domain of a control (full name or id) through domain_index."""
+    index = domain_index(framework)
+    cid = control_id(control)
+    domain = index.get(cid)
+    if domain is None:
+        domain = index[cid] = control_domain(framework, cid)[0]
+    return domain
+
+
+def build_status_index(assessment: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    index: Dict[str, Dict[str, str]] = {}
+    for fw, fw_data in (assessment or {}).get("frameworks", {}).items():
+        statuses = fw_data.get("statuses", {}) if isinstance(fw_data, dict) else {}
+        index[fw] = {control_id(name): str(status).lower() for name, status in statuses.items()}
+    return index
+
+
+def gap_priority(
+    framework: str,
+    control: str,
+    status: str,
+    weights: Dict[str, Any],
+    status_index: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Dict[str, Any]:
+    """Score one gap: status x domain criticality x open mapped controls, discounted by effort."""
+    cid = control_id(control)
+    domain, builtin = control_domain(framework, control)
+    criticality = weights["domains"].get(domain, builtin)
+    if criticality is None:
+        criticality = weights["default_criticality"]
+
+    # Mapped controls that are still open elsewhere get closed along with this one.
+    coverage = 0.0
+    for fw, mapped, cov in mapping_index().get((framework, cid), []):
+        if (status_index or {}).get(fw, {}).get(mapped, "missing") != "implemented":
+            coverage += cov
+
+    effort = weights["control_effort"].get(f"{framework}:{cid}", weights["effort_by_status"].get(status, 1.0))
+    priority = (
+        weights["status"].get(status, 0.0)
+        * (1 + weights["criticality"] * criticality)
+        * (1 + weights["coverage"] * coverage)
+        / (1 + weights["effort"] * effort)
+    )
+    return {
+        "framework": framework,
+        "control": control,
+        "status": status,
+        "domain": domain,
+        "coverage": coverage,
+        "effort": effort,
+        "priority": round(priority, 4),
+    }
+
+
+def top_k(items: Iterable[Dict[str, Any]], k: int, key: str = "priority") -> List[Dict[str, Any]]:
+    """Largest k items by key in O(n log k); ties keep their input order."""
+    return heapq.nlargest(max(k, 0), items, key=lambda item: item[key])
+
+
+def rank_gaps(
+    framework: str,
+    controls: List[Dict[str, str]],
+    assessment: Optional[Dict[str, Any]] = None,
+    top: int = DEFAULT_TOP,
+    weights: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Score every missing and partial control and return the top ones, best first."""
+    weights = weights or merge_weights()
+    status_index = build_status_index(assessment)
+    gaps = (
+        gap_priority(framework, row["control"], row["status"], weights, status_index)
+        for row in controls
+        if row["status"] in ("missing", "partial")
+    )
+    return top_k(gaps, top)
+
+
+def rank_actions(summaries: List[Dict[str, Any]], top: int = DEFAULT_TOP) -> List[str]:
+    """Merge per-framework actions, ordered by the priority of the gaps they were requested for.
+
+    Actions are assumed to follow the order of the gaps sent to recommend_next_actions;
+    extra actions inherit the priority of the last gap.
+    """
+    best: Dict[str, Dict[str, Any]] = {}
+    order = 0
+    for row in summaries:
+        priorities = [gap["priority"] for gap in row.get("priority_gaps", [])] or [0.0]
+        for idx, action in enumerate(row.get("actions", [])):
+            priority = priorities[min(idx, len(priorities) - 1)]
+            seen = best.get(action)
+            if seen is None or priority > seen["priority"]:
+                best[action] = {"action": action, "priority": priority, "order": seen["order"] if seen else order}
+            order += 1
+    ranked = sorted(best.values(), key=lambda item: item["order"])
+    return [item["action"] for item in top_k(ranked, top)]
@@ -0,0 +1,265 @@
+"""Indexed queries over one or many assessment files (`cybersec query`).
+
+Each file is indexed once into rows (framework, control id, name, status, domain) with
+posting lists by status, domain, framework and control id. Indexes are cached one file
+each under <cache dir>/query-index, keyed by the assessment's path, mtime and size, so a
+repeated query reads postings instead of re-parsing every document. Controls of the
+built-in catalog that a file does not mention count as missing for the frameworks it
+assesses.
+
+Filter language: whitespace-separated terms, ANDed. A term is field:value[,value...]
+with fields fw|framework, control|id, domain, status and unit; values are ORed, also
+when a field repeats. A bare term is a control. Control and unit values ending in *
+match by prefix. Matching is case-insensitive; quote values with spaces
+(domain:"Access Control").
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+import shlex
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from . import codec
+from .cache import cache_dir
+from .codec import document_stem
+from .data.framework_catalog import list_controls
+from .mapping import control_id
+from .mcp_client import VALID_STATUSES, load_assessment
+from .prioritization import domain_of
+
+INDEX_DIR = "query-index"
+FIELDS = {
+    "fw": "framework",
+    "framework": "framework",
+    "control": "control",
+    "id": "control",
+    "domain": "domain",
+    "status": "status",
+    "unit": "unit",
+}
+RESULT_FIELDS = ["unit", "framework", "control", "status", "domain", "assessed"]
+# Dictionary-encoded columns; each value gets a posting list of row positions.
+CODED = ("framework", "status", "domain")
+# Bump when the shape of a cached index changes.
+_FORMAT = 1
+
+# Indexes this process keeps loaded (the daemon answers many queries), least recently used first.
+MAX_LOADED = 64
+
+# resolved path -> (stamp, index)
+_LOADED: "OrderedDict[str, Tuple[Tuple[str, int, int], Dict[str, Any]]]" = OrderedDict()
+
+
+def parse_query(text: str) -> Dict[str, List[str]]:
+    """Parse a filter into {field: [values]}; raises ValueError on an unknown field or status."""
+    try:
+        terms = shlex.split(text)
+    except ValueError as exc:
+        raise ValueError(f"unbalanced quotes in query: {text}") from exc
+    parsed: Dict[str, List[str]] = {}
+    for term in terms:
+        field, sep, value = term.partition(":")
+        if not sep:
+            field, value = "control", term
+        name = FIELDS.get(field.lower())
+        if name is None:
+            raise ValueError(f"unknown field {field!r} (use {', '.join(sorted(set(FIELDS)))})")
+        values = [v.strip().lower() for v in value.split(",") if v.strip()]
+        if not values:
+            raise ValueError(f"no value for {field}")
+        if name == "status":
+            unknown = [v for v in values if v not in VALID_STATUSES]
+            if unknown:
+                raise ValueError(f"unknown status {unknown[0]!r} (use {', '.join(sorted(VALID_STATUSES))})")
+        parsed.setdefault(name, []).extend(values)
+    return parsed
+
+
+def _matches(name: str, value: str) -> bool:
+    return name.startswith(value[:-1]) if value.endswith("*") else name == value
+
+
+def _rows(assessment: Dict[str, Any]) -> List[Tuple[str, str, str, str, str, bool]]:
+    rows = []
+    for framework, fw_data in assessment.get("frameworks", {}).items():
+        statuses = fw_data.get("statuses", {}) if isinstance(fw_data, dict) else {}
+        seen: Set[str] = set()
+        catalog = {entry["id"]: entry for entry in list_controls(framework)}
+        for name, status in statuses.items():
+            cid = control_id(str(name))
+            seen.add(cid)
+            status = str(status).lower()
+            domain = domain_of(framework, cid)
+            rows.append((framework, cid, str(name), status if status in VALID_STATUSES else "missing", domain, True))
+        for cid, entry in catalog.items():
+            if cid not in seen:
+                rows.append((framework, cid, f"{cid} {entry['title']}", "missing", entry["domain"], False))
+    rows.sort(key=lambda row: (row[0], row[1]))
+    return rows
+
+
+def build_index(assessment: Dict[str, Any]) -> Dict[str, Any]:
+    """Columnar index of one assessment, rows ordered by framework and control id.
+
+    framework, status and domain are dictionary-encoded with one posting list (row
+    positions) per value; control ids are kept sorted next to their row positions, so an
+    exact id or a prefix is a bisect.
+    """
+    rows = _rows(assessment)
+    values: Dict[str, List[str]] = {field: [] for field in CODED}
+    codes: Dict[str, List[int]] = {field: [] for field in CODED}
+    for col, field in ((0, "framework"), (3, "status"), (4, "domain")):
+        seen: Dict[str, int] = {}
+        for row in rows:
+            code = seen.get(row[col])
+            if code is None:
+                code = seen[row[col]] = len(values[field])
+                values[field].append(row[col])
+            codes[field].append(code)
+    postings: Dict[str, List[List[int]]] = {}
+    for field in CODED:
+        postings[field] = [[] for _ in values[field]]
+        for pos, code in enumerate(codes[field]):
+            postings[field][code].append(pos)
+    ids = [row[1].lower() for row in rows]
+    order = sorted(range(len(rows)), key=ids.__getitem__)
+    return {
+        "format": _FORMAT,
+        "names": [row[2] for row in rows],
+        "assessed": [row[5] for row in rows],
+        "values": values,
+        "codes": codes,
+        "postings": postings,
+        "controls": [ids[pos] for pos in order],
+        "control_rows": order,
+    }
+
+
+def _stamp(path: Path) -> Tuple[str, int, int]:
+    st = path.stat()
+    return str(path.resolve()), st.st_mtime_ns, st.st_size
+
+
+def _index_file(stamp: Tuple[str, int, int]) -> Path:
+    return cache_dir() / INDEX_DIR / f"{hashlib.sha256(stamp[0].encode('utf-8')).hexdigest()[:24]}.json"
+
+
+def load_index(path: str | Path) -> Tuple[Dict[str, Any], str]:
+    """Index for one assessment file and where it came from: memory, cache or built."""
+    stamp = _stamp(Path(path))
+    loaded = _LOADED.get(stamp[0])
+    if loaded is not None and loaded[0] == stamp:
+        _LOADED.move_to_end(stamp[0])
+        return loaded[1], "memory"
+    cached = _index_file(stamp)
+    try:
+        entry = codec.loads(cached.read_bytes())
+    except (OSError, ValueError):
+        entry = None
+    if isinstance(entry, dict) and entry.get("format") == _FORMAT and entry.get("stamp") == list(stamp[1:]):
+        index, source = entry, "cache"
+    else:
+        index, source = build_index(load_assessment(path)), "built"
+        index["stamp"] = list(stamp[1:])
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_name(f".{cached.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(codec.dumps(index, pretty=False))
+            os.replace(tmp, cached)
+        except OSError:
+            # Best-effort like the other caches; the index is still used for this run.
+            pass
+    _LOADED[stamp[0]] = (stamp, index)
+    _LOADED.move_to_end(stamp[0])
+    while len(_LOADED) > MAX_LOADED:
+        _LOADED.popitem(last=False)
+    return index, source
+
+
+class QueryIndex:
+    """Per-unit indexes for a set of assessment files, in unit order."""
+
+    def __init__(self, paths: Iterable[str | Path]) -> None:
+        self.units: Dict[str, Dict[str, Any]] = {}
+        self.sources: Dict[str, int] = {"memory": 0, "cache": 0, "built": 0}
+        paths = list(paths)
+        stems = [document_stem(path) for path in paths]
+        for path, stem in sorted(zip(paths, stems), key=lambda item: item[1]):
+            # Files sharing a stem (q3/a.json, q4/a.json) keep their path as the unit name.
+            unit = stem if stems.count(stem) == 1 else str(path)
+            index, source = load_index(path)
+            self.units[unit] = index
+            self.sources[source] += 1
+
+    def units_with(self, controls: Iterable[str]) -> Set[str]:
+        """Control id -> units: the units whose sorted id column holds any of controls."""
+        found: Set[str] = set()
+        for unit, index in self.units.items():
+            keys = index["controls"]
+            for cid in controls:
+                at = bisect.bisect_left(keys, cid.lower())
+                if at < len(keys) and keys[at] == cid.lower():
+                    found.add(unit)
+                    break
+        return found
+
+    def _match_controls(self, index: Dict[str, Any], values: List[str]) -> Set[int]:
+        keys, rows = index["controls"], index["control_rows"]
+        found: Set[int] = set()
+        for value in values:
+            if value.endswith("*"):
+                lo = bisect.bisect_left(keys, value[:-1])
+                hi = bisect.bisect_left(keys, value[:-1] + "\U0010ffff")
+            else:
+                lo, hi = bisect.bisect_left(keys, value), bisect.bisect_right(keys, value)
+            found.update(rows[lo:hi])
+        return found
+
+    def _candidate_units(self, filters: Dict[str, List[str]]) -> List[str]:
+        units = list(self.units)
+        if "unit" in filters:
+            units = [u for u in units if any(_matches(u.lower(), v) for v in filters["unit"])]
+        exact = filters.get("control", [])
+        if exact and not any(v.endswith("*") for v in exact):
+            # control -> units skips files that never mention the control.
+            holders = self.units_with(exact)
+            units = [u for u in units if u in holders]
+        return units
+
+    def search(self, text: str) -> List[Dict[str, Any]]:
+        """Rows matching a filter, ordered by unit, framework and control id."""
+        filters = parse_query(text)
+        out: List[Dict[str, Any]] = []
+        for unit in self._candidate_units(filters):
+            index = self.units[unit]
+            selected: Optional[Set[int]] = None
+            for field in ("control", *CODED):
+                if field not in filters:
+                    continue
+                if field == "control":
+                    hits = self._match_controls(index, filters[field])
+                else:
+                    lookup = {value.lower(): code for code, value in enumerate(index["values"][field])}
+                    postings = index["postings"][field]
+                    hits = set().union(*(postings[lookup[v]] for v in filters[field] if v in lookup))
+                selected = hits if selected is None else selected & hits
+                if not selected:
+                    break
+            positions = range(len(index["names"])) if selected is None else sorted(selected)
+            values, codes = index["values"], index["codes"]
+            for pos in positions:
+                out.append(
+                    {
+                        "unit": unit,
+                        "framework": values["framework"][codes["framework"][pos]],
+                        "control": index["names"][pos],
+                        "status": values["status"][codes["status"][pos]],
+                        "domain": values["domain"][codes["domain"][pos]],
+                        "assessed": index["assessed"][pos],
+                    }
+                )
+        return out
@@ -39,6 +39,33 @@ def render_markdown_report(data: Dict[str, Any]) -> str:
     else:
         lines.append("- No prioritized actions generated.")
 
+    gaps: List[Dict[str, Any]] = data.get("priority_gaps", [])
+    if gaps:
+        lines.extend(["", "## Top Gaps", "", "| # | Framework | Control | Status | Domain | Priority |", "|---|---|---|---|---|---|"])
+        for i, gap in enumerate(gaps, start=1):
+            lines.append(
+                f"| {i} | {_label(gap.get('framework',''))} | {gap.get('control','')} | "
+                f"{gap.get('status','')} | {gap.get('domain','')} | {gap.get('priority',0):.2f} |"
+            )
+
+    if any(row.get("domains") for row in frameworks):
+        lines.extend(
+            [
+                "",
+                "## Domain Heatmap",
+                "",
+                "| Framework | Domain | Risk | Level | Implemented | Partial | Missing |",
+                "|---|---|---|---|---|---|---|",
+            ]
+        )
+        for row in frameworks:
+            for domain in row.get("domains", []):
+                lines.append(
+                    f"| {_label(row.get('framework',''))} | {domain['domain']} | {domain['risk_score']}% | "
+                    f"{domain['risk_level'].upper()} | {domain['implemented']} | {domain['partial']} | "
+                    f"{domain['missing']} |"
+                )
+
     lines.extend(["", "## Framework Details", ""])
     for row in frameworks:
         fw = row.get("framework", "")
@@ -60,6 +87,44 @@ def render_markdown_report(data: Dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
+def render_plan_markdown(plan: Dict[str, Any]) -> str:
+    multi_unit = any(item.get("unit") for w in plan["windows"] for item in w["items"])
+    lines: List[str] = ["# 30/60/90 Remediation Plan", ""]
+    lines.append(f"Scheduled {plan['scheduled']} of {plan['gaps_total']} gaps.")
+    lines.append("")
+    for window in plan["windows"]:
+        lines.extend(
+            [
+                f"## {window['label']}",
+                "",
+                f"Effort {window['effort']} / {window['capacity']} person-days, "
+                f"risk reduction {window['risk_reduction']} points",
+                "",
+            ]
+        )
+        if not window["items"]:
+            lines.extend(["- Nothing scheduled.", ""])
+            continue
+        columns = ["Unit"] if multi_unit else []
+        columns += ["Framework", "Control", "Status", "Domain", "Effort"]
+        lines.extend(["| " + " | ".join(columns) + " |", "|" + "---|" * len(columns)])
+        for item in window["items"]:
+            cells = [_label(item["framework"]), item["control"], item["status"], item["domain"], str(item["effort"])]
+            if multi_unit:
+                cells.insert(0, item.get("unit", ""))
+            lines.append("| " + " | ".join(cells) + " |")
+        lines.append("")
+    lines.extend(["## Backlog", ""])
+    if plan["backlog"]:
+        lines.append(f"{len(plan['backlog'])} gap(s) do not fit in the plan; top items:")
+        lines.append("")
+        for item in plan["backlog"][:10]:
+            lines.append(f"- {_label(item['framework'])}: {item['control']} ({item['status']}, {item['effort']}d)")
+    else:
+        lines.append("- Empty.")
+    return "\n".join(lines) + "\n"
+
+
 def write_markdown_report(path: str | Path, data: Dict[str, Any]) -> Path:
     out = Path(path)
     out.write_text(render_markdown_report(data), encoding="utf-8")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+DEFAULT_POLICY: Dict[str, Any] = {
+    "call_timeout": 30.0,
+    "deadline": 120.0,
+    "retries": 2,
+    "backoff": 0.2,
+    "hedge": False,
+    "hedge_after": 2.0,
+    "hedge_min_samples": 20,
+    "breaker_threshold": 3,
+    "breaker_cooldown": 30.0,
+}
+
+_policy: Dict[str, Any] = dict(DEFAULT_POLICY)
+
+
+def configure(**overrides: Any) -> None:
+    """Override transport policy values for this process (unknown keys are rejected)."""
+    unknown = set(overrides) - set(DEFAULT_POLICY)
+    if unknown:
+        raise ValueError(f"Unknown transport policy keys: {', '.join(sorted(unknown))}")
+    _policy.update(overrides)
+
+
+def reset() -> None:
+    _policy.clear()
+    _policy.update(DEFAULT_POLICY)
+    LATENCY.clear()
+    _BREAKERS.clear()
+    for key in STATS:
+        STATS[key] = 0
+    begin_command()
+
+
+def begin_command() -> None:
+    """Start accounting for one CLI command; report() then covers only calls made since.
+
+    LATENCY (hedging) and the circuit breakers keep their process-wide history, which
+    the daemon carries from one command to the next.
+    """
+    _command_start.update(STATS)
+    COMMAND_LATENCY.clear()
+
+
+def command_stats() -> Dict[str, int]:
+    return {key: value - _command_start.get(key, 0) for key, value in STATS.items()}
+
+
+def record_latency(tool_name: str, seconds: float) -> None:
+    LATENCY.record(tool_name, seconds)
+    COMMAND_LATENCY.record(tool_name, seconds)
+
+
+def policy() -> Dict[str, Any]:
+    return _policy
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    idx = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[idx]
+
+
+class LatencyTracker:
+    """Keep a sliding window of call durations per tool."""
+
+    def __init__(self, window: int = 512) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tool_name: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(tool_name, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, tool_name: str, pct: float, min_samples: int = 1) -> Optional[float]:
+        with self._lock:
+            samples = list(self._samples.get(tool_name, ()))
+        if len(samples) < max(1, min_samples):
+            return None
+        return _percentile(sorted(samples), pct)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            snapshot = {tool: sorted(samples) for tool, samples in self._samples.items() if samples}
+        return {
+            tool: {
+                "count": len(values),
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "p99": _percentile(values, 99),
+                "max": values[-1],
+            }
+            for tool, values in sorted(snapshot.items())
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+class CircuitBreaker:
+    """Open after `threshold` consecutive failures; allow one probe after `cooldown` seconds."""
+
+    def __init__(self, threshold: int, cooldown: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold or self.opened_at is not None:
+            self.opened_at = self.clock()
+
+
+LATENCY = LatencyTracker()
+# Calls of the current command only (see begin_command).
+COMMAND_LATENCY = LatencyTracker()
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+STATS: Dict[str, int] = {"calls": 0, "retries": 0, "timeouts": 0, "hedges": 0, "fallbacks": 0}
+_command_start: Dict[str, int] = dict(STATS)
+
+
+def breaker_for(key: str) -> CircuitBreaker:
+    breaker = _BREAKERS.get(key)
+    if breaker is None:
+        breaker = CircuitBreaker(_policy["breaker_threshold"], _policy["breaker_cooldown"])
+        _BREAKERS[key] = breaker
+    return breaker
+
+
+def hedge_delay(tool_name: str) -> Optional[float]:
+    """Seconds to wait before hedging a call, or None when hedging is off."""
+    if not _policy["hedge"]:
+        return None
+    p95 = LATENCY.percentile(tool_name, 95, min_samples=_policy["hedge_min_samples"])
+    return p95 if p95 is not None else _policy["hedge_after"]
+
+
+def report() -> Dict[str, Any]:
+    """Latency, counters and breaker states for the current command."""
+    return {
+        "latency": COMMAND_LATENCY.summary(),
+        "stats": command_stats(),
+        "breakers": {key: breaker.state for key, breaker in _BREAKERS.items()},
+    }
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+STATUS_WEIGHTS = {"implemented": 0, "partial": 5, "missing": 10}
+# Position of each status in [implemented, partial, missing] count lists.
+STATUS_SLOTS = {"implemented": 0, "partial": 1, "missing": 2}
+RISK_THRESHOLDS = (25, 50, 75)
+RISK_LEVELS = ("low", "medium", "high", "critical")
+
+
+def weighted_risk(implemented: int, partial: int, missing: int) -> float:
+    """Weighted risk percentage: partial controls count half, missing ones in full."""
+    total = implemented + partial + missing
+    if total == 0:
+        return 0.0
+    return ((partial * 5) + (missing * 10)) / (total * 10) * 100
+
+
+def risk_level(risk_score: float) -> str:
+    for threshold, level in zip(RISK_THRESHOLDS, RISK_LEVELS):
+        if risk_score < threshold:
+            return level
+    return RISK_LEVELS[-1]
+
+
+def score_controls(controls: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Local equivalent of the MCP calculate_risk_score tool."""
+    counts = {"implemented": 0, "partial": 0, "missing": 0}
+    for item in controls:
+        status = str(item.get("status", "missing")).lower()
+        counts[status if status in counts else "missing"] += 1
+    risk = round(weighted_risk(counts["implemented"], counts["partial"], counts["missing"]), 2)
+    return {
+        "risk_score": risk,
+        "risk_level": risk_level(risk),
+        "controls_total": len(controls),
+        **counts,
+    }
+
+
+def domain_rollup(counts: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+    """Rows with risk per domain from {domain: [implemented, partial, missing]}, in insertion order."""
+    rows = []
+    for domain, (implemented, partial, missing) in counts.items():
+        risk = round(weighted_risk(implemented, partial, missing), 2)
+        rows.append(
+            {
+                "domain": domain,
+                "risk_score": risk,
+                "risk_level": risk_level(risk),
+                "implemented": implemented,
+                "partial": partial,
+                "missing": missing,
+                "controls_total": implemented + partial + missing,
+            }
+        )
+    return rows
+
+
+def _numpy(use_numpy: Optional[bool]) -> Any:
+    """Return the numpy module when it should be used (optional dependency)."""
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise RuntimeError("Vectorized scoring requires optional dependency: numpy")
+        return None
+    return numpy
+
+
+def _score_counts_numpy(np: Any, counts: Any) -> Dict[str, List[Any]]:
+    matrix = np.asarray(counts, dtype=np.int64).reshape(-1, 3)
+    implemented, partial, missing = matrix[:, 0], matrix[:, 1], matrix[:, 2]
+    total = implemented + partial + missing
+    # Same operation order as weighted_risk, so the float64 results are bit-identical.
+    numerator = (partial * 5 + missing * 10).astype(np.float64)
+    denominator = (total * 10).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = np.where(total == 0, 0.0, numerator / np.where(total == 0, 1.0, denominator) * 100)
+
+    scores = np.round(raw, 2)
+    # numpy rounds via x*100, which can differ from round() right at a half; redo those in Python.
+    scaled = raw * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for idx in np.flatnonzero(near_half):
+        scores[idx] = round(float(raw[idx]), 2)
+
+    levels = np.asarray(RISK_LEVELS)[np.searchsorted(np.asarray(RISK_THRESHOLDS), scores, side="right")]
+    return {"risk_score": scores.tolist(), "risk_level": levels.tolist()}
+
+
+def score_counts_batch(counts: Any, use_numpy: Optional[bool] = None) -> Dict[str, List[Any]]:
+    """Score many (implemented, partial, missing) rows at once.
+
+    Results match score_controls row by row. Uses one vectorized numpy pass when
+    numpy is installed (or use_numpy=True), else a plain loop.
+    """
+    np = _numpy(use_numpy)
+    if np is not None:
+        return _score_counts_numpy(np, counts)
+    scores = [round(weighted_risk(int(i), int(p), int(m)), 2) for i, p, m in counts]
+    return {"risk_score": scores, "risk_level": [risk_level(score) for score in scores]}
+
+
+def status_counts(codes: Sequence[int]) -> tuple:
+    """(implemented, partial, missing) from int8 status codes (2/1/0; -1 is ignored)."""
+    if hasattr(codes, "count"):
+        return codes.count(2), codes.count(1), codes.count(0)
+    values = list(codes)
+    return values.count(2), values.count(1), values.count(0)
+
+
+def score_status_arrays(arrays: Sequence[Sequence[int]], use_numpy: Optional[bool] = None) -> Dict[str, List[Any]]:
+    """Score many per-control status arrays (e.g. AssessmentFrame views' codes) at once."""
+    np = _numpy(use_numpy)
+    if np is None or not arrays:
+        return score_counts_batch([status_counts(codes) for codes in arrays], use_numpy=False)
+
+    lengths = np.fromiter((len(codes) for codes in arrays), dtype=np.int64, count=len(arrays))
+    flat = np.concatenate([np.asarray(codes, dtype=np.int8) for codes in arrays]).astype(np.int64)
+    rows = np.repeat(np.arange(len(arrays)), lengths)
+    # Bucket 0 collects absent controls (-1); 1..3 are missing, partial, implemented.
+    buckets = np.bincount(rows * 4 + flat + 1, minlength=len(arrays) * 4).reshape(-1, 4)
+    return _score_counts_numpy(np, buckets[:, [3, 2, 1]])
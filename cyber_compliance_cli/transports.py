@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import inspect
+from abc import ABC, abstractmethod
+from importlib.metadata import entry_points
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional
+
+ENTRY_POINT_GROUP = "cyber_compliance_cli.transports"
+
+
+class Transport(ABC):
+    """How the client reaches cyber-compliance-mcp tools.
+
+    Plugins subclass SessionTransport (implement open_session(); calls share the
+    client's timeout/retry/breaker policy) or DirectTransport (implement call()), and
+    register it (or a factory) under the `cyber_compliance_cli.transports` entry point
+    group. A class missing a method is rejected when it is registered or built.
+    """
+
+    name = ""
+    uses_sessions = True
+
+    @abstractmethod
+    def open_session(self, server_command: str) -> AsyncContextManager[Any]:
+        """Open an MCP client session (with call_tool) to server_command."""
+
+    @abstractmethod
+    async def call(self, tool_name: str, arguments: Dict[str, Any], server_command: str) -> Dict[str, Any]:
+        """Call one tool directly and return its decoded result."""
+
+
+class SessionTransport(Transport):
+    """Tools are called on sessions from open_session()."""
+
+    uses_sessions = True
+
+    async def call(self, tool_name: str, arguments: Dict[str, Any], server_command: str) -> Dict[str, Any]:
+        raise TypeError(f"{type(self).__name__} calls tools through open_session()")
+
+
+class DirectTransport(Transport):
+    """Tools are called one by one through call(), without sessions."""
+
+    uses_sessions = False
+
+    def open_session(self, server_command: str) -> AsyncContextManager[Any]:
+        raise TypeError(f"{type(self).__name__} has no sessions; use call()")
+
+
+_FACTORIES: Dict[str, Callable[[], Transport]] = {}
+_RESOLVED: Dict[str, Transport] = {}
+_entry_points_loaded = False
+
+
+def _check_class(name: str, cls: type) -> None:
+    if not issubclass(cls, Transport):
+        raise TypeError(f"Transport {name!r} must subclass cyber_compliance_cli.transports.Transport")
+    if inspect.isabstract(cls):
+        missing = ", ".join(sorted(cls.__abstractmethods__))
+        raise TypeError(f"Transport {name!r} does not implement: {missing}")
+
+
+def register_transport(name: str, factory: Callable[[], Transport]) -> None:
+    """Register a Transport subclass (checked now) or a factory returning one (checked when built)."""
+    if isinstance(factory, type):
+        _check_class(name, factory)
+    _FACTORIES[name] = factory
+    _RESOLVED.pop(name, None)
+
+
+def _plugin_factory(entry_point: Any) -> Callable[[], Transport]:
+    def _factory() -> Transport:
+        obj = entry_point.load()
+        if isinstance(obj, type):
+            _check_class(entry_point.name, obj)
+        transport = obj if isinstance(obj, Transport) else obj()
+        if not transport.name:
+            transport.name = entry_point.name
+        return transport
+
+    return _factory
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return
+    for entry_point in found:
+        _FACTORIES.setdefault(entry_point.name, _plugin_factory(entry_point))
+
+
+def get_transport(name: str) -> Optional[Transport]:
+    """Return the transport registered under name, resolved once per process.
+
+    Raises TypeError when the registered factory does not build a complete Transport.
+    """
+    transport = _RESOLVED.get(name)
+    if transport is not None:
+        return transport
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        _load_entry_points()
+        factory = _FACTORIES.get(name)
+        if factory is None:
+            return None
+    transport = factory()
+    if not isinstance(transport, Transport):
+        raise TypeError(f"Transport {name!r} factory returned {type(transport).__name__}, not a Transport")
+    _RESOLVED[name] = transport
+    return transport
+
+
+def available_transports() -> List[str]:
+    _load_entry_points()
+    return sorted(_FACTORIES)
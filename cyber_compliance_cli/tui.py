@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set
 
+from rich.markup import escape
+from textual import events
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Footer, Header, Static
 
+from .mcp_client import MCPUnavailableError
+from .perf import PerfOverlay, mark_render
+
 
 class Card(Static):
-    def __init__(self, title: str, body: str, classes: str = ""):
-        super().__init__(f"[b]{title}[/b]\n{body}", classes=classes)
+    def __init__(self, title: str, body: str, classes: str = "", id: Optional[str] = None):
+        super().__init__(f"[b]{title}[/b]\n{body}", classes=classes, id=id)
+        self.card_title = title
+
+    def show(self, body: str, badge: Optional[str] = None) -> None:
+        self.update(f"[b]{self.card_title}[/b]\n{body}")
+        self.remove_class("ok", "warn", "bad")
+        if badge:
+            self.add_class(badge)
 
 
 def _badge(risk_level: str) -> str:
@@ -31,6 +43,43 @@ def _framework_label(framework_key: str) -> str:
     return labels.get(framework_key, framework_key)
 
 
+def _framework_body(item: Dict[str, Any]) -> str:
+    return (
+        f"Score: {item.get('risk_score', '?')}%\n"
+        f"Risk: {str(item.get('risk_level', 'unknown')).upper()}\n"
+        f"Implemented: {item.get('implemented', 0)}\n"
+        f"Partial: {item.get('partial', 0)}\n"
+        f"Missing: {item.get('missing', 0)}"
+    )
+
+
+# Heatmap cell backgrounds by domain risk level.
+HEAT = {"low": "#166534", "medium": "#a16207", "high": "#c2410c", "critical": "#b91c1c"}
+
+
+def _heatmap_body(domains: Dict[str, List[Dict[str, Any]]]) -> str:
+    """One line per framework: a cell per domain colored by its risk level."""
+    lines = []
+    for framework, rows in domains.items():
+        cells = " ".join(
+            f"[white on {HEAT.get(row['risk_level'], HEAT['critical'])}] {escape(row['domain'])} "
+            f"{row['risk_score']:.0f}% [/]"
+            for row in rows
+        )
+        lines.append(f"[b]{_framework_label(framework):<10}[/b] {cells}")
+    return "\n".join(lines) or "No domain breakdown available."
+
+
+def _actions_body(actions: List[str]) -> str:
+    if not actions:
+        return "No prioritized actions generated."
+    return "\n".join(f"{idx+1}) {action}" for idx, action in enumerate(actions))
+
+
+# Loads dashboard data, calling back with each framework summary as it arrives.
+Loader = Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]]
+
+
 class CyberComplianceApp(App):
     CSS = """
     Screen {
@@ -72,16 +121,36 @@ class CyberComplianceApp(App):
         ("r", "refresh", "Refresh"),
     ]
 
-    def __init__(self, data: Dict[str, Any], *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        *args: Any,
+        loader: Optional[Loader] = None,
+        frameworks: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        debug_perf: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Show data, or open with placeholder cards and fill them from loader in a background worker."""
         super().__init__(*args, **kwargs)
+        self.debug_perf = debug_perf
         self.data = data
+        self.loader = loader
+        self.frameworks = frameworks or [row.get("framework", "") for row in (data or {}).get("frameworks", [])]
+        self.source = source if source is not None else (data or {}).get("assessment_path")
+        self.load_error: Optional[str] = None
+        self.filled: Set[str] = set()
+        # Bumped by every load; callbacks from a superseded load worker are dropped.
+        self.generation = 0
+        # Per-framework domain rollups, in card order, for the heatmap.
+        self.domains: Dict[str, List[Dict[str, Any]]] = {}
 
     def compose(self) -> ComposeResult:
-        frameworks: List[Dict[str, Any]] = self.data.get("frameworks", [])
-        actions: List[str] = self.data.get("priority_actions", [])
-        source = self.data.get("assessment_path") or "(default: missing controls unless in assessment file)"
+        source = self.source or "(default: missing controls unless in assessment file)"
 
         yield Header(show_clock=True)
+        if self.debug_perf:
+            yield PerfOverlay()
         with Vertical(id="layout"):
             yield Static(
                 "[b cyan]Cyber Security Compliance Dashboard[/b cyan]\n"
@@ -90,30 +159,94 @@ class CyberComplianceApp(App):
             )
 
             # Render cards in rows of 2
-            for i in range(0, len(frameworks), 2):
-                pair = frameworks[i : i + 2]
+            for i in range(0, len(self.frameworks), 2):
                 with Horizontal():
-                    for item in pair:
-                        label = _framework_label(item.get("framework", ""))
-                        risk = item.get("risk_score", "?")
-                        level = str(item.get("risk_level", "unknown")).upper()
-                        body = (
-                            f"Score: {risk}%\n"
-                            f"Risk: {level}\n"
-                            f"Implemented: {item.get('implemented', 0)}\n"
-                            f"Partial: {item.get('partial', 0)}\n"
-                            f"Missing: {item.get('missing', 0)}"
-                        )
-                        yield Card(label, body, classes=f"card {_badge(item.get('risk_level', ''))}")
-
-            if actions:
-                action_lines = "\n".join(f"{idx+1}) {action}" for idx, action in enumerate(actions[:6]))
-            else:
-                action_lines = "No prioritized actions generated."
-
-            yield Card("Priority Actions", action_lines, classes="card")
+                    for framework in self.frameworks[i : i + 2]:
+                        yield Card(_framework_label(framework), "Loading…", classes="card", id=f"card-{framework}")
+
+            yield Card("Domain Heatmap", "Loading…", classes="card", id="domains")
+            yield Card("Priority Actions", "Waiting for all frameworks…", classes="card", id="actions")
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        if self.data is not None:
+            self._show_data(self.data)
+        elif self.loader is not None:
+            self._load()
+
+    async def on_event(self, event: events.Event) -> None:
+        if self.debug_perf and isinstance(event, events.Key):
+            mark_render(self)
+        await super().on_event(event)
+
+    def _mark(self) -> None:
+        if self.debug_perf:
+            mark_render(self)
+
+    def _show_framework(self, item: Dict[str, Any]) -> None:
+        self._mark()
+        framework = item.get("framework", "")
+        cards = self.query(f"#card-{framework}")
+        if cards:
+            cards.first(Card).show(_framework_body(item), _badge(item.get("risk_level", "")))
+            self.filled.add(framework)
+        if item.get("domains"):
+            self.domains[framework] = item["domains"]
+            ordered = {fw: self.domains[fw] for fw in self.frameworks if fw in self.domains}
+            self.query_one("#domains", Card).show(_heatmap_body(ordered))
+
+    def _show_data(self, data: Dict[str, Any]) -> None:
+        self._mark()
+        self.data = data
+        for item in data.get("frameworks", []):
+            self._show_framework(item)
+        if not self.domains:
+            self.query_one("#domains", Card).show(_heatmap_body({}))
+        self.query_one("#actions", Card).show(_actions_body(data.get("priority_actions", [])))
+
+    def _show_error(self, message: str) -> None:
+        self._mark()
+        self.load_error = message
+        for framework in self.frameworks:
+            if framework not in self.filled:
+                self.query_one(f"#card-{framework}", Card).show("Unavailable", "bad")
+        if not self.domains:
+            self.query_one("#domains", Card).show("Unavailable", "bad")
+        self.query_one("#actions", Card).show(f"MCP unavailable: {escape(message)}", "bad")
+
+    def _load(self) -> None:
+        self._mark()
+        self.load_error = None
+        self.filled.clear()
+        self.domains.clear()
+        for framework in self.frameworks:
+            self.query_one(f"#card-{framework}", Card).show("Loading…")
+        self.query_one("#domains", Card).show("Loading…")
+        self.query_one("#actions", Card).show("Waiting for all frameworks…")
+        self.generation += 1
+        generation = self.generation
+        # exclusive cancels the previous worker but cannot stop its thread mid-load.
+        self.run_worker(lambda: self._load_worker(generation), thread=True, exclusive=True, group="load")
+
+    def _if_current(self, generation: int, show: Callable[..., None], *args: Any) -> None:
+        if generation == self.generation:
+            show(*args)
+
+    def _load_worker(self, generation: int) -> None:
+        assert self.loader is not None
+
+        def post(show: Callable[..., None], *args: Any) -> None:
+            self.call_from_thread(self._if_current, generation, show, *args)
+
+        try:
+            data = self.loader(lambda item: post(self._show_framework, item))
+        except MCPUnavailableError as exc:
+            post(self._show_error, str(exc))
+            return
+        post(self._show_data, data)
+
     def action_refresh(self) -> None:
+        if self.loader is not None:
+            self._load()
         self.notify("Dashboard refreshed", timeout=1.5)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .mapping import mapping_index
+from .mcp_client import SUPPORTED_FRAMEWORKS, VALID_STATUSES
+from .prioritization import build_status_index
+
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_POLL_INTERVAL = 1.0
+# How often a blocked watcher wakes up to check its stop event.
+_STOP_CHECK = 0.5
+
+# inotify(7) event masks; the parent directory is watched so atomic renames are seen.
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+@lru_cache(maxsize=None)
+def _mapped_controls(framework: str) -> Tuple[Tuple[str, str], ...]:
+    """Controls in other frameworks that the gap priorities of framework read (coverage)."""
+    return tuple(
+        sorted(
+            {
+                (fw, mapped)
+                for (src, _), edges in mapping_index().items()
+                if src == framework
+                for fw, mapped, _ in edges
+            }
+        )
+    )
+
+
+def _normalized(status: Any) -> str:
+    value = str(status).lower()
+    return value if value in VALID_STATUSES else "missing"
+
+
+def framework_hashes(assessment: Dict[str, Any], frameworks: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Content hash per framework over everything its summary depends on.
+
+    That is the framework's own statuses (normalized as summaries read them) plus whether
+    each mapped control elsewhere is still open, since open mapped controls raise gap priority.
+    """
+    fw_data = assessment.get("frameworks", {})
+    status_index = build_status_index(assessment)
+    hashes: Dict[str, str] = {}
+    for framework in frameworks if frameworks is not None else SUPPORTED_FRAMEWORKS:
+        data = fw_data.get(framework)
+        raw_statuses = data.get("statuses", {}) if isinstance(data, dict) else {}
+        statuses = {control: _normalized(status) for control, status in raw_statuses.items()}
+        open_mapped = [
+            status_index.get(fw, {}).get(mapped, "missing") != "implemented" for fw, mapped in _mapped_controls(framework)
+        ]
+        raw = json.dumps([statuses, open_mapped], sort_keys=True, separators=(",", ":"))
+        hashes[framework] = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashes
+
+
+def changed_frameworks(old: Dict[str, str], new: Dict[str, str]) -> List[str]:
+    return [framework for framework, digest in new.items() if old.get(framework) != digest]
+
+
+class _InotifySource:
+    """Linux inotify on the file's directory; raises OSError where unavailable."""
+
+    def __init__(self, path: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.name = os.fsencode(path.name)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(str(path.parent)), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, "inotify_add_watch failed")
+
+    def _names(self) -> Set[bytes]:
+        names: Set[bytes] = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset + _EVENT.size <= len(buf):
+                _, _, _, length = _EVENT.unpack_from(buf, offset)
+                start = offset + _EVENT.size
+                names.add(buf[start : start + length].rstrip(b"\0"))
+                offset = start + length
+
+    def wait(self, timeout: float) -> bool:
+        """True if the file changed within timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if readable and self.name in self._names():
+                return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PollSource:
+    """Portable fallback: compare (mtime, size, inode) every interval seconds."""
+
+    def __init__(self, path: Path, interval: float) -> None:
+        self.path = path
+        self.interval = interval
+        self.last = self._signature()
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            signature = self._signature()
+            if signature != self.last:
+                self.last = signature
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def watch_changes(
+    path: str | Path,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    stop: Optional[threading.Event] = None,
+    use_inotify: bool = True,
+) -> Iterator[None]:
+    """Yield once per burst of writes to path, after it has been quiet for debounce seconds.
+
+    Uses inotify where available and falls back to polling the file's stat.
+    """
+    target = Path(path).resolve()
+    source: Any = None
+    if use_inotify:
+        try:
+            source = _InotifySource(target)
+        except (OSError, AttributeError):
+            source = None
+    if source is None:
+        source = _PollSource(target, poll_interval)
+    try:
+        while stop is None or not stop.is_set():
+            if not source.wait(_STOP_CHECK):
+                continue
+            while source.wait(debounce):
+                pass
+            yield
+    finally:
+        source.close()
@@ -0,0 +1,202 @@
+"""What-if scoring: hypothetical status changes applied as deltas to per-framework counts.
+
+The baseline (per-control statuses and implemented/partial/missing counts of every
+checklist) is built once from a summarize_all result. A scenario then costs
+O(changes x mapping fan-out), so thousands can be scored per second.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .mapping import STATUS_RANK, ControlKey, Edge, cascaded_status, control_id, mapping_index
+from .mcp_client import VALID_STATUSES
+from .scoring import risk_level, weighted_risk
+
+# Exhaustive search is used while the number of change sets stays below this.
+EXHAUSTIVE_LIMIT = 20_000
+_COUNT_SLOT = {"implemented": 0, "partial": 1, "missing": 2}
+
+
+class WhatIf:
+    """Score hypothetical changes against one summarize_all result.
+
+    With propagate (the default), each change also upgrades mapped controls in other
+    frameworks one hop, exactly as `cybersec propagate` would.
+    """
+
+    def __init__(
+        self, data: Dict[str, Any], propagate: bool = True, index: Optional[Dict[ControlKey, List[Edge]]] = None
+    ) -> None:
+        self.status: Dict[ControlKey, str] = {}
+        self.names: Dict[ControlKey, str] = {}
+        self.counts: Dict[str, Tuple[int, int, int]] = {}
+        for framework, rows in data.get("framework_details", {}).items():
+            counts = [0, 0, 0]
+            for row in rows:
+                key = (framework, control_id(row["control"]))
+                status = row["status"] if row["status"] in VALID_STATUSES else "missing"
+                self.status[key] = status
+                self.names[key] = row["control"]
+                counts[_COUNT_SLOT[status]] += 1
+            self.counts[framework] = (counts[0], counts[1], counts[2])
+        self.index = (index if index is not None else mapping_index()) if propagate else {}
+        self.evaluated = 0
+
+    def baseline(self) -> Dict[str, float]:
+        return {fw: weighted_risk(*counts) for fw, counts in self.counts.items()}
+
+    def key(self, framework: str, control: str) -> Optional[ControlKey]:
+        """Checklist key for a control given by full name or id (None if not on the checklist)."""
+        key = (framework, control_id(control))
+        return key if key in self.status else None
+
+    def _effects(self, key: ControlKey, status: str) -> Iterable[Tuple[ControlKey, str]]:
+        for fw, cid, coverage in self.index.get(key, []):
+            if (fw, cid) in self.status:
+                yield (fw, cid), cascaded_status(status, coverage)
+
+    def resolve(self, changes: Iterable[Tuple[ControlKey, str]]) -> Dict[ControlKey, str]:
+        """Final status of every control a scenario touches (explicit changes win over cascades)."""
+        explicit: Dict[ControlKey, str] = {}
+        for key, status in changes:
+            explicit[key] = status if status in VALID_STATUSES else "missing"
+        final = dict(explicit)
+        for key, status in explicit.items():
+            for target, implied in self._effects(key, status):
+                if target in explicit:
+                    continue
+                # Cascades only upgrade, and the strongest one wins.
+                if STATUS_RANK[implied] > STATUS_RANK[final.get(target, self.status[target])]:
+                    final[target] = implied
+        return final
+
+    def _counts_after(self, final: Dict[ControlKey, str]) -> Dict[str, List[int]]:
+        counts = {fw: list(c) for fw, c in self.counts.items()}
+        for key, status in final.items():
+            before = self.status[key]
+            if status != before:
+                slots = counts[key[0]]
+                slots[_COUNT_SLOT[before]] -= 1
+                slots[_COUNT_SLOT[status]] += 1
+        return counts
+
+    def evaluate(self, changes: Iterable[Tuple[ControlKey, str]]) -> Dict[str, Any]:
+        """Per-framework scores before/after a scenario, and the total risk reduction."""
+        self.evaluated += 1
+        final = self.resolve(changes)
+        after = self._counts_after(final)
+        frameworks = []
+        for fw, counts in self.counts.items():
+            before_score = round(weighted_risk(*counts), 2)
+            after_score = round(weighted_risk(*after[fw]), 2)
+            frameworks.append(
+                {
+                    "framework": fw,
+                    "risk_before": before_score,
+                    "risk_after": after_score,
+                    "delta": round(after_score - before_score, 2),
+                    "level_before": risk_level(before_score),
+                    "level_after": risk_level(after_score),
+                    "implemented": after[fw][0],
+                    "partial": after[fw][1],
+                    "missing": after[fw][2],
+                }
+            )
+        changed = [
+            {"framework": key[0], "control": self.names[key], "from": self.status[key], "to": status}
+            for key, status in final.items()
+            if status != self.status[key]
+        ]
+        return {
+            "frameworks": frameworks,
+            "changes": changed,
+            "reduction": round(sum(-row["delta"] for row in frameworks), 2),
+        }
+
+    def _gain(self, state: Dict[ControlKey, int], key: ControlKey, target: str) -> float:
+        """Risk points removed by adding key -> target on top of state (upgrade-only search)."""
+        gain = 0.0
+        for touched, status in itertools.chain([(key, target)], self._effects(key, target)):
+            rank = STATUS_RANK[status]
+            current = state.get(touched, STATUS_RANK[self.status[touched]])
+            if rank > current:
+                counts = self.counts[touched[0]]
+                # weighted_risk is linear in the counts: one step of rank is 50 / total points.
+                gain += (rank - current) * 50 / sum(counts)
+        return gain
+
+    def _apply(self, state: Dict[ControlKey, int], key: ControlKey, target: str) -> None:
+        for touched, status in itertools.chain([(key, target)], self._effects(key, target)):
+            state[touched] = max(state.get(touched, STATUS_RANK[self.status[touched]]), STATUS_RANK[status])
+
+    def candidates(self, target: str = "implemented", frameworks: Optional[Iterable[str]] = None) -> List[ControlKey]:
+        allowed = set(frameworks) if frameworks else None
+        return [
+            key
+            for key, status in self.status.items()
+            if STATUS_RANK[status] < STATUS_RANK[target] and (allowed is None or key[0] in allowed)
+        ]
+
+    def search(
+        self,
+        budget: int,
+        target: str = "implemented",
+        frameworks: Optional[Iterable[str]] = None,
+        exhaustive_limit: int = EXHAUSTIVE_LIMIT,
+    ) -> Dict[str, Any]:
+        """Pick up to budget controls to set to target for the largest total risk reduction.
+
+        Every change set is scored when there are at most exhaustive_limit of them;
+        otherwise a lazy greedy search adds the best marginal control each round.
+        """
+        started = time.perf_counter()
+        evaluated_before = self.evaluated
+        pool = self.candidates(target, frameworks)
+        budget = min(budget, len(pool))
+        picks: List[ControlKey]
+        if budget and math.comb(len(pool), budget) <= exhaustive_limit:
+            method = "exhaustive"
+            best = max(
+                itertools.combinations(pool, budget),
+                key=lambda combo: self.evaluate((key, target) for key in combo)["reduction"],
+            )
+            picks = list(best)
+        else:
+            method = "greedy"
+            picks = self._greedy(pool, budget, target)
+        result = self.evaluate((key, target) for key in picks)
+        elapsed = time.perf_counter() - started
+        result.update(
+            method=method,
+            picks=[{"framework": key[0], "control": self.names[key], "from": self.status[key]} for key in picks],
+            scenarios=self.evaluated - evaluated_before,
+            seconds=elapsed,
+        )
+        return result
+
+    def _greedy(self, pool: List[ControlKey], budget: int, target: str) -> List[ControlKey]:
+        # Lazy greedy: a control's gain only shrinks as others are picked, so a stale heap
+        # entry that still tops the heap after being refreshed is the true best.
+        state: Dict[ControlKey, int] = {}
+        heap = [(-self._gain(state, key, target), i, key) for i, key in enumerate(pool)]
+        self.evaluated += len(heap)
+        heapq.heapify(heap)
+        picks: List[ControlKey] = []
+        # Round in which each heap entry's gain was computed.
+        fresh: Dict[ControlKey, int] = dict.fromkeys(pool, 0)
+        while heap and len(picks) < budget:
+            neg_gain, i, key = heapq.heappop(heap)
+            if fresh.get(key) == len(picks):
+                if -neg_gain <= 0:
+                    break
+                picks.append(key)
+                self._apply(state, key, target)
+                continue
+            fresh[key] = len(picks)
+            self.evaluated += 1
+            heapq.heappush(heap, (-self._gain(state, key, target), i, key))
+        return picks
@@ -0,0 +1,13 @@
+import pytest
+
+from cyber_compliance_cli import memo, resilience
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_CACHE_DIR", str(tmp_path / "cache"))
+    resilience.reset()
+    yield
+    resilience.reset()
+    # Into this test's cache dir, not the real one at interpreter exit.
+    memo.flush_stats()
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from mcp.types import CallToolResult, TextContent
+
+from cyber_compliance_cli import mcp_client
+
+
+class FakeSession:
+    """Answers MCP tool calls like cyber-compliance-mcp would, and counts them."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def call_tool(self, name, arguments):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if name == "generate_checklist":
+            payload = {"checklist": [{"control": "A"}, {"control": "B"}]}
+        elif name == "calculate_risk_score":
+            missing = sum(1 for c in arguments["controls"] if c["status"] == "missing")
+            payload = {"ok": True, "risk_score": missing * 50.0, "risk_level": "high", "missing": missing}
+        else:
+            payload = {"recommended_actions": [f"fix {g}" for g in arguments.get("gaps", [])]}
+        return CallToolResult(content=[TextContent(type="text", text=json.dumps(payload))])
+
+
+def test_summarize_all_async_shares_session_across_tasks(tmp_path):
+    path = tmp_path / "assessment.json"
+    path.write_text('{"frameworks":{"nist_csf":{"statuses":{"A":"implemented"}}}}', encoding="utf-8")
+    session = FakeSession()
+
+    async def main():
+        return await asyncio.gather(
+            *[mcp_client.summarize_all_async(str(path), transport="stdio", session=session) for _ in range(10)]
+        )
+
+    results = asyncio.run(main())
+    assert session.calls == 10 * 4 * 3
+    nist = results[0]["frameworks"][0]
+    assert nist["missing"] == 1
+    assert nist["actions"] == ["fix B"]
+    assert all(r == results[0] for r in results)
+
+
+def test_sync_wrapper_works_inside_running_loop(monkeypatch):
+    session = FakeSession()
+
+    @asynccontextmanager
+    async def fake_session(server_command):
+        yield session
+
+    monkeypatch.setattr(mcp_client, "_stdio_session", fake_session)
+
+    async def main():
+        return mcp_client.summarize_all(None, transport="stdio")
+
+    out = asyncio.run(main())
+    assert len(out["frameworks"]) == 4
+
+
+def test_list_requirement_frameworks_async_with_session():
+    class ListSession:
+        async def call_tool(self, name, arguments):
+            return CallToolResult(content=[TextContent(type="text", text='{"ok": true, "frameworks": ["nist_csf"]}')])
+
+    out = asyncio.run(mcp_client.list_requirement_frameworks_async(session=ListSession()))
+    assert out == ["nist_csf"]
+
+
+def test_decode_result_prefers_structured_content_and_joins_text_blocks():
+    payload = {"ok": True, "framework": "soc2", "requirements": [{"id": "CC6.1"}]}
+    text = json.dumps(payload)
+    chunked = CallToolResult(content=[TextContent(type="text", text=text[i : i + 7]) for i in range(0, len(text), 7)])
+    assert mcp_client._decode_result(chunked, "get_requirements") == {"framework": "soc2", "requirements": [{"id": "CC6.1"}]}
+
+    separate = CallToolResult(content=[TextContent(type="text", text='{"a": 1}'), TextContent(type="text", text='{"b": 2}')])
+    assert mcp_client._decode_result(separate, "t") == {"a": 1, "b": 2}
+
+    structured = CallToolResult(content=[TextContent(type="text", text="ignored")], structuredContent=payload)
+    assert mcp_client._decode_result(structured, "t")["framework"] == "soc2"
+    # FastMCP's wrapper around a string return value falls through to the text.
+    wrapped = CallToolResult(content=[TextContent(type="text", text=text)], structuredContent={"result": text})
+    assert mcp_client._decode_result(wrapped, "t")["requirements"] == [{"id": "CC6.1"}]
+
+
+def test_decode_result_errors_are_unavailable():
+    with pytest.raises(mcp_client.MCPUnavailableError, match="failed: t: boom"):
+        mcp_client._decode_result(CallToolResult(content=[TextContent(type="text", text="boom")], isError=True), "t")
+    with pytest.raises(mcp_client.MCPUnavailableError, match="malformed JSON"):
+        mcp_client._decode_result(CallToolResult(content=[TextContent(type="text", text="{not json")]), "t")
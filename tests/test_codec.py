@@ -0,0 +1,76 @@
+import gzip
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import codec
+from cyber_compliance_cli.main import app
+from cyber_compliance_cli.mcp_client import load_assessment, save_assessment
+
+DOC = {"organization": "Zürich AG", "frameworks": {"soc2": {"statuses": {"CC6.1": "implemented", "CC7.2": "partial"}}}}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    codec.set_json_backend(request.param)
+    yield request.param
+    codec.set_json_backend(None)
+
+
+@pytest.mark.parametrize("name", ["a.json", "a.min.json", "a.json.gz"])
+def test_round_trip_by_extension(tmp_path, backend, name):
+    path = tmp_path / name
+    save_assessment(path, DOC)
+    saved = {**DOC, "revision": 1}
+    assert load_assessment(path) == saved
+    raw = path.read_bytes()
+    if name.endswith(".gz"):
+        assert raw[:2] == b"\x1f\x8b"
+        raw = gzip.decompress(raw)
+    assert (b"\n  " in raw) == (name == "a.json")
+    assert json.loads(raw) == saved
+    assert [p.name for p in tmp_path.iterdir() if p.suffix != ".lock"] == [name]
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_iter_dumps_streams_with_the_stdlib_backend(monkeypatch, pretty):
+    codec.set_json_backend("json")
+    monkeypatch.setattr(codec, "CHUNK_SIZE", 64)
+    try:
+        pieces = list(codec.iter_dumps(DOC, pretty=pretty))
+        assert len(pieces) > 1
+        assert b"".join(pieces) == codec.dumps(DOC, pretty=pretty)
+    finally:
+        codec.set_json_backend(None)
+
+
+def test_zstd_round_trip_or_clear_error(tmp_path):
+    path = tmp_path / "a.json.zst"
+    try:
+        codec._zstd()
+    except RuntimeError as exc:
+        assert "zstandard" in str(exc)
+        with pytest.raises(RuntimeError):
+            save_assessment(path, DOC)
+        return
+    save_assessment(path, DOC)
+    assert load_assessment(path) == {**DOC, "revision": 1}
+
+
+def test_commands_read_compressed_files(tmp_path):
+    old = tmp_path / "q2.json.gz"
+    new = tmp_path / "q3.json"
+    save_assessment(old, {"frameworks": {"soc2": {"statuses": {"CC6.1": "missing"}}}})
+    save_assessment(new, DOC)
+    runner = CliRunner()
+    result = runner.invoke(app, ["diff", "--old-file", str(old), "--new-file", str(new)])
+    assert result.exit_code == 0 and "Improved: 2" in result.stdout
+    assert runner.invoke(app, ["validate-assessment", "--assessment-file", str(old)]).exit_code == 0
+
+
+def test_document_stem():
+    assert codec.document_stem("payments.min.json.gz") == "payments"
+    assert codec.document_stem("platform.json") == "platform"
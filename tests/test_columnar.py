@@ -0,0 +1,49 @@
+import pytest
+
+from cyber_compliance_cli import columnar
+from cyber_compliance_cli.columnar import build_columns, read_ccol, write_columnar
+
+
+def _summary(statuses):
+    return {
+        "frameworks": [{"framework": "nist_csf", "risk_score": 62.5, "risk_level": "high"}],
+        "framework_details": {
+            "nist_csf": [{"control": control, "status": status} for control, status in statuses.items()]
+        },
+    }
+
+
+def test_ccol_round_trip_is_dictionary_encoded(tmp_path):
+    units = [
+        ("payments", _summary({"GV.OV-01 Strategy": "implemented", "PR.AA-01 Identity": "missing"})),
+        ("platform", _summary({"GV.OV-01 Strategy": "partial"})),
+    ]
+    out = write_columnar(tmp_path / "a.ccol", build_columns(units))
+    cols = read_ccol(out)
+    assert list(cols) == list(columnar.COLUMNS)
+    assert cols["assessment"].decode() == ["payments", "payments", "platform"]
+    assert cols["control_id"].decode() == ["GV.OV-01", "PR.AA-01", "GV.OV-01"]
+    assert cols["domain"].decode() == ["Govern", "Protect", "Govern"]
+    assert cols["status"].values == ["implemented", "missing", "partial"]
+    assert list(cols["risk_score"]) == [62.5] * 3
+    assert cols["framework"].values == ["nist_csf"]
+
+
+def test_wide_dictionaries_use_wider_codes(tmp_path):
+    units = [("u", _summary({f"C{i}": "missing" for i in range(300)}))]
+    columns = build_columns(units)
+    assert columns["control"].typecode() == "H" and columns["status"].typecode() == "B"
+    assert read_ccol(write_columnar(tmp_path / "w.ccol", columns))["control"].decode()[-1] == "C299"
+
+
+def test_arrow_formats_need_pyarrow(tmp_path):
+    columns = build_columns([("u", _summary({"GV.OV-01": "missing"}))])
+    if columnar._pyarrow() is None:
+        with pytest.raises(RuntimeError, match="pyarrow"):
+            write_columnar(tmp_path / "a.parquet", columns)
+        assert columnar.default_format() == "ccol"
+        return
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(write_columnar(tmp_path / "a.parquet", columns))
+    assert table.column("domain").to_pylist() == ["Govern"]
@@ -0,0 +1,79 @@
+import copy
+import threading
+
+import pytest
+
+from cyber_compliance_cli.concurrency import LockTimeout, file_lock, merge_assessments
+from cyber_compliance_cli.io_csv import import_assessment_csv
+from cyber_compliance_cli.mcp_client import load_assessment, save_assessment, set_control_status, update_assessment
+
+
+def _doc(**statuses):
+    return {"frameworks": {"soc2": {"statuses": dict(statuses)}}}
+
+
+def test_merge_keeps_both_sides_and_reports_conflicts():
+    base = _doc(a="missing", b="missing", c="missing", d="missing")
+    ours = _doc(a="implemented", b="missing", c="partial", d="missing", e="partial")
+    theirs = _doc(a="missing", b="implemented", c="implemented")
+    merged, conflicts = merge_assessments(base, ours, theirs)
+    assert merged == _doc(a="implemented", b="implemented", c="partial", e="partial")
+    assert conflicts == [
+        {"path": ["frameworks", "soc2", "statuses", "c"], "base": "missing", "ours": "partial", "theirs": "implemented"}
+    ]
+
+
+def test_save_with_stale_base_merges_instead_of_overwriting(tmp_path):
+    path = tmp_path / "assessment.json"
+    first = save_assessment(path, _doc(a="missing", b="missing"))
+    assert first["revision"] == 1 and not first["merged"]
+
+    base = load_assessment(path)
+    mine = copy.deepcopy(base)
+    set_control_status(mine, "soc2", "a", "implemented")
+    other = copy.deepcopy(base)
+    set_control_status(other, "soc2", "b", "partial")
+    save_assessment(path, other, base=base)
+
+    saved = save_assessment(path, mine, base=base)
+    assert saved["merged"] and saved["conflicts"] == [] and saved["revision"] == 3
+    assert load_assessment(path)["frameworks"]["soc2"]["statuses"] == {"a": "implemented", "b": "partial"}
+
+
+def test_save_from_a_normalized_base_keeps_everything(tmp_path):
+    path = tmp_path / "assessment.json"
+    path.write_text('{"organization": "Acme", "revision": 4}', encoding="utf-8")
+    # load_assessment adds "frameworks", so base differs from the bytes on disk; the merge is a no-op.
+    base = load_assessment(path)
+    mine = copy.deepcopy(base)
+    set_control_status(mine, "soc2", "a", "implemented")
+    saved = save_assessment(path, mine, base=base)
+    assert saved["conflicts"] == [] and saved["revision"] == 5
+    assert load_assessment(path) == {**mine, "revision": 5}
+
+
+def test_concurrent_updates_lose_nothing(tmp_path):
+    path = tmp_path / "assessment.json"
+    save_assessment(path, _doc())
+
+    def writer(n):
+        for i in range(10):
+            update_assessment(path, lambda a: set_control_status(a, "soc2", f"w{n}-{i}", "implemented"))
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    data = load_assessment(path)
+    assert len(data["frameworks"]["soc2"]["statuses"]) == 40 and data["revision"] == 41
+
+
+def test_writer_gives_up_when_lock_is_held(tmp_path):
+    path = tmp_path / "assessment.json"
+    csv_file = tmp_path / "in.csv"
+    csv_file.write_text("framework,control,status\nsoc2,a,implemented\n", encoding="utf-8")
+    with file_lock(path):
+        with pytest.raises(LockTimeout):
+            save_assessment(path, _doc(), timeout=0.1)
+    assert import_assessment_csv(str(csv_file), str(path))["frameworks"]["soc2"]["statuses"] == {"a": "implemented"}
@@ -0,0 +1,85 @@
+import os
+import threading
+from pathlib import Path
+
+from cyber_compliance_cli.client import forward, send_request
+from cyber_compliance_cli.daemon import DaemonServer, _Handler, run_forwarded
+
+
+def test_run_forwarded_captures_output_and_exit_code(tmp_path: Path):
+    (tmp_path / "assessment.json").write_text('{"frameworks":{"nist_csf":{"statuses":{"A":"weird"}}}}', encoding="utf-8")
+
+    out = run_forwarded(["validate-assessment", "--assessment-file", "assessment.json"], cwd=str(tmp_path))
+    assert out["handled"] is True
+    assert out["exit_code"] == 1
+    assert "invalid status" in out["stdout"]
+
+    assert run_forwarded(["dashboard"], cwd=str(tmp_path)) == {"handled": False}
+
+
+def test_run_forwarded_reports_command_errors_instead_of_falling_back(tmp_path: Path, monkeypatch):
+    from cyber_compliance_cli import main
+
+    calls = []
+
+    def broken(*args, **kwargs):
+        calls.append(args)
+        raise ValueError("disk full")
+
+    monkeypatch.setattr(main, "summarize_all", broken)
+    out = run_forwarded(["report", "--output", "r.md"], cwd=str(tmp_path))
+    assert out["handled"] is True and out["exit_code"] == 1
+    assert "ValueError: disk full" in out["stderr"] and len(calls) == 1
+    # Usage errors happen before the command starts, so the client may re-run them.
+    assert run_forwarded(["score", "--bogus"], cwd=str(tmp_path)) == {"handled": False}
+
+
+def test_run_forwarded_applies_the_client_environment(tmp_path: Path, monkeypatch):
+    from cyber_compliance_cli.client import request_env
+
+    monkeypatch.setenv("CYBERSEC_SUMMARY_CACHE", "1")
+    env = {**request_env(), "CYBERSEC_OUTPUT": "json", "CYBERSEC_SUMMARY_CACHE": "0"}
+    out = run_forwarded(["score", "--framework", "x", "--missing", "2"], cwd=str(tmp_path), env=env)
+    assert '"risk_level": "critical"' in out["stdout"]
+    # Restored afterwards.
+    assert os.environ["CYBERSEC_SUMMARY_CACHE"] == "1" and "CYBERSEC_OUTPUT" not in os.environ
+
+    # A different PATH would reach a different MCP server build: run locally instead.
+    assert run_forwarded(["score", "--framework", "x"], cwd=str(tmp_path), env={**env, "PATH": "/elsewhere"}) == {
+        "handled": False
+    }
+
+
+def test_forwarded_commands_do_not_report_earlier_fallbacks(tmp_path: Path):
+    from cyber_compliance_cli import memo, resilience
+
+    resilience.STATS["fallbacks"] = 3
+    memo.STATS["hits"] = 5
+    out = run_forwarded(["--latency-report", "score", "--framework", "x", "--missing", "1"], cwd=str(tmp_path))
+    assert out["exit_code"] == 0
+    assert "circuit open" not in out["stdout"] + out["stderr"]
+    assert "Summary cache" not in out["stdout"] and "Fallbacks: 0" in out["stdout"]
+
+
+def test_daemon_round_trip_over_socket(tmp_path: Path):
+    sock = tmp_path / "d.sock"
+    server = DaemonServer(str(sock), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert send_request({"op": "ping"}, path=sock, timeout=5)["handled"] is True
+        out = send_request(
+            {"op": "run", "argv": ["score", "--framework", "x", "--missing", "2"], "cwd": str(tmp_path)},
+            path=sock,
+            timeout=5,
+        )
+        assert out["exit_code"] == 0
+        assert "CRITICAL" in out["stdout"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_forward_falls_back_without_daemon(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_SOCKET", str(tmp_path / "missing.sock"))
+    assert forward(["checklist", "--framework", "nist_csf"]) is None
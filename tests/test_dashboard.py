@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+from cyber_compliance_cli.mcp_client import MCPUnavailableError
+from cyber_compliance_cli.perf import PerfOverlay
+from cyber_compliance_cli.tui import Card, CyberComplianceApp
+
+FRAMEWORKS = ["nist_csf", "soc2"]
+
+
+def _text(app, selector):
+    return str(app.query_one(selector, Card).render())
+
+
+def test_dashboard_opens_with_placeholders_and_fills_cards_progressively():
+    release = threading.Event()
+
+    def loader(on_summary):
+        on_summary({"framework": "nist_csf", "risk_score": 40.0, "risk_level": "high", "missing": 2})
+        release.wait(5)
+        soc2 = {"framework": "soc2", "risk_score": 0.0, "risk_level": "low"}
+        on_summary(soc2)
+        return {"frameworks": [soc2], "priority_actions": ["Enable MFA"]}
+
+    app = CyberComplianceApp(loader=loader, frameworks=FRAMEWORKS, source="a.json")
+
+    async def run():
+        async with app.run_test() as pilot:
+            await pilot.pause(0.2)
+            assert "Score: 40.0%" in _text(app, "#card-nist_csf")
+            assert app.query_one("#card-nist_csf").has_class("warn")
+            assert "Loading" in _text(app, "#card-soc2")
+            assert "Waiting" in _text(app, "#actions")
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert "Risk: LOW" in _text(app, "#card-soc2")
+            assert "1) Enable MFA" in _text(app, "#actions")
+
+    asyncio.run(run())
+
+
+def test_dashboard_reports_unavailable_server():
+    def loader(on_summary):
+        on_summary({"framework": "nist_csf", "risk_level": "low"})
+        raise MCPUnavailableError("server down")
+
+    app = CyberComplianceApp(loader=loader, frameworks=FRAMEWORKS)
+
+    async def run():
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert "Unavailable" in _text(app, "#card-soc2")
+            assert "Risk: LOW" in _text(app, "#card-nist_csf")
+
+    asyncio.run(run())
+    assert app.load_error == "server down"
+
+
+def test_dashboard_escapes_markup_in_errors():
+    def loader(on_summary):
+        raise MCPUnavailableError("bad payload [/bold] at /srv/[x]")
+
+    app = CyberComplianceApp(loader=loader, frameworks=FRAMEWORKS)
+
+    async def run():
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert "bad payload [/bold] at /srv/[x]" in _text(app, "#actions")
+
+    asyncio.run(run())
+
+
+def test_refresh_drops_results_of_the_superseded_load():
+    release = threading.Event()
+    calls = []
+
+    def loader(on_summary):
+        calls.append(len(calls))
+        if len(calls) == 1:
+            release.wait(5)
+            stale = {"framework": "nist_csf", "risk_score": 90.0, "risk_level": "critical"}
+            on_summary(stale)
+            return {"frameworks": [stale], "priority_actions": ["Stale action"]}
+        fresh = {"framework": "nist_csf", "risk_score": 10.0, "risk_level": "low"}
+        on_summary(fresh)
+        return {"frameworks": [fresh], "priority_actions": ["Fresh action"]}
+
+    app = CyberComplianceApp(loader=loader, frameworks=FRAMEWORKS)
+
+    async def run():
+        async with app.run_test() as pilot:
+            await pilot.pause(0.1)
+            await pilot.press("r")
+            await pilot.pause(0.2)
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause(0.2)
+            assert "Score: 10.0%" in _text(app, "#card-nist_csf")
+            assert "Fresh action" in _text(app, "#actions")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_domain_heatmap_fills_as_frameworks_arrive():
+    domains = [
+        {"domain": "Protect", "risk_score": 20.0, "risk_level": "low"},
+        {"domain": "Detect", "risk_score": 80.0, "risk_level": "critical"},
+    ]
+    data = {"frameworks": [{"framework": "nist_csf", "risk_level": "high", "domains": domains}, {"framework": "soc2"}]}
+    app = CyberComplianceApp(data)
+
+    async def run():
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            text = _text(app, "#domains")
+            assert "NIST CSF" in text and "Protect 20%" in text and "Detect 80%" in text
+            assert "SOC 2" not in text
+
+    asyncio.run(run())
+    empty = CyberComplianceApp({"frameworks": [{"framework": "soc2"}]})
+
+    async def run_empty():
+        async with empty.run_test() as pilot:
+            await pilot.pause()
+            assert "No domain breakdown" in _text(empty, "#domains")
+
+    asyncio.run(run_empty())
+
+
+def test_debug_perf_overlay_shows_render_time_and_queue_depth():
+    data = {"frameworks": [{"framework": "soc2", "risk_level": "low"}], "priority_actions": []}
+    app = CyberComplianceApp(data, debug_perf=True)
+    assert not CyberComplianceApp(data).debug_perf
+
+    async def run():
+        async with app.run_test() as pilot:
+            await pilot.press("r")
+            await pilot.pause(0.1)
+            overlay = app.query_one(PerfOverlay)
+            assert overlay.samples
+            assert "render" in str(overlay.render()) and "queue" in str(overlay.render())
+
+    asyncio.run(run())
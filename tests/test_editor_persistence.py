@@ -1,6 +1,9 @@
+import asyncio
+import threading
 from pathlib import Path
 
-from cyber_compliance_cli.mcp_client import load_assessment, save_assessment, set_control_status
+from cyber_compliance_cli import editor
+from cyber_compliance_cli.mcp_client import load_assessment, save_assessment, set_control_status, update_assessment
 
 
 def test_editor_save_cycle_persistence(tmp_path: Path):
@@ -14,3 +17,192 @@ def test_editor_save_cycle_persistence(tmp_path: Path):
         loaded["frameworks"]["nist_csf"]["statuses"]["GV.OV-01 Governance strategy defined"]
         == "implemented"
     )
+
+
+def _fake_summary(calls, release=None):
+    def summarize_all(path, **kwargs):
+        if release is not None:
+            release.wait(5)
+        calls.append(path)
+        statuses = load_assessment(path)["frameworks"].get("nist_csf", {}).get("statuses", {})
+        rows = [{"control": c, "status": statuses.get(c, "missing")} for c in ("A", "B", "C")]
+        return {"frameworks": [{"framework": "nist_csf"}], "framework_details": {"nist_csf": rows}}
+
+    return summarize_all
+
+
+def test_editor_saves_in_background_and_coalesces(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    calls = []
+    release = threading.Event()
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(p))
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary(calls, release))
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            await pilot.press("1", "down", "2", "s", "s", "s")
+            await pilot.pause(editor.SAVE_DEBOUNCE + 0.2)
+            # The worker is stuck in summarize_all; keys are still handled.
+            await pilot.press("down", "3")
+            assert app.save_state == "saving"
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.save_state == "modified"
+            assert [row["status"] for row in app._controls()] == ["implemented", "partial", "missing"]
+
+    asyncio.run(run())
+    saved = load_assessment(str(p))["frameworks"]["nist_csf"]["statuses"]
+    assert saved == {"A": "implemented", "B": "partial"}
+    assert len(calls) == 1
+
+
+def test_editor_autosave_flushes_dirty_changes(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    calls = []
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary(calls))
+    app = editor.AssessmentEditorApp(str(p), autosave_interval=0.1)
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            await pilot.press("2")
+            await pilot.pause(0.6)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.save_state == "saved"
+
+    asyncio.run(run())
+    assert load_assessment(str(p))["frameworks"]["nist_csf"]["statuses"] == {"A": "partial"}
+
+
+def test_editor_save_merges_another_writers_changes(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    save_assessment(p, {"frameworks": {"nist_csf": {"statuses": {"A": "missing", "B": "missing"}}}})
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(p))
+    # Another writer saves while the editor session is open.
+    update_assessment(p, lambda a: set_control_status(a, "nist_csf", "B", "implemented"))
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            await pilot.press("1", "s")
+            await pilot.pause(editor.SAVE_DEBOUNCE + 0.2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.assessment["frameworks"]["nist_csf"]["statuses"]["B"] == "implemented"
+            assert [row["status"] for row in app._controls()] == ["implemented", "implemented", "missing"]
+
+    asyncio.run(run())
+    saved = load_assessment(str(p))
+    assert saved["frameworks"]["nist_csf"]["statuses"] == {"A": "implemented", "B": "implemented"}
+    assert saved["revision"] == 3
+
+
+def test_editor_save_keeps_edits_that_did_not_bump_the_revision(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    save_assessment(p, {"frameworks": {"nist_csf": {"statuses": {"A": "missing", "B": "missing"}}}})
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(p))
+    # A hand edit (or another tool) rewrites the file and leaves revision as it was.
+    p.write_text(
+        '{"revision": 1, "frameworks": {"nist_csf": {"statuses": {"A": "missing", "B": "partial"}}}}',
+        encoding="utf-8",
+    )
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            await pilot.press("1", "s")
+            await pilot.pause(editor.SAVE_DEBOUNCE + 0.2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.assessment["frameworks"]["nist_csf"]["statuses"]["B"] == "partial"
+
+    asyncio.run(run())
+    saved = load_assessment(str(p))
+    assert saved["frameworks"]["nist_csf"]["statuses"] == {"A": "implemented", "B": "partial"}
+    assert saved["revision"] == 2
+
+
+def test_editor_reports_unexpected_save_errors_and_can_save_again(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(p))
+
+    def broken_save(*args, **kwargs):
+        raise ValueError("unserializable value")
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            monkeypatch.setattr(editor, "save_assessment", broken_save)
+            await pilot.press("1", "s")
+            await pilot.pause(editor.SAVE_DEBOUNCE + 0.2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.save_state == "save failed: unserializable value"
+            assert not app.saving and app.dirty
+            assert any("unserializable value" in n.message for n in app._notifications)
+
+            monkeypatch.setattr(editor, "save_assessment", save_assessment)
+            await pilot.press("s")
+            await pilot.pause(editor.SAVE_DEBOUNCE + 0.2)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.save_state == "saved"
+
+    asyncio.run(run())
+    assert load_assessment(str(p))["frameworks"]["nist_csf"]["statuses"] == {"A": "implemented"}
+
+
+def test_editor_bulk_status_on_filter_and_selection_with_undo(tmp_path: Path, monkeypatch):
+    p = tmp_path / "assessment.json"
+    p.write_text('{"frameworks": {"nist_csf": {"statuses": {"B": "partial"}}}}', encoding="utf-8")
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(p))
+
+    def statuses():
+        return [row["status"] for row in app.data["framework_details"]["nist_csf"]]
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.query_one("#filter", editor.Input).value = "a"
+            await pilot.pause()
+            app.set_focus(None)
+            # Nothing selected: applies to every filtered control ("A" by name, "B" by its partial status).
+            await pilot.press("exclamation_mark")
+            assert statuses() == ["implemented", "implemented", "missing"]
+            assert len(app.journal) == 1
+
+            app.query_one("#filter", editor.Input).value = ""
+            await pilot.pause()
+            app.set_focus(None)
+            await pilot.press("down", "space", "space", "at")
+            assert statuses() == ["implemented", "partial", "partial"]
+            assert app.selected == set()
+
+            await pilot.press("u")
+            assert statuses() == ["implemented", "implemented", "missing"]
+            await pilot.press("u")
+            assert statuses() == ["missing", "partial", "missing"]
+            assert app.assessment["frameworks"]["nist_csf"]["statuses"] == {"B": "partial"}
+
+    asyncio.run(run())
+
+
+def test_editor_debug_perf_times_keypresses(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(editor, "summarize_all", _fake_summary([]))
+    app = editor.AssessmentEditorApp(str(tmp_path / "assessment.json"), debug_perf=True)
+
+    async def run():
+        async with app.run_test() as pilot:
+            app.set_focus(None)
+            await pilot.press("down", "down")
+            await pilot.pause(0.1)
+            assert len(app.query_one("#perf").samples) >= 2
+
+    asyncio.run(run())
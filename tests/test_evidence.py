@@ -0,0 +1,106 @@
+import hashlib
+import json
+
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import evidence
+from cyber_compliance_cli.assessment_schema import validate_assessment
+from cyber_compliance_cli.evidence import add_evidence, hash_file, object_path, verify_evidence
+from cyber_compliance_cli.main import app
+
+
+def test_hash_file_chunked_and_mmap_agree(tmp_path, monkeypatch):
+    data = bytes(range(256)) * 9000
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+    monkeypatch.setattr(evidence, "CHUNK_SIZE", 4096)
+    assert hash_file(path) == expected
+    monkeypatch.setattr(evidence, "MMAP_THRESHOLD", 1)
+    assert hash_file(path) == expected
+
+
+def test_verify_rehashes_only_changed_objects(tmp_path):
+    store = tmp_path / "store"
+    assessment = {"frameworks": {}}
+    for name in ("policy.pdf", "scan.txt"):
+        (tmp_path / name).write_text(f"evidence {name}", encoding="utf-8")
+        add_evidence(assessment, "nist_csf", "GV.OV-01", tmp_path / name, store)
+    # Same content attached twice is stored and referenced once.
+    add_evidence(assessment, "nist_csf", "GV.OV-01", tmp_path / "scan.txt", store)
+    assert len(assessment["frameworks"]["nist_csf"]["evidence"]["GV.OV-01"]) == 2
+    assert validate_assessment(assessment) == []
+
+    first = verify_evidence(assessment, store, workers=2)
+    assert first["counts"] == {"ok": 2, "missing": 0, "corrupt": 0, "invalid": 0, "unreadable": 0} and first["hashed"] == 2
+    again = verify_evidence(assessment, store)
+    assert again["hashed"] == 0 and again["cached"] == 2
+
+    refs = assessment["frameworks"]["nist_csf"]["evidence"]["GV.OV-01"]
+    tampered = object_path(store, refs[0]["sha256"])
+    tampered.chmod(0o644)
+    tampered.write_text("edited", encoding="utf-8")
+    object_path(store, refs[1]["sha256"]).unlink()
+    out = verify_evidence(assessment, store)
+    assert [r["status"] for r in out["results"]] == ["corrupt", "missing"]
+    assert out["hashed"] == 1
+
+
+def test_verify_reports_invalid_digests_without_touching_paths(tmp_path):
+    store = tmp_path / "store"
+    (tmp_path / "secret").write_text("outside the store", encoding="utf-8")
+    refs = [{"sha256": "../../secret", "name": "escape"}, {"sha256": None, "name": "blank"}]
+    out = verify_evidence({"frameworks": {"soc2": {"evidence": {"CC6.1": refs}}}}, store)
+    assert [r["status"] for r in out["results"]] == ["invalid", "invalid"]
+    assert out["counts"]["invalid"] == 2 and out["hashed"] == 0 and out["cached"] == 0
+
+
+def test_verify_reports_malformed_entries_as_invalid(tmp_path):
+    evidence = {
+        "CC6.1": "policy.pdf",
+        "CC6.2": {"sha256": "a" * 64},
+        "CC6.3": ["policy.pdf", {"sha256": ["a" * 64], "name": "listed"}],
+    }
+    out = verify_evidence({"frameworks": {"soc2": {"evidence": evidence}, "iso27001": {"evidence": []}}}, tmp_path)
+    assert [(r["control"], r["status"]) for r in out["results"]] == [
+        ("CC6.1", "invalid"),
+        ("CC6.2", "invalid"),
+        ("CC6.3", "invalid"),
+        ("CC6.3", "invalid"),
+    ]
+    assert out["counts"]["invalid"] == 4
+
+
+def test_verify_reports_unreadable_objects_and_does_not_cache_them(tmp_path):
+    store = tmp_path / "store"
+    digest = "b" * 64
+    object_path(store, digest).mkdir(parents=True)
+    assessment = {"frameworks": {"soc2": {"evidence": {"CC6.1": [{"sha256": digest, "name": "dir"}]}}}}
+    out = verify_evidence(assessment, store)
+    assert [r["status"] for r in out["results"]] == ["unreadable"]
+    assert verify_evidence(assessment, store)["hashed"] == 1
+
+
+def test_cli_attach_and_verify(tmp_path):
+    runner = CliRunner()
+    target = tmp_path / "assessment.json"
+    (tmp_path / "mfa.png").write_bytes(b"\x89PNG fake")
+    result = runner.invoke(
+        app,
+        ["add-evidence", "--framework", "soc2", "--control", "CC6.1", "--file", str(tmp_path / "mfa.png"),
+         "--assessment-file", str(target)],
+    )
+    assert result.exit_code == 0
+    ref = json.loads(target.read_text(encoding="utf-8"))["frameworks"]["soc2"]["evidence"]["CC6.1"][0]
+    assert (tmp_path / ".evidence" / "objects" / ref["sha256"][:2] / ref["sha256"][2:]).exists()
+
+    result = runner.invoke(app, ["verify-evidence", "--assessment-file", str(target)])
+    assert result.exit_code == 0 and "1 ok, 0 missing, 0 corrupt, 0 invalid" in result.stdout
+
+    (tmp_path / ".evidence" / "objects" / ref["sha256"][:2] / ref["sha256"][2:]).unlink()
+    assert runner.invoke(app, ["verify-evidence", "--assessment-file", str(target)]).exit_code == 1
+
+
+def test_validation_rejects_malformed_evidence():
+    errors = validate_assessment({"frameworks": {"soc2": {"evidence": {"CC6.1": [{"sha256": "abc"}]}}}})
+    assert errors == ["soc2.evidence[CC6.1] must be a list of {sha256, name, ...} references"]
@@ -0,0 +1,60 @@
+import json
+
+from cyber_compliance_cli.frame import AssessmentFrame, ControlIndex, load_frames
+
+DOC = {
+    "organization": "acme",
+    "frameworks": {
+        "nist_csf": {
+            "statuses": {
+                "GV.OV-01 Governance strategy defined": "implemented",
+                "PR.AA-01 Identity and access managed": "Partial",
+                "DE.CM-01 Continuous monitoring enabled": "missing",
+            },
+            "notes": {"GV.OV-01": "board approved"},
+        },
+        "soc2": {"statuses": {}},
+    },
+}
+
+
+def test_round_trip_preserves_json_format():
+    frame = AssessmentFrame.from_assessment(DOC)
+    out = frame.to_assessment()
+    assert out["organization"] == "acme"
+    assert out["frameworks"]["nist_csf"]["notes"] == {"GV.OV-01": "board approved"}
+    assert out["frameworks"]["nist_csf"]["statuses"]["PR.AA-01 Identity and access managed"] == "partial"
+    assert out["frameworks"]["soc2"] == {"statuses": {}}
+    assert json.loads(json.dumps(out)) == out
+
+
+def test_shared_index_interns_names_across_frames(tmp_path):
+    other = {"frameworks": {"nist_csf": {"statuses": {"ID.AM-01 Asset inventory maintained": "partial"}}}}
+    (tmp_path / "a.json").write_text(json.dumps(DOC), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps(other), encoding="utf-8")
+    index = ControlIndex()
+    frames = load_frames([tmp_path / "a.json", tmp_path / "b.json"], index)
+    a, b = frames[str(tmp_path / "a.json")], frames[str(tmp_path / "b.json")]
+    assert len(index) == 4
+    assert a.view("nist_csf").names is b.view("nist_csf").names
+    # a was loaded before the fourth control existed; it reads as absent, not missing.
+    assert a.get("nist_csf", "ID.AM-01 Asset inventory maintained") is None
+    assert len(a.view("nist_csf")) == 3
+    assert b.to_assessment() == other
+
+
+def test_views_count_and_filter_without_copies():
+    frame = AssessmentFrame.from_assessment(DOC)
+    view = frame.view("nist_csf")
+    assert view.counts() == {"missing": 1, "partial": 1, "implemented": 1}
+    assert list(view.controls("missing")) == ["DE.CM-01 Continuous monitoring enabled"]
+    frame.set("nist_csf", "DE.CM-01 Continuous monitoring enabled", "implemented")
+    assert view.count("implemented") == 2
+    with view.buffer() as raw:
+        assert raw.format == "b" and raw.tolist() == [2, 1, 2]
+
+
+def test_counts_over_checklist_treats_absent_as_missing():
+    frame = AssessmentFrame.from_assessment(DOC)
+    checklist = ["GV.OV-01 Governance strategy defined", "RS.RP-01 Incident response plan executed"]
+    assert frame.counts("nist_csf", checklist) == {"missing": 1, "partial": 0, "implemented": 1}
@@ -26,3 +26,12 @@ def test_markdown_report_render():
     })
     assert "# Cyber Compliance Report" in md
     assert "NIST CSF" in md
+
+
+def test_markdown_report_domain_heatmap():
+    row = {"framework": "nist_csf", "risk_level": "high", "risk_score": 70}
+    assert "Domain Heatmap" not in render_markdown_report({"frameworks": [row]})
+    domain = {"domain": "Detect", "risk_score": 75.0, "risk_level": "critical", "implemented": 0, "partial": 1, "missing": 1}
+    md = render_markdown_report({"frameworks": [{**row, "domains": [domain]}]})
+    assert "## Domain Heatmap" in md
+    assert "| NIST CSF | Detect | 75.0% | CRITICAL | 0 | 1 | 1 |" in md
@@ -0,0 +1,40 @@
+from cyber_compliance_cli.mapping import control_id, equivalent_controls, propagate_statuses
+
+
+def test_equivalents_are_bidirectional():
+    targets = {(r["framework"], r["control_id"]) for r in equivalent_controls("nist_csf", "ID.AM-01 Asset inventory maintained")}
+    assert ("iso27001", "A.5.9") in targets
+    back = {(r["framework"], r["control_id"]) for r in equivalent_controls("iso27001", "A.5.9")}
+    assert ("nist_csf", "ID.AM-01") in back
+
+
+def test_propagate_dry_run_leaves_assessment_untouched():
+    assessment = {"frameworks": {"nist_csf": {"statuses": {"ID.AM-01 Asset inventory maintained": "missing"}}}}
+    out = propagate_statuses(
+        assessment,
+        [{"framework": "nist_csf", "control": "ID.AM-01 Asset inventory maintained", "status": "implemented"}],
+        dry_run=True,
+    )
+    assert {row["framework"] for row in out["cascaded"]} == {"iso27001", "cis_v8", "soc2"}
+    soc2 = next(row for row in out["cascaded"] if row["framework"] == "soc2")
+    assert soc2["to"] == "partial"
+    assert assessment["frameworks"]["nist_csf"]["statuses"]["ID.AM-01 Asset inventory maintained"] == "missing"
+
+
+def test_propagate_reuses_existing_names_and_skips_downgrades():
+    assessment = {
+        "frameworks": {
+            "iso27001": {"statuses": {"A.5.9 Asset inventory": "implemented"}},
+            "cis_v8": {"statuses": {}},
+        }
+    }
+    out = propagate_statuses(
+        assessment,
+        [{"framework": "nist_csf", "control": "ID.AM-01 Asset inventory maintained", "status": "partial"}],
+    )
+    changed = {(row["framework"], control_id(row["control"])) for row in out["cascaded"]}
+    assert ("iso27001", "A.5.9") not in changed
+    assert assessment["frameworks"]["iso27001"]["statuses"] == {"A.5.9 Asset inventory": "implemented"}
+    assert assessment["frameworks"]["cis_v8"]["statuses"][
+        "1.1 Establish and maintain detailed enterprise asset inventory"
+    ] == "partial"
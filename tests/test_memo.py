@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import cache, mcp_client, memo
+from cyber_compliance_cli.cache import read_cache
+from cyber_compliance_cli.main import app
+from cyber_compliance_cli.mcp_client import save_assessment
+
+
+@pytest.fixture
+def server_source(tmp_path, monkeypatch):
+    """An uninstalled server checkout: the memo keys on its sources."""
+    package = tmp_path / "server" / "cyber_compliance_mcp"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("VERSION = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path / "server"))
+    monkeypatch.setattr(cache, "SIBLING_CHECKOUT", tmp_path / "no-checkout")
+    return package
+
+
+def _fake(called):
+    async def summarize(framework, assessment, org_type, *args):
+        called.append(framework)
+        statuses = assessment["frameworks"].get(framework, {}).get("statuses", {})
+        return {"framework": framework, "org_type": org_type, "actions": [], "priority_gaps": [], "controls": [statuses]}
+
+    return summarize
+
+
+def test_unchanged_frameworks_come_from_the_memo(monkeypatch, tmp_path, server_source):
+    called = []
+    monkeypatch.setattr(mcp_client, "_summarize_framework", _fake(called))
+    path = tmp_path / "a.json"
+    save_assessment(path, {"frameworks": {"soc2": {"statuses": {"CC6.1": "missing"}}}})
+
+    first = mcp_client.summarize_all(str(path))
+    assert called == mcp_client.SUPPORTED_FRAMEWORKS
+    called.clear()
+    assert mcp_client.summarize_all(str(path)) == first and called == []
+
+    # Same normalized statuses (and a bumped revision) still hit.
+    save_assessment(path, {"frameworks": {"soc2": {"statuses": {"CC6.1": "MISSING"}}}})
+    mcp_client.summarize_all(str(path))
+    assert called == []
+
+    save_assessment(path, {"frameworks": {"soc2": {"statuses": {"CC6.1": "partial"}}}})
+    second = mcp_client.summarize_all(str(path))
+    assert called == ["soc2"]
+    assert second["framework_details"]["soc2"] == [{"CC6.1": "partial"}]
+
+    called.clear()
+    mcp_client.summarize_all(str(path), org_type="bank")
+    assert called == mcp_client.SUPPORTED_FRAMEWORKS
+    totals = memo.stats()
+    assert (totals["hits"], totals["misses"]) == (11, 9)
+
+
+def test_unidentified_server_is_not_memoized(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "SIBLING_CHECKOUT", tmp_path / "no-checkout")
+    monkeypatch.setattr(cache, "_source_digest", lambda package: None)
+    called = []
+    monkeypatch.setattr(mcp_client, "_summarize_framework", _fake(called))
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+    assert called == mcp_client.SUPPORTED_FRAMEWORKS * 2
+    assert memo.stats()["entries"] == 0
+
+
+def test_editing_the_server_source_invalidates_the_memo(monkeypatch, tmp_path, server_source):
+    called = []
+    monkeypatch.setattr(mcp_client, "_summarize_framework", _fake(called))
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+    (server_source / "core.py").write_text("def generate_checklist(): ...\n", encoding="utf-8")
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+    assert called == mcp_client.SUPPORTED_FRAMEWORKS * 2
+
+
+def test_hit_counts_are_written_once_per_flush(monkeypatch, tmp_path, server_source):
+    monkeypatch.setattr(mcp_client, "_summarize_framework", _fake([]))
+    writes = []
+    monkeypatch.setattr(memo, "write_cache", lambda *args: writes.append(args) or cache.write_cache(*args))
+    for _ in range(3):
+        mcp_client.summarize_all(str(tmp_path / "a.json"))
+    assert writes == [] and read_cache(memo.STATS_CACHE, "totals") is None
+    assert (memo.stats()["hits"], memo.stats()["misses"]) == (8, 4)
+
+    memo.flush_stats()
+    assert len(writes) == 1
+    assert read_cache(memo.STATS_CACHE, "totals") == {"hits": 8, "misses": 4}
+    assert (memo.stats()["hits"], memo.stats()["misses"]) == (8, 4)
+
+
+def test_cache_stats_command(monkeypatch, tmp_path, server_source):
+    monkeypatch.setattr(mcp_client, "_summarize_framework", _fake([]))
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+    mcp_client.summarize_all(str(tmp_path / "a.json"))
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["--output-format", "json", "cache-stats"])
+    record = json.loads(result.stdout)["records"][0]
+    assert record["kind"] == "cache" and record["entries"] == 4
+    assert (record["hits"], record["misses"]) == (4, 4)
+
+    result = runner.invoke(app, ["cache-stats", "--clear"])
+    assert result.exit_code == 0 and "Cleared 4" in result.stdout
+    assert memo.stats()["entries"] == 0
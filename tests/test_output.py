@@ -0,0 +1,96 @@
+import json
+
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import output
+from cyber_compliance_cli.client import command_of
+from cyber_compliance_cli.main import app
+
+runner = CliRunner()
+
+
+def _run(*args):
+    result = runner.invoke(app, list(args))
+    output.set_mode("table")
+    return result
+
+
+def test_controls_ndjson_streams_one_record_per_line():
+    result = _run("--output-format", "ndjson", "controls", "--framework", "pci_dss", "--limit", "3", "--timeout", "1")
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines[0]["kind"] == "meta" and lines[0]["command"] == "controls" and lines[0]["schema_version"] == 1
+    assert [line["kind"] for line in lines[1:]] == ["control"] * 3
+    assert set(lines[1]) == {"kind", "framework", "id", "domain", "title"}
+
+
+def test_score_json_document():
+    result = _run("--output-format", "json", "score", "--framework", "x", "--implemented", "1", "--missing", "1")
+    assert result.exit_code == 0
+    doc = json.loads(result.stdout)
+    assert doc["command"] == "score"
+    assert doc["records"] == [
+        {
+            "kind": "score",
+            "framework": "x",
+            "risk_score": 50.0,
+            "risk_level": "high",
+            "implemented": 1,
+            "partial": 0,
+            "missing": 1,
+            "controls_total": 2,
+        }
+    ]
+
+
+def test_diff_json_lists_every_change(tmp_path):
+    old = tmp_path / "old.json"
+    new = tmp_path / "new.json"
+    old.write_text(json.dumps({"frameworks": {"soc2": {"statuses": {f"C{i}": "missing" for i in range(12)}}}}))
+    new.write_text(json.dumps({"frameworks": {"soc2": {"statuses": {f"C{i}": "implemented" for i in range(12)}}}}))
+    doc = json.loads(_run("--output-format", "json", "diff", "--old-file", str(old), "--new-file", str(new)).stdout)
+    assert doc["improved"] == 12 and len(doc["records"]) == 12
+    assert doc["records"][0]["direction"] == "improved"
+
+
+def test_errors_are_json_on_stderr_with_stable_exit_codes(tmp_path):
+    result = _run("--output-format", "ndjson", "validate-assessment", "--assessment-file", str(tmp_path / "nope.json"))
+    assert result.exit_code == output.EXIT_INVALID
+    assert result.stdout == ""
+    error = json.loads(result.stderr)
+    assert error["kind"] == "error" and error["code"] == 1 and error["command"] == "validate-assessment"
+    assert error["message"].startswith("File not found:")
+
+
+def test_command_of_skips_global_options():
+    assert command_of(["--output-format", "json", "--hedge", "controls", "--framework", "x"]) == "controls"
+    assert command_of(["--retries=3", "diff"]) == "diff"
+    assert command_of(["--output-format", "json"]) is None
+
+
+def test_global_output_format_is_distinct_from_file_outputs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = _run("report", "--output", "json")
+    assert result.exit_code == 2 and "-O/--output-format" in result.stderr
+    assert not (tmp_path / "json").exists()
+    assert _run("--output", "json", "score", "--framework", "x").exit_code == 2
+
+    target = tmp_path / "a.json"
+    doc = json.loads(_run("-Ojson", "init-assessment", "--output", str(target)).stdout)
+    assert doc["records"][0]["path"] == str(target)
+    assert command_of(["-Ojson", "init-assessment"]) == "init-assessment"
+    assert command_of(["-O", "json", "init-assessment"]) == "init-assessment"
+
+
+def test_file_commands_report_written_paths(tmp_path):
+    target = tmp_path / "assessment.json"
+    doc = json.loads(_run("--output-format", "json", "init-assessment", "--output", str(target)).stdout)
+    assert doc["records"] == [{"kind": "file", "path": str(target), "format": "json"}]
+    assert target.exists()
+
+
+def test_propagate_json_records_name_the_file(tmp_path):
+    path = tmp_path / "a.json"
+    result = _run("-O", "json", "propagate", "--assessment-file", str(path), "--set", "soc2:CC6.1=implemented")
+    doc = json.loads(result.stdout)
+    assert result.exit_code == 0 and doc["file"] == str(path) and doc["saved"] is True
@@ -0,0 +1,80 @@
+import json
+import time
+
+from cyber_compliance_cli.planning import collect_gaps, load_efforts, schedule, write_plan
+
+
+def _gap(control, risk_reduction, effort, status="missing", priority=1.0):
+    return {
+        "unit": "",
+        "framework": "nist_csf",
+        "control": control,
+        "status": status,
+        "domain": "Protect",
+        "effort": effort,
+        "risk_reduction": risk_reduction,
+        "priority": priority,
+    }
+
+
+def test_schedule_respects_capacity_and_maximizes_risk_reduction():
+    # Greedy by density would take A (4/2) then be stuck; B + C is worth more.
+    gaps = [_gap("A", 4.0, 2.0), _gap("B", 3.0, 1.5), _gap("C", 3.0, 1.5), _gap("D", 0.1, 10.0)]
+    plan = schedule(gaps, capacities=(3.0, 2.0, 0.0))
+    first, second, third = plan["windows"]
+    assert sorted(i["control"] for i in first["items"]) == ["B", "C"]
+    assert [i["control"] for i in second["items"]] == ["A"]
+    assert third["items"] == []
+    assert [i["control"] for i in plan["backlog"]] == ["D"]
+    assert all(w["effort"] <= w["capacity"] for w in plan["windows"])
+
+
+def test_schedule_packs_by_risk_reduction_not_priority():
+    # A is the top priority but closes little risk; B and C each cut more risk than A.
+    gaps = [_gap("A", 1.0, 2.0, priority=9.0), _gap("B", 5.0, 2.0, priority=2.0), _gap("C", 4.0, 2.0, priority=3.0)]
+    plan = schedule(gaps, capacities=(2.0, 2.0, 0.0))
+    first, second, _ = plan["windows"]
+    assert [i["control"] for i in first["items"]] == ["B"]
+    assert [i["control"] for i in second["items"]] == ["C"]
+    assert [i["control"] for i in plan["backlog"]] == ["A"]
+    assert first["risk_reduction"] == 5.0
+
+
+def test_schedule_breaks_risk_reduction_ties_by_priority():
+    gaps = [_gap("A", 2.0, 1.0, priority=1.0), _gap("B", 2.0, 1.0, priority=5.0)]
+    plan = schedule(gaps, capacities=(1.0, 0.0, 0.0))
+    assert [i["control"] for i in plan["windows"][0]["items"]] == ["B"]
+
+
+def test_collect_gaps_uses_effort_overrides(tmp_path):
+    data = {
+        "frameworks": [{"framework": "nist_csf", "controls_total": 2}],
+        "framework_details": {
+            "nist_csf": [
+                {"control": "PR.AA-01 Identity", "status": "partial"},
+                {"control": "ID.AM-01 Assets", "status": "implemented"},
+            ]
+        },
+    }
+    efforts_csv = tmp_path / "efforts.csv"
+    efforts_csv.write_text("framework,control,effort\nnist_csf,PR.AA-01,7\n", encoding="utf-8")
+    gaps = collect_gaps(data, unit="payments", efforts=load_efforts(str(efforts_csv)))
+    assert len(gaps) == 1
+    assert gaps[0]["effort"] == 7.0
+    assert gaps[0]["risk_reduction"] == 25.0
+    assert gaps[0]["unit"] == "payments"
+
+
+def test_write_plan_formats(tmp_path):
+    plan = schedule([_gap("A", 1.0, 1.0)])
+    assert "## Days 1-30" in write_plan(tmp_path / "p.md", plan, "md").read_text(encoding="utf-8")
+    assert write_plan(tmp_path / "p.csv", plan, "csv").read_text(encoding="utf-8").splitlines()[1].startswith("30,")
+    assert json.loads(write_plan(tmp_path / "p.json", plan, "json").read_text())["scheduled"] == 1
+
+
+def test_schedule_10k_gaps_is_fast():
+    gaps = [_gap(f"C{i}", (i * 7919) % 97 / 10 + 0.1, (i % 9 + 1) / 2) for i in range(10_000)]
+    started = time.perf_counter()
+    plan = schedule(gaps, capacities=(40.0, 60.0, 80.0))
+    assert time.perf_counter() - started < 1.0
+    assert plan["scheduled"] + len(plan["backlog"]) == 10_000
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from cyber_compliance_cli.mcp_client import summarize_all_async, summarize_framework_async
+from cyber_compliance_cli import prioritization
+from cyber_compliance_cli.prioritization import (
+    control_domain,
+    domain_index,
+    domain_of,
+    merge_weights,
+    rank_actions,
+    rank_gaps,
+    top_k,
+)
+
+
+def test_control_domain_uses_longest_prefix():
+    assert control_domain("nist_csf", "PR.AA-01 Identity and access managed") == ("Protect", 1.0)
+    assert control_domain("cis_v8", "11.1 Establish and maintain a data recovery process")[0] == "Data Recovery"
+    assert control_domain("cis_v8", "1.1 Establish asset inventory")[0] == "Asset Inventory"
+    assert control_domain("soc2", "ZZ9 Unknown") == ("Other", None)
+
+
+def test_domain_of_reads_the_precomputed_index():
+    assert domain_index("pci_dss")["8"] == "Identity/Auth"
+    assert domain_of("nist_csf", "DE.CM-09 Computing hardware monitored") == "Detect"
+    # Ids outside the catalog are resolved once, then served from the index.
+    assert domain_index("nist_csf")["DE.CM-09"] == "Detect"
+    prioritization._DOMAIN_INDEX["nist_csf"]["DE.CM-09"] = "Sentinel"
+    try:
+        assert domain_of("nist_csf", "DE.CM-09") == "Sentinel"
+    finally:
+        del prioritization._DOMAIN_INDEX["nist_csf"]["DE.CM-09"]
+
+
+def test_rank_gaps_includes_partial_and_orders_by_priority():
+    controls = [
+        {"control": "GV.OV-01 Governance strategy defined", "status": "missing"},
+        {"control": "PR.AA-01 Identity and access managed", "status": "partial"},
+        {"control": "DE.CM-01 Continuous monitoring enabled", "status": "missing"},
+        {"control": "ID.AM-01 Asset inventory maintained", "status": "implemented"},
+    ]
+    gaps = rank_gaps("nist_csf", controls, top=3)
+    assert [g["control"].split()[0] for g in gaps] == ["DE.CM-01", "PR.AA-01", "GV.OV-01"]
+    assert gaps[1]["status"] == "partial"
+    assert len(rank_gaps("nist_csf", controls, top=1)) == 1
+
+
+def test_weights_change_the_ranking_and_reject_unknown_keys():
+    controls = [
+        {"control": "GV.OV-01 Governance strategy defined", "status": "missing"},
+        {"control": "DE.CM-01 Continuous monitoring enabled", "status": "missing"},
+    ]
+    weights = merge_weights({"domains": {"Govern": 5.0}})
+    assert rank_gaps("nist_csf", controls, top=1, weights=weights)[0]["domain"] == "Govern"
+    with pytest.raises(ValueError):
+        merge_weights({"bogus": 1})
+
+
+def test_coverage_ignores_mapped_controls_already_implemented():
+    controls = [{"control": "RS.RP-01 Incident response plan executed", "status": "missing"}]
+    open_gap = rank_gaps("nist_csf", controls)[0]
+    assessment = {"frameworks": {"soc2": {"statuses": {"CC7.4 Incident response": "implemented"}}}}
+    covered = rank_gaps("nist_csf", controls, assessment)[0]
+    assert covered["coverage"] == open_gap["coverage"] - 1.0
+
+
+def test_top_k_matches_full_sort():
+    items = [{"priority": (i * 37) % 101} for i in range(1000)]
+    assert top_k(items, 10) == sorted(items, key=lambda x: x["priority"], reverse=True)[:10]
+
+
+def test_rank_actions_follows_gap_priority():
+    summaries = [
+        {"actions": ["a1", "shared"], "priority_gaps": [{"priority": 1.0}, {"priority": 0.2}]},
+        {"actions": ["b1", "shared"], "priority_gaps": [{"priority": 0.9}, {"priority": 0.8}]},
+    ]
+    assert rank_actions(summaries, top=3) == ["a1", "b1", "shared"]
+
+
+def test_summarize_all_sends_only_top_gaps():
+    seen = []
+
+    class Session:
+        async def call_tool(self, name, arguments):
+            if name == "generate_checklist":
+                payload = {"checklist": [{"control": f"PR.AA-0{i} Control"} for i in range(1, 6)]}
+            elif name == "recommend_next_actions":
+                seen.append(arguments["gaps"])
+                payload = {"recommended_actions": [f"fix {g}" for g in arguments["gaps"]]}
+            else:
+                payload = {"risk_score": 100.0, "risk_level": "critical"}
+            return CallToolResult(content=[TextContent(type="text", text=json.dumps(payload))])
+
+    out = asyncio.run(summarize_all_async(None, transport="stdio", session=Session(), top=2))
+    assert all(len(gaps) == 2 for gaps in seen)
+    assert len(out["priority_actions"]) == 2
+    assert len(out["priority_gaps"]) == 2
+
+
+def test_summaries_roll_up_status_counts_by_domain():
+    class Session:
+        async def call_tool(self, name, arguments):
+            if name == "generate_checklist":
+                controls = ["PR.AA-01 Identity", "PR.DS-01 Data", "DE.CM-01 Monitoring"]
+                payload = {"checklist": [{"control": c} for c in controls] + [{"control": "X-1", "domain": "Custom"}]}
+            elif name == "recommend_next_actions":
+                payload = {"recommended_actions": []}
+            else:
+                payload = {"risk_score": 50.0, "risk_level": "medium"}
+            return CallToolResult(content=[TextContent(type="text", text=json.dumps(payload))])
+
+    assessment = {"frameworks": {"nist_csf": {"statuses": {"PR.AA-01 Identity": "implemented", "X-1": "partial"}}}}
+    out = asyncio.run(summarize_framework_async("nist_csf", assessment, transport="stdio", session=Session()))
+    domains = {row["domain"]: row for row in out["domains"]}
+    assert list(domains) == ["Protect", "Detect", "Custom"]
+    assert (domains["Protect"]["implemented"], domains["Protect"]["missing"]) == (1, 1)
+    assert domains["Protect"]["risk_score"] == 50.0 and domains["Protect"]["risk_level"] == "high"
+    assert domains["Custom"]["partial"] == 1 and domains["Detect"]["risk_level"] == "critical"
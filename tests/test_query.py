@@ -0,0 +1,87 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import main, query
+from cyber_compliance_cli.query import QueryIndex, parse_query
+
+
+def _write(path, statuses):
+    path.write_text(json.dumps({"frameworks": {fw: {"statuses": rows} for fw, rows in statuses.items()}}))
+    return path
+
+
+@pytest.fixture
+def units(tmp_path):
+    pay = _write(
+        tmp_path / "pay.json",
+        {
+            "nist_csf": {"PR.AA-01 Identity": "partial", "DE.CM-01 Monitoring": "Partial"},
+            "iso27001": {"A.5.15": "missing"},
+        },
+    )
+    retail = _write(tmp_path / "retail.json", {"nist_csf": {"DE.CM-01 Monitoring": "implemented"}})
+    return [str(pay), str(retail)]
+
+
+def test_parse_query_fields_and_errors():
+    assert parse_query('fw:nist_csf,SOC2 domain:"Access Control" PR.AA*') == {
+        "framework": ["nist_csf", "soc2"],
+        "domain": ["access control"],
+        "control": ["pr.aa*"],
+    }
+    for bad in ("owner:me", "status:done", "status:", 'domain:"open'):
+        with pytest.raises(ValueError):
+            parse_query(bad)
+
+
+def test_search_uses_postings_and_catalog_gaps(units):
+    index = QueryIndex(units)
+    rows = index.search("control:PR.AA-01 status:missing,partial")
+    # retail never assessed PR.AA-01, so the catalog entry counts as missing.
+    assert [(r["unit"], r["status"], r["assessed"]) for r in rows] == [
+        ("pay", "partial", True),
+        ("retail", "missing", False),
+    ]
+    assert [r["control"] for r in index.search("domain:detect status:partial")] == ["DE.CM-01 Monitoring"]
+    assert {r["unit"] for r in index.search("unit:ret* fw:nist_csf")} == {"retail"}
+    assert index.search("fw:iso27001 domain:organizational")[0]["control"] == "A.5.15"
+
+
+def test_indexes_are_cached_until_the_file_changes(units, monkeypatch):
+    assert QueryIndex(units).sources["built"] == 2
+    query._LOADED.clear()
+    monkeypatch.setattr(query, "load_assessment", lambda path: pytest.fail("re-parsed an unchanged file"))
+    assert QueryIndex(units).sources == {"memory": 0, "cache": 2, "built": 0}
+    assert QueryIndex(units).sources["memory"] == 2
+    monkeypatch.undo()
+
+    _write(Path(units[1]), {"nist_csf": {"PR.AA-01": "implemented"}})
+    st = os.stat(units[1])
+    os.utime(units[1], ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    index = QueryIndex(units)
+    assert index.sources["built"] == 1
+    assert index.search("unit:retail PR.AA-01")[0]["status"] == "implemented"
+
+
+def test_loaded_indexes_are_bounded_least_recently_used_first(units, monkeypatch):
+    query._LOADED.clear()
+    monkeypatch.setattr(query, "MAX_LOADED", 1)
+    pay, retail = units
+    query.load_index(pay)
+    query.load_index(retail)
+    assert list(query._LOADED) == [str(Path(retail).resolve())]
+    assert query.load_index(pay)[1] == "cache"
+    assert query.load_index(pay)[1] == "memory"
+    assert len(query._LOADED) == 1
+
+
+def test_query_command_records(units):
+    args = ["--output-format", "json", "query", "--where", "status:partial", "--assessment-file", units[0]]
+    doc = json.loads(CliRunner().invoke(main.app, [*args, "--assessment-file", units[1]]).stdout)
+    assert doc["matches"] == 2 and {r["kind"] for r in doc["records"]} == {"control"}
+    result = CliRunner().invoke(main.app, ["query", "--where", "owner:me", "--assessment-file", units[0]])
+    assert result.exit_code == 1 and "unknown field" in result.stdout
@@ -0,0 +1,92 @@
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from cyber_compliance_cli import mcp_client
+from cyber_compliance_cli.mcp_client import MCPUnavailableError, fetch_requirements
+
+ROWS = [{"id": f"C-{i}", "domain": "Protect", "title": f"Control {i}"} for i in range(10)]
+
+
+def _fake_stdio(calls):
+    async def fake(transport, server_command, framework, arguments, frameworks, timeout):
+        calls.append(frameworks)
+        listed = frameworks if frameworks is not None else ["nist_csf", "pci_dss"]
+        if framework not in listed:
+            return listed, None
+        return listed, {"framework": framework, "requirements": ROWS}
+
+    return fake
+
+
+def test_framework_list_cached_per_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_CACHE_DIR", str(tmp_path))
+    calls = []
+    monkeypatch.setattr(mcp_client, "_requirements_session", _fake_stdio(calls))
+
+    fetch_requirements("nist_csf", transport="stdio", server_command="fake-mcp")
+    fetch_requirements("nist_csf", transport="stdio", server_command="fake-mcp")
+
+    assert calls == [None, ["nist_csf", "pci_dss"]]
+
+
+def test_pagination_applies_offset_and_limit(tmp_path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(mcp_client, "_requirements_session", _fake_stdio([]))
+
+    out = fetch_requirements("nist_csf", offset=3, limit=4, transport="stdio", server_command="fake-mcp")
+    assert [r["id"] for r in out["requirements"]] == ["C-3", "C-4", "C-5", "C-6"]
+    assert out["total"] == 10
+
+    out = fetch_requirements("unknown", transport="stdio", server_command="fake-mcp")
+    assert out["supported"] is False
+
+
+def test_timeout_raises_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_CACHE_DIR", str(tmp_path))
+
+    @asynccontextmanager
+    async def hanging_session(server_command):
+        await anyio.sleep(10)
+        yield None
+
+    monkeypatch.setattr(mcp_client, "_stdio_session", hanging_session)
+
+    with pytest.raises(MCPUnavailableError) as ex:
+        fetch_requirements("nist_csf", transport="stdio", server_command="fake-mcp", timeout=0.05)
+    assert "timed out" in str(ex.value)
+
+
+def test_cached_framework_list_is_refreshed_on_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setenv("CYBERSEC_CACHE_DIR", str(tmp_path))
+    server = {"frameworks": ["nist_csf"]}
+    calls = []
+
+    @asynccontextmanager
+    async def session(server_command):
+        yield object()
+
+    async def call_tool(session, tool_name, arguments):
+        calls.append(tool_name)
+        if tool_name == "list_requirement_frameworks":
+            return {"frameworks": list(server["frameworks"])}
+        return {"framework": arguments["framework"], "requirements": ROWS}
+
+    monkeypatch.setattr(mcp_client, "_stdio_session", session)
+    monkeypatch.setattr(mcp_client, "_call_session_tool", call_tool)
+
+    assert fetch_requirements("nist_csf", transport="stdio", server_command="fake-mcp")["supported"]
+    server["frameworks"].append("pci_dss")
+    calls.clear()
+    out = fetch_requirements("pci_dss", transport="stdio", server_command="fake-mcp")
+    assert out["supported"] and out["frameworks"] == ["nist_csf", "pci_dss"]
+    assert calls == ["list_requirement_frameworks", "get_requirements"]
+
+    # The refreshed list was cached; a framework the server lacks is listed once per call.
+    calls.clear()
+    fetch_requirements("pci_dss", transport="stdio", server_command="fake-mcp")
+    assert calls == ["get_requirements"]
+    calls.clear()
+    assert not fetch_requirements("soc9", transport="stdio", server_command="fake-mcp")["supported"]
+    assert calls == ["list_requirement_frameworks"]
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from cyber_compliance_cli import mcp_client, resilience
+from cyber_compliance_cli.mcp_client import MCPUnavailableError
+from cyber_compliance_cli.resilience import CircuitBreaker, LatencyTracker
+
+
+def _result(payload):
+    return CallToolResult(content=[TextContent(type="text", text=json.dumps(payload))])
+
+
+class GoodSession:
+    async def call_tool(self, name, arguments):
+        return _result({"ok": True, "frameworks": ["nist_csf"], "requirements": [{"id": "X"}]})
+
+
+class BrokenSession:
+    async def call_tool(self, name, arguments):
+        raise ConnectionResetError("server crashed")
+
+
+class HangingSession:
+    async def call_tool(self, name, arguments):
+        await asyncio.sleep(10)
+
+
+@pytest.fixture
+def fresh_server(monkeypatch):
+    @asynccontextmanager
+    async def fake_session(server_command):
+        yield GoodSession()
+
+    monkeypatch.setattr(mcp_client, "_stdio_session", fake_session)
+
+
+def test_transient_failure_is_retried_on_fresh_connection(fresh_server):
+    resilience.configure(backoff=0)
+    out = asyncio.run(mcp_client.get_requirements_async("nist_csf", transport="stdio", session=BrokenSession()))
+    assert out["requirements"] == [{"id": "X"}]
+    assert resilience.STATS["retries"] == 1
+
+
+def test_tool_errors_are_not_retried():
+    class RejectingSession:
+        async def call_tool(self, name, arguments):
+            return _result({"ok": False, "error": {"code": "INVALID_FRAMEWORK", "message": "nope"}})
+
+    with pytest.raises(MCPUnavailableError):
+        asyncio.run(mcp_client.get_requirements_async("bad", transport="stdio", session=RejectingSession()))
+    assert resilience.STATS["retries"] == 0
+
+
+def test_timeout_opens_breaker_and_falls_back_to_local_score():
+    resilience.configure(call_timeout=0.05, retries=0, breaker_threshold=1)
+    controls = [{"control": "A", "status": "implemented"}, {"control": "B", "status": "missing"}]
+    out = asyncio.run(
+        mcp_client._call_tool("calculate_risk_score", {"controls": controls}, "stdio", "fake", HangingSession())
+    )
+    assert out["risk_score"] == 50.0
+    assert out["risk_level"] == "high"
+    assert resilience.STATS["timeouts"] == 1
+    assert resilience.STATS["fallbacks"] == 1
+    assert resilience.report()["breakers"]["stdio:fake"] == "open"
+
+
+def test_hedged_request_wins_over_hung_primary(fresh_server):
+    resilience.configure(hedge=True, hedge_after=0.05)
+    started = time.perf_counter()
+    out = asyncio.run(mcp_client.list_requirement_frameworks_async(transport="stdio", session=HangingSession()))
+    assert out == ["nist_csf"]
+    assert resilience.STATS["hedges"] == 1
+    assert time.perf_counter() - started < 2
+    assert resilience.report()["latency"]["list_requirement_frameworks"]["count"] == 1
+
+
+def test_circuit_breaker_half_opens_after_cooldown():
+    now = [0.0]
+    breaker = CircuitBreaker(threshold=2, cooldown=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 11
+    assert breaker.state == "half-open"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    now[0] = 22
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_latency_percentiles():
+    tracker = LatencyTracker()
+    for ms in range(1, 101):
+        tracker.record("t", ms / 1000)
+    row = tracker.summary()["t"]
+    assert row["count"] == 100
+    assert row["p50"] == 0.05
+    assert row["p95"] == 0.095
+    assert row["max"] == 0.1
+
+
+def test_report_covers_only_the_current_command():
+    resilience.STATS["fallbacks"] = 3
+    resilience.record_latency("generate_checklist", 0.5)
+    resilience.begin_command()
+    assert resilience.command_stats()["fallbacks"] == 0 and resilience.report()["latency"] == {}
+    resilience.record_latency("generate_checklist", 0.1)
+    assert resilience.report()["latency"]["generate_checklist"]["count"] == 1
+    # The process-wide window still feeds hedging.
+    assert resilience.LATENCY.percentile("generate_checklist", 50, min_samples=2) == 0.1
@@ -0,0 +1,42 @@
+import random
+from array import array
+
+import pytest
+
+from cyber_compliance_cli.frame import AssessmentFrame
+from cyber_compliance_cli.scoring import score_controls, score_counts_batch, score_status_arrays
+
+
+def _expected(rows):
+    out = [
+        score_controls(
+            [{"status": "implemented"}] * i + [{"status": "partial"}] * p + [{"status": "missing"}] * m
+        )
+        for i, p, m in rows
+    ]
+    return {"risk_score": [r["risk_score"] for r in out], "risk_level": [r["risk_level"] for r in out]}
+
+
+ROWS = [(i, p, m) for i in range(0, 13) for p in range(0, 13) for m in range(0, 13)]
+ROWS += [tuple(random.Random(seed).randint(0, 400) for _ in range(3)) for seed in range(300)]
+
+
+def test_pure_python_batch_matches_score_controls():
+    assert score_counts_batch(ROWS, use_numpy=False) == _expected(ROWS)
+
+
+def test_numpy_batch_matches_score_controls():
+    pytest.importorskip("numpy")
+    assert score_counts_batch(ROWS, use_numpy=True) == _expected(ROWS)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_status_arrays_ignore_absent_controls(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    frame = AssessmentFrame.from_assessment(
+        {"frameworks": {"nist_csf": {"statuses": {"A": "implemented", "B": "partial", "C": "missing"}}}}
+    )
+    arrays = [frame.view("nist_csf").codes, array("b", [-1, 0, 0, 2]), array("b")]
+    out = score_status_arrays(arrays, use_numpy=use_numpy)
+    assert out == _expected([(1, 1, 1), (1, 0, 2), (0, 0, 0)])
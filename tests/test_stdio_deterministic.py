@@ -1,8 +1,17 @@
+from contextlib import asynccontextmanager
+
 from cyber_compliance_cli import mcp_client
 
 
 def test_stdio_transport_deterministic(monkeypatch):
-    def fake_call(server_command, tool_name, arguments):
+    spawned = []
+
+    @asynccontextmanager
+    async def fake_session(server_command):
+        spawned.append(server_command)
+        yield object()
+
+    async def fake_call(session, tool_name, arguments):
         if tool_name == "generate_checklist":
             return {
                 "framework": arguments["framework"],
@@ -27,10 +36,12 @@ def test_stdio_transport_deterministic(monkeypatch):
             }
         raise AssertionError(f"Unexpected tool: {tool_name}")
 
-    monkeypatch.setattr(mcp_client.anyio, "run", lambda fn, *a, **k: fake_call(*a))
+    monkeypatch.setattr(mcp_client, "_stdio_session", fake_session)
+    monkeypatch.setattr(mcp_client, "_call_session_tool", fake_call)
 
     out = mcp_client.summarize_all(None, transport="stdio", server_command="cyber-compliance-mcp")
     assert len(out["frameworks"]) == 4
     first = out["frameworks"][0]
     assert first["controls_total"] == 2
     assert first["risk_level"] == "high"
+    assert spawned == ["cyber-compliance-mcp"]
@@ -0,0 +1,82 @@
+import asyncio
+import sys
+import types
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from cyber_compliance_cli import mcp_client, transports
+from cyber_compliance_cli.mcp_client import MCPUnavailableError
+from cyber_compliance_cli.transports import DirectTransport, SessionTransport, get_transport, register_transport
+
+
+def test_builtin_transports_are_resolved_once():
+    assert {"python", "stdio", "memory"} <= set(transports.available_transports())
+    assert get_transport("python") is get_transport("python")
+    assert get_transport("nope") is None
+
+
+def test_unknown_transport_is_unavailable():
+    with pytest.raises(MCPUnavailableError, match="Unsupported transport"):
+        mcp_client.list_requirement_frameworks(transport="carrier-pigeon")
+
+
+def test_registered_plugin_transport_is_used(monkeypatch):
+    class Canned(DirectTransport):
+        async def call(self, tool_name, arguments, server_command):
+            return {"ok": True, "frameworks": ["canned"]}
+
+    monkeypatch.setattr(transports, "_FACTORIES", dict(transports._FACTORIES))
+    monkeypatch.setattr(transports, "_RESOLVED", dict(transports._RESOLVED))
+    register_transport("canned", Canned)
+    assert mcp_client.list_requirement_frameworks(transport="canned") == ["canned"]
+
+
+def test_incomplete_transports_fail_when_registered_or_built(monkeypatch):
+    class NoSession(SessionTransport):
+        pass
+
+    monkeypatch.setattr(transports, "_FACTORIES", dict(transports._FACTORIES))
+    monkeypatch.setattr(transports, "_RESOLVED", dict(transports._RESOLVED))
+    with pytest.raises(TypeError, match="open_session"):
+        register_transport("half", NoSession)
+    register_transport("lazy", lambda: NoSession())
+    with pytest.raises(MCPUnavailableError, match="open_session"):
+        mcp_client.list_requirement_frameworks(transport="lazy")
+
+
+def test_python_transport_binds_arguments_by_name():
+    impl = mcp_client.PythonTransport()
+    impl._tools["generate_checklist"] = lambda framework, org_type="saas": {"ok": True, "checklist": [framework, org_type]}
+    out = asyncio.run(impl.call("generate_checklist", {"org_type": "bank", "framework": "soc2"}, ""))
+    assert out["checklist"] == ["soc2", "bank"]
+
+
+def test_import_failures_do_not_grow_sys_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(mcp_client, "_SIBLING_CHECKOUT", tmp_path)
+    before = len(sys.path)
+    for _ in range(3):
+        with pytest.raises(MCPUnavailableError):
+            mcp_client._import_mcp_module("no_such_mcp_module")
+    assert len(sys.path) == before + 1
+    sys.path.remove(str(tmp_path))
+
+
+def test_memory_transport_speaks_mcp_in_process(monkeypatch):
+    server = FastMCP("fake")
+
+    @server.tool()
+    def list_requirement_frameworks() -> dict:
+        return {"ok": True, "frameworks": ["nist_csf", "pci_dss"]}
+
+    module = types.ModuleType("fake_mcp_server")
+    module.server = server
+    monkeypatch.setitem(sys.modules, "fake_mcp_server", module)
+
+    async def main():
+        async with mcp_client.open_session("memory", "fake_mcp_server:server") as session:
+            return await mcp_client.list_requirement_frameworks_async(
+                transport="memory", server_command="fake_mcp_server:server", session=session
+            )
+
+    assert asyncio.run(main()) == ["nist_csf", "pci_dss"]
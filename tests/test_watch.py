@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+
+import pytest
+
+from cyber_compliance_cli import mcp_client
+from cyber_compliance_cli.watch import changed_frameworks, framework_hashes, watch_changes
+
+
+def _doc(nist):
+    return {"frameworks": {"nist_csf": {"statuses": nist}, "soc2": {"statuses": {"CC1.2 Board oversight": "partial"}}}}
+
+
+def test_hashes_change_only_for_affected_frameworks():
+    base = framework_hashes(_doc({"GV.OV-01 Governance strategy": "missing"}))
+    unmapped = framework_hashes(_doc({"GV.OV-01 Governance strategy": "missing", "ZZ.99 Custom": "partial"}))
+    assert changed_frameworks(base, unmapped) == ["nist_csf"]
+
+    # GV.OV-01 maps to iso27001 A.5.1 and soc2 CC1.2: closing it changes their gap priorities too.
+    closed = framework_hashes(_doc({"GV.OV-01 Governance strategy": "implemented"}))
+    assert set(changed_frameworks(base, closed)) == {"nist_csf", "iso27001", "soc2"}
+    assert framework_hashes(_doc({"GV.OV-01 Governance strategy": "missing"})) == base
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watch_debounces_bursts_of_writes(tmp_path, use_inotify):
+    target = tmp_path / "assessment.json"
+    target.write_text("{}", encoding="utf-8")
+    stop = threading.Event()
+    events = []
+
+    def consume():
+        for _ in watch_changes(target, debounce=0.3, poll_interval=0.05, stop=stop, use_inotify=use_inotify):
+            events.append(target.read_text(encoding="utf-8"))
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    for idx in range(5):
+        tmp = tmp_path / "assessment.json.tmp"
+        tmp.write_text(json.dumps({"n": idx}), encoding="utf-8")
+        tmp.replace(target)
+        time.sleep(0.06)
+    time.sleep(0.8)
+    stop.set()
+    thread.join(timeout=2)
+    assert events == ['{"n": 4}']
+
+
+def test_summarize_all_reuses_unchanged_frameworks(monkeypatch, tmp_path):
+    monkeypatch.setenv("CYBERSEC_SUMMARY_CACHE", "0")
+    called = []
+
+    async def fake(framework, *args):
+        called.append(framework)
+        return {"framework": framework, "actions": [], "priority_gaps": [], "controls": []}
+
+    monkeypatch.setattr(mcp_client, "_summarize_framework", fake)
+    first = mcp_client.summarize_all(str(tmp_path / "a.json"))
+    assert called == list(mcp_client.SUPPORTED_FRAMEWORKS)
+
+    called.clear()
+    reuse = {row["framework"]: row for row in first["frameworks"] if row["framework"] != "soc2"}
+    second = mcp_client.summarize_all(str(tmp_path / "a.json"), reuse=reuse)
+    assert called == ["soc2"]
+    assert [row["framework"] for row in second["frameworks"]] == list(mcp_client.SUPPORTED_FRAMEWORKS)
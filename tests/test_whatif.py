@@ -0,0 +1,78 @@
+import itertools
+import json
+import random
+
+from typer.testing import CliRunner
+
+from cyber_compliance_cli import main
+from cyber_compliance_cli.scoring import weighted_risk
+from cyber_compliance_cli.whatif import WhatIf
+
+INDEX = {
+    ("nist_csf", "PR.AA-01"): [("soc2", "CC6.1", 1.0), ("iso27001", "A.5.15", 0.5)],
+    ("soc2", "CC6.1"): [("nist_csf", "PR.AA-01", 1.0)],
+    ("iso27001", "A.5.15"): [("nist_csf", "PR.AA-01", 0.5)],
+}
+
+
+def _data(statuses):
+    details = {fw: [{"control": c, "status": s} for c, s in rows.items()] for fw, rows in statuses.items()}
+    return {"frameworks": [{"framework": fw} for fw in details], "framework_details": details}
+
+
+DATA = _data(
+    {
+        "nist_csf": {"PR.AA-01 Identity": "missing", "GV.OV-01 Strategy": "partial"},
+        "soc2": {"CC6.1 Logical access": "missing", "CC7.2 Monitoring": "implemented"},
+        "iso27001": {"A.5.15 Access control": "missing", "A.5.1 Policies": "missing"},
+    }
+)
+
+
+def test_evaluate_applies_deltas_and_cascades():
+    model = WhatIf(DATA, index=INDEX)
+    out = model.evaluate([(model.key("nist_csf", "PR.AA-01"), "implemented")])
+    scores = {row["framework"]: row for row in out["frameworks"]}
+    assert scores["nist_csf"]["risk_after"] == round(weighted_risk(1, 1, 0), 2)
+    assert scores["soc2"]["risk_after"] == 0.0
+    # Half coverage caps the cascade at partial.
+    assert scores["iso27001"]["risk_after"] == 75.0 and scores["iso27001"]["partial"] == 1
+    assert out["reduction"] == 125.0
+
+    # Explicit changes win over cascades; --no-propagate touches only the named control.
+    out = model.evaluate([(("nist_csf", "PR.AA-01"), "implemented"), (("soc2", "CC6.1"), "partial")])
+    assert {c["control"]: c["to"] for c in out["changes"]}["CC6.1 Logical access"] == "partial"
+    plain = WhatIf(DATA, propagate=False).evaluate([(("nist_csf", "PR.AA-01"), "implemented")])
+    assert len(plain["changes"]) == 1
+
+
+def test_greedy_search_matches_exhaustive_on_small_catalogs():
+    rng = random.Random(3)
+    controls = {fw: {f"{fw.upper()}-{i}": rng.choice(["missing", "partial"]) for i in range(6)} for fw in "abc"}
+    index = {}
+    for _ in range(8):
+        (fa, ca), (fb, cb) = rng.sample([(fw, c) for fw, rows in controls.items() for c in rows], 2)
+        coverage = rng.choice([0.5, 1.0])
+        index.setdefault((fa, ca), []).append((fb, cb, coverage))
+        index.setdefault((fb, cb), []).append((fa, ca, coverage))
+    model = WhatIf(_data(controls), index=index)
+    for budget in (1, 2, 3):
+        exhaustive = model.search(budget)
+        greedy = model.search(budget, exhaustive_limit=0)
+        assert exhaustive["method"] == "exhaustive" and greedy["method"] == "greedy"
+        # Lazy greedy is not guaranteed optimal with overlapping cascades, but stays close.
+        assert greedy["reduction"] >= 0.9 * exhaustive["reduction"]
+        best = max(
+            model.evaluate((key, "implemented") for key in combo)["reduction"]
+            for combo in itertools.combinations(model.candidates(), budget)
+        )
+        assert exhaustive["reduction"] == best
+
+
+def test_whatif_command_records(monkeypatch):
+    monkeypatch.setattr(main, "summarize_all", lambda *args, **kwargs: DATA)
+    result = CliRunner().invoke(main.app, ["--output-format", "json", "whatif", "--search", "1", "--no-propagate"])
+    doc = json.loads(result.stdout)
+    assert doc["method"] == "exhaustive" and doc["reduction"] == 50.0
+    changes = [r for r in doc["records"] if r["kind"] == "change"]
+    assert len(changes) == 1 and changes[0]["to"] == "implemented"